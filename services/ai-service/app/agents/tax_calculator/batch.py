@@ -0,0 +1,116 @@
+"""
+Batch FY 2025-26 calculation - bulk validation and compact per-row results
+Deterministic fast path for payroll-sized inputs; never calls the AI service
+"""
+import csv
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+
+from .calculator_fy2025 import TaxCalculationInput
+from .fixed_point import calculate_tax_with_engine
+from ...models.tax_models import TaxData
+
+# Column order of every compact result row
+BATCH_COLUMNS = (
+    "index",
+    "regime",
+    "taxable_income",
+    "tax_before_cess",
+    "cess",
+    "rebate_87a",
+    "final_tax",
+    "effective_rate"
+)
+
+def _validation_errors(error: ValidationError) -> List[Dict[str, str]]:
+    """JSON-safe summary of a pydantic validation error"""
+    return [
+        {"field": ".".join(str(part) for part in item["loc"]), "message": item["msg"]}
+        for item in error.errors()
+    ]
+
+def calculate_row(index: int, tax_data: TaxData, engine: str = "float") -> Tuple[Any, ...]:
+    """Compact result row (see BATCH_COLUMNS) for one validated record"""
+    result = calculate_tax_with_engine(TaxCalculationInput(
+        gross_income=tax_data.income,
+        age=tax_data.age,
+        regime=tax_data.regime,
+        is_salaried=tax_data.is_salaried,
+        deductions_80c=tax_data.deductions_80c,
+        health_insurance_premium=tax_data.health_insurance_premium,
+        financial_year=tax_data.financial_year
+    ), engine, include_breakdown=False)
+    return (
+        index,
+        result["regime"],
+        result["taxable_income"],
+        result["tax_before_cess"],
+        result["cess"],
+        result["rebate_87a"],
+        result["final_tax"],
+        round(result["effective_rate"], 4)
+    )
+
+def iter_batch_results(records: Iterable[Any],
+                       start: int = 0,
+                       engine: str = "float") -> Iterator[Tuple[Optional[Tuple[Any, ...]], Optional[Dict[str, Any]]]]:
+    """
+    Validate and calculate records one at a time
+    
+    Yields (row, None) for a calculated record or (None, error) for a rejected one,
+    so callers can stream results without holding them all in memory. Indexes
+    count from start (the position of the first record in a larger input);
+    engine is one of fixed_point.ENGINES.
+    """
+    for index, record in enumerate(records, start):
+        if not isinstance(record, dict):
+            yield None, {"index": index, "errors": [{"field": "", "message": "Record must be a JSON object"}]}
+            continue
+        
+        try:
+            tax_data = TaxData(**record)
+        except ValidationError as e:
+            yield None, {"index": index, "errors": _validation_errors(e)}
+            continue
+        
+        try:
+            yield calculate_row(index, tax_data, engine), None
+        except Exception as e:
+            yield None, {"index": index, "errors": [{"field": "", "message": f"Calculation failed: {e}"}]}
+
+# Payroll files: record streams for the bulk CLI and portfolio analytics
+INPUT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+def detect_format(path: str, explicit: Optional[str] = None) -> str:
+    """csv or jsonl, from the explicit choice or the file extension"""
+    if explicit:
+        return explicit
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in INPUT_FORMATS:
+        raise ValueError(f"Cannot infer the format of {path}; pass --input-format/--output-format")
+    return INPUT_FORMATS[extension]
+
+def parse_csv_records(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """CSV rows as records; values stay strings for TaxData to coerce and empty cells are omitted"""
+    for row in csv.DictReader(lines):
+        yield {key.strip(): value.strip() for key, value in row.items()
+               if key and value is not None and value.strip() != ""}
+
+def read_records(path: str, input_format: str) -> Iterator[Any]:
+    """Stream records one at a time"""
+    if input_format == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            yield from parse_csv_records(handle)
+        return
+    
+    with open(path, "rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                yield None  # reported as an invalid record, keeping indexes aligned
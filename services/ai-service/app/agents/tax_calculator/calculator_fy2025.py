@@ -2,8 +2,10 @@
 FY 2025-26 Tax Calculator - Union Budget 2025 Compliant
 Based on official tax law changes from your provided document
 """
-from typing import Dict, Any
-from dataclasses import dataclass
+from typing import Dict, Any, Optional
+from dataclasses import dataclass, fields
+
+from .rules import TaxRuleSet, age_category, rule_registry
 
 @dataclass
 class TaxCalculationInput:
@@ -13,160 +15,132 @@ class TaxCalculationInput:
     is_salaried: bool = True
     deductions_80c: float = 0
     health_insurance_premium: float = 0
+    financial_year: Optional[str] = None  # None = rule registry default (2025-26)
+
+@dataclass(frozen=True, slots=True)
+class CompactTaxResult:
+    """Numbers-only calculation result: no breakdown, labels or per-regime extras"""
+    regime: str
+    financial_year: str
+    gross_income: float
+    taxable_income: float
+    tax_before_cess: float
+    cess: float
+    tax_after_cess: float
+    rebate_87a: float
+    final_tax: float
+    effective_rate: float
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "CompactTaxResult":
+        return cls(*(result[name] for name in COMPACT_RESULT_FIELDS))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in COMPACT_RESULT_FIELDS}
+
+COMPACT_RESULT_FIELDS = tuple(field.name for field in fields(CompactTaxResult))
 
-def calculate_new_regime_tax_fy2025(calc_input: TaxCalculationInput) -> Dict[str, Any]:
+def calculate_new_regime_tax_fy2025(calc_input: TaxCalculationInput,
+                                    rules: Optional[TaxRuleSet] = None,
+                                    include_breakdown: bool = True) -> Dict[str, Any]:
     """Calculate tax using FY 2025-26 new regime - Budget 2025 compliant"""
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    regime = rules.new
     
-    # Standard deduction increased to ₹75,000
-    standard_deduction = 75000 if calc_input.is_salaried else 0
+    # Standard deduction (₹75,000 for FY 2025-26)
+    standard_deduction = regime.standard_deduction if calc_input.is_salaried else 0
     income_after_std_deduction = max(0, calc_input.gross_income - standard_deduction)
     
-    # Basic exemption increased from ₹3L to ₹4L
-    basic_exemption = 400000
+    # Basic exemption (₹4L for FY 2025-26)
+    basic_exemption = regime.basic_exemption_for(calc_input.age)
     taxable_income = max(0, income_after_std_deduction - basic_exemption)
     
-    # FY 2025-26 tax slabs (from your official document)
-    tax = 0
-    breakdown = []
-    
-    slabs = [
-        (400000, 0.05, "₹4L - ₹8L"),     # ₹4L-₹8L: 5%
-        (400000, 0.10, "₹8L - ₹12L"),   # ₹8L-₹12L: 10%
-        (400000, 0.15, "₹12L - ₹16L"),  # ₹12L-₹16L: 15%
-        (400000, 0.20, "₹16L - ₹20L"),  # ₹16L-₹20L: 20%
-        (400000, 0.25, "₹20L - ₹24L"),  # ₹20L-₹24L: 25% (NEW!)
-        (float('inf'), 0.30, "Above ₹24L") # Above ₹24L: 30%
-    ]
-    
-    remaining_income = taxable_income
-    
-    for slab_width, rate, description in slabs:
-        if remaining_income <= 0:
-            break
-        
-        slab_taxable = min(remaining_income, slab_width)
-        if slab_taxable > 0:
-            slab_tax = slab_taxable * rate
-            tax += slab_tax
-            
-            breakdown.append({
-                "slab": description,
-                "rate": f"{rate*100}%",
-                "taxable_amount": slab_taxable,
-                "tax": slab_tax
-            })
-            
-            remaining_income -= slab_taxable
-    
-    # Add 4% cess
-    tax_with_cess = tax * 1.04
-    
-    # Section 87A rebate increased to ₹60,000 (up to ₹12L income)
+    # Slab tax from the compiled table
+    tax = regime.table.tax(taxable_income)
+    
+    # Add health & education cess
+    tax_with_cess = tax * rules.cess_multiplier
+    
+    # Section 87A rebate (₹60,000 up to ₹12L income for FY 2025-26)
     rebate_87a = 0
-    if income_after_std_deduction <= 1200000:
-        rebate_87a = min(tax_with_cess, 60000)  # Max ₹60,000 rebate
+    if income_after_std_deduction <= regime.rebate_income_limit:
+        rebate_87a = min(tax_with_cess, regime.rebate_max)
     
     final_tax = max(0, tax_with_cess - rebate_87a)
     
-    return {
+    result = {
         "gross_income": calc_input.gross_income,
         "standard_deduction": standard_deduction,
         "basic_exemption": basic_exemption,
         "taxable_income": taxable_income,
         "tax_before_cess": tax,
-        "cess": tax * 0.04,
+        "cess": tax * rules.cess_rate,
         "tax_after_cess": tax_with_cess,
         "rebate_87a": rebate_87a,
         "final_tax": final_tax,
         "effective_rate": (final_tax / calc_input.gross_income * 100) if calc_input.gross_income > 0 else 0,
-        "breakdown": breakdown,
         "regime": "new",
-        "financial_year": "2025-26",
-        "compliance_status": "Budget 2025 Compliant"
+        "financial_year": rules.financial_year,
+        "compliance_status": rules.compliance_status
     }
+    if include_breakdown:
+        result["breakdown"] = regime.table.breakdown(taxable_income)
+    return result
 
-def calculate_old_regime_tax_fy2025(calc_input: TaxCalculationInput) -> Dict[str, Any]:
+def calculate_old_regime_tax_fy2025(calc_input: TaxCalculationInput,
+                                    rules: Optional[TaxRuleSet] = None,
+                                    include_breakdown: bool = True) -> Dict[str, Any]:
     """Calculate tax using old regime with age-based exemptions"""
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    regime = rules.old
     
     # Age-based exemption limits
-    if calc_input.age >= 80:
-        basic_exemption = 500000  # Super senior citizens
-    elif calc_input.age >= 60:
-        basic_exemption = 300000  # Senior citizens
-    else:
-        basic_exemption = 250000  # Below 60 years
+    basic_exemption = regime.basic_exemption_for(calc_input.age)
     
     # Calculate deductions
     total_deductions = calc_input.deductions_80c + calc_input.health_insurance_premium
+    standard_deduction = regime.standard_deduction if calc_input.is_salaried else 0
     
     # Calculate taxable income
-    income_after_deductions = max(0, calc_input.gross_income - total_deductions)
+    income_after_deductions = max(0, calc_input.gross_income - standard_deduction - total_deductions)
     taxable_income = max(0, income_after_deductions - basic_exemption)
     
     # Old regime slabs
-    tax = 0
-    breakdown = []
-    
-    if taxable_income > 0:
-        # ₹0 - ₹2.5L: 5%
-        slab1 = min(taxable_income, 250000)
-        if slab1 > 0:
-            tax1 = slab1 * 0.05
-            tax += tax1
-            breakdown.append({
-                "slab": "₹2.5L - ₹5L",
-                "rate": "5%",
-                "taxable_amount": slab1,
-                "tax": tax1
-            })
-    
-    if taxable_income > 250000:
-        # ₹2.5L - ₹10L: 20%
-        slab2 = min(taxable_income - 250000, 750000)
-        tax2 = slab2 * 0.20
-        tax += tax2
-        breakdown.append({
-            "slab": "₹5L - ₹10L", 
-            "rate": "20%",
-            "taxable_amount": slab2,
-            "tax": tax2
-        })
-    
-    if taxable_income > 1000000:
-        # Above ₹10L: 30%
-        slab3 = taxable_income - 1000000
-        tax3 = slab3 * 0.30
-        tax += tax3
-        breakdown.append({
-            "slab": "Above ₹10L",
-            "rate": "30%",
-            "taxable_amount": slab3,
-            "tax": tax3
-        })
-    
-    # Add 4% cess
-    tax_with_cess = tax * 1.04
+    tax = regime.table.tax(taxable_income)
+    
+    # Add health & education cess
+    tax_with_cess = tax * rules.cess_multiplier
     
     # Section 87A rebate (old regime)
     rebate_87a = 0
-    if income_after_deductions <= 500000:
-        rebate_87a = min(tax_with_cess, 12500)  # Max ₹12,500
+    if income_after_deductions <= regime.rebate_income_limit:
+        rebate_87a = min(tax_with_cess, regime.rebate_max)
     
     final_tax = max(0, tax_with_cess - rebate_87a)
     
-    return {
+    result = {
         "gross_income": calc_input.gross_income,
         "total_deductions": total_deductions,
         "basic_exemption": basic_exemption,
         "taxable_income": taxable_income,
         "tax_before_cess": tax,
-        "cess": tax * 0.04,
+        "cess": tax * rules.cess_rate,
         "tax_after_cess": tax_with_cess,
         "rebate_87a": rebate_87a,
         "final_tax": final_tax,
         "effective_rate": (final_tax / calc_input.gross_income * 100) if calc_input.gross_income > 0 else 0,
-        "breakdown": breakdown,
         "regime": "old",
-        "financial_year": "2025-26",
-        "age_category": "super_senior" if calc_input.age >= 80 else "senior" if calc_input.age >= 60 else "regular"
+        "financial_year": rules.financial_year,
+        "age_category": age_category(calc_input.age)
     }
+    if include_breakdown:
+        result["breakdown"] = regime.table.breakdown(taxable_income)
+    return result
+
+def calculate_tax_fy2025(calc_input: TaxCalculationInput,
+                         rules: Optional[TaxRuleSet] = None,
+                         include_breakdown: bool = True) -> Dict[str, Any]:
+    """Calculate tax under the regime named in the input; the slab breakdown is optional"""
+    if calc_input.regime.lower() == "new":
+        return calculate_new_regime_tax_fy2025(calc_input, rules, include_breakdown)
+    return calculate_old_regime_tax_fy2025(calc_input, rules, include_breakdown)
@@ -0,0 +1,105 @@
+"""
+Deduction Optimizer - tax-minimizing 80C / health premium allocation for FY 2025-26
+
+Old regime tax is non-increasing and piecewise linear in the total deduction,
+so the minimum is reached at the caps. The smallest investment that already
+reaches that minimum (e.g. when the 87A rebate zeroes the tax earlier) comes
+from the same slab/rebate breakpoint solve used for the regime breakeven.
+"""
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Optional
+
+from .calculator_fy2025 import (
+    TaxCalculationInput,
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025
+)
+from .regime_comparison import breakeven_deductions
+from .rules import TaxRuleSet, rule_registry
+
+@dataclass
+class DeductionOptimizationInput:
+    gross_income: float
+    age: int
+    is_salaried: bool = True
+    max_80c: float = 150000  # Most the taxpayer can invest under 80C
+    max_health_insurance_premium: float = 25000  # Most the taxpayer can pay under 80D
+    financial_year: Optional[str] = None
+
+def _allocate(total: float, cap_80c: float, cap_health: float) -> Dict[str, float]:
+    """Split a total deduction: 80C first, the remainder to the health premium"""
+    deductions_80c = min(total, cap_80c)
+    health_insurance_premium = min(total - deductions_80c, cap_health)
+    return {
+        "deductions_80c": deductions_80c,
+        "health_insurance_premium": health_insurance_premium,
+        "total": deductions_80c + health_insurance_premium
+    }
+
+def optimize_deductions_fy2025(opt_input: DeductionOptimizationInput,
+                               rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """Minimum-tax regime and deduction allocation within the taxpayer's caps"""
+    rules = rules or rule_registry.get(opt_input.financial_year)
+    
+    # Step 1: Caps, bounded by the statutory limits of the rule set
+    cap_80c = max(0, min(opt_input.max_80c, rules.deduction_limits.get("80C", opt_input.max_80c)))
+    cap_health = max(0, min(opt_input.max_health_insurance_premium,
+                            rules.deduction_limits.get("80D", opt_input.max_health_insurance_premium)))
+    cap_total = cap_80c + cap_health
+    
+    base_input = TaxCalculationInput(
+        gross_income=opt_input.gross_income,
+        age=opt_input.age,
+        regime="old",
+        is_salaried=opt_input.is_salaried,
+        financial_year=opt_input.financial_year
+    )
+    
+    # Step 2: New regime ignores deductions; old regime is lowest at the caps
+    new_tax = calculate_new_regime_tax_fy2025(base_input, rules)["final_tax"]
+    old_tax_without = calculate_old_regime_tax_fy2025(base_input, rules)["final_tax"]
+    old_tax_at_caps = calculate_old_regime_tax_fy2025(
+        replace(base_input, deductions_80c=cap_80c, health_insurance_premium=cap_health), rules
+    )["final_tax"]
+    
+    # Step 3: Smallest total deduction that already reaches the old regime minimum
+    needed = min(cap_total, breakeven_deductions(base_input, old_tax_at_caps, rules))
+    allocation = _allocate(needed, cap_80c, cap_health)
+    
+    # Step 4: Tax saved per extra rupee in whichever section still has statutory
+    # headroom beyond the optimum (0 when both sections are at their limits)
+    marginal_saving = 0
+    for section, field in (("80C", "deductions_80c"), ("80D", "health_insurance_premium")):
+        headroom = rules.deduction_limits.get(section, float("inf")) - allocation[field]
+        step = min(1.0, headroom)
+        if step <= 0:
+            continue
+        probe_deductions = {key: allocation[key] for key in ("deductions_80c", "health_insurance_premium")}
+        probe_deductions[field] += step
+        probe = replace(base_input, **probe_deductions)
+        saving = (old_tax_at_caps - calculate_old_regime_tax_fy2025(probe, rules)["final_tax"]) / step
+        marginal_saving = max(marginal_saving, saving)
+    
+    # Step 5: Pick the regime (a tie goes to the default new regime, which needs no investment)
+    if old_tax_at_caps < new_tax:
+        recommended_regime = "old"
+        minimum_tax = old_tax_at_caps
+    else:
+        recommended_regime = "new"
+        minimum_tax = new_tax
+        allocation = _allocate(0, cap_80c, cap_health)
+        marginal_saving = 0
+    
+    return {
+        "financial_year": rules.financial_year,
+        "recommended_regime": recommended_regime,
+        "minimum_tax": minimum_tax,
+        "allocation": allocation,
+        "caps": {"deductions_80c": cap_80c, "health_insurance_premium": cap_health},
+        "new_regime_tax": new_tax,
+        "old_regime_tax_without_deductions": old_tax_without,
+        "old_regime_tax_optimized": old_tax_at_caps,
+        "tax_saved_by_deductions": old_tax_without - old_tax_at_caps,
+        "savings_vs_other_regime": abs(new_tax - old_tax_at_caps),
+        "marginal_saving_per_rupee": marginal_saving
+    }
@@ -0,0 +1,268 @@
+"""
+Fixed-point FY 2025-26 tax engine - integer paise and basis-point rates
+
+Total income is formed from the rupee inputs exactly as the float calculators
+form it and converted to integer paise once (half a paisa rounds up). Slab tax
+is accumulated exactly in paise x basis points and rounded half up to the
+paisa, so tax_before_cess + cess == tax_after_cess always holds and results
+are bit-reproducible on every machine. Outputs keep the float calculators'
+keys, in rupees.
+
+Two rule orders are supported:
+  exact      - the float calculators' order (87A rebate against tax incl. cess,
+               eligibility decided on the unrounded total income). Taxable
+               income, tax before and after cess, the rebate and final tax are
+               each rounded once, so they agree with the float calculators to
+               half a paisa; cess is the difference of two of them (within a
+               paisa)
+  statutory  - Income Tax Act order: 87A rebate against income-tax before
+               cess (s.87A), with the new regime's marginal relief just above
+               the rebate limit (tax capped at the income over the limit, for
+               rule sets marking rebate_87a.marginal_relief), total income
+               rounded to the nearest ₹10 (s.288A) and tax payable rounded to
+               the nearest ₹10 (s.288B)
+
+The float calculators, and so the exact order, have no marginal relief.
+"""
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .calculator_fy2025 import TaxCalculationInput, calculate_tax_fy2025
+from .rules import RegimeRules, TaxRuleSet, age_category, rule_registry
+from .slab_table import BASIS_POINTS, div_half_up, to_paise, to_paise_array
+from .vectorized import ArrayLike, input_columns
+
+ENGINES = ("float", "exact", "statutory")
+TEN_RUPEES = 1000  # In paise; the ss.288A / 288B rounding unit
+
+def _round_ten_rupees(paise):
+    return div_half_up(paise, TEN_RUPEES) * TEN_RUPEES
+
+def _rupees(paise: int) -> float:
+    return paise / 100
+
+def _with_rate(scaled, rate_bp: int):
+    """scaled (paise x basis points) times rate_bp, rounded half up to paise once without int64 overflow"""
+    whole, fraction = scaled // BASIS_POINTS, scaled % BASIS_POINTS
+    return div_half_up(whole * rate_bp + fraction * rate_bp // BASIS_POINTS, BASIS_POINTS)
+
+def regime_tax_paise(regime: RegimeRules,
+                     cess_bp: int,
+                     gross_income: float,
+                     age: int,
+                     is_salaried: bool,
+                     deductions: float = 0,
+                     statutory: bool = False) -> Dict[str, int]:
+    """One regime's calculation from rupee inputs, with every amount in integer paise"""
+    # Step 1: Total income after deductions (rounded to paise once), then the slab income above the exemption
+    standard_deduction = regime.standard_deduction if is_salaried else 0
+    income_after_deductions = max(0, gross_income - standard_deduction - deductions)
+    total_income = to_paise(income_after_deductions)
+    if statutory:
+        total_income = _round_ten_rupees(total_income)
+        within_rebate_limit = total_income <= to_paise(regime.rebate_income_limit)
+    else:
+        # The float calculators' comparison, so rounding to paise never moves the 87A cliff
+        within_rebate_limit = income_after_deductions <= regime.rebate_income_limit
+    basic_exemption = to_paise(regime.basic_exemption_for(age))
+    taxable_income = max(0, total_income - basic_exemption)
+    
+    # Step 2: Slab tax, cess and the 87A rebate
+    tax_scaled = regime.paise_table.tax_scaled(taxable_income)
+    tax = div_half_up(tax_scaled, BASIS_POINTS)
+    rebate_max = to_paise(regime.rebate_max) if within_rebate_limit else 0
+    if statutory:
+        rebate_87a = min(tax, rebate_max)
+        if regime.rebate_marginal_relief and not within_rebate_limit:
+            # s.87A proviso: tax never exceeds the total income over the limit
+            rebate_87a = max(0, tax - (total_income - to_paise(regime.rebate_income_limit)))
+        tax_after_cess = tax + div_half_up((tax - rebate_87a) * cess_bp, BASIS_POINTS)
+    else:
+        tax_after_cess = _with_rate(tax_scaled, BASIS_POINTS + cess_bp)
+        rebate_87a = min(tax_after_cess, rebate_max)
+    
+    final_tax = tax_after_cess - rebate_87a
+    if statutory:
+        final_tax = _round_ten_rupees(final_tax)
+    return {
+        "standard_deduction": to_paise(standard_deduction),
+        "total_deductions": to_paise(deductions),
+        "total_income": total_income,
+        "basic_exemption": basic_exemption,
+        "taxable_income": taxable_income,
+        "tax_before_cess": tax,
+        "cess": tax_after_cess - tax,
+        "tax_after_cess": tax_after_cess,
+        "rebate_87a": rebate_87a,
+        "final_tax": final_tax
+    }
+
+def _result(calc_input: TaxCalculationInput, rules: TaxRuleSet, regime: RegimeRules,
+            paise: Dict[str, int], include_breakdown: bool) -> Dict[str, Any]:
+    """Float-calculator-shaped result from a paise calculation"""
+    final_tax = _rupees(paise["final_tax"])
+    result = {"gross_income": calc_input.gross_income}
+    if regime.name == "new":
+        result["standard_deduction"] = _rupees(paise["standard_deduction"])
+    else:
+        result["total_deductions"] = _rupees(paise["total_deductions"])
+    result.update({
+        "basic_exemption": _rupees(paise["basic_exemption"]),
+        "taxable_income": _rupees(paise["taxable_income"]),
+        "tax_before_cess": _rupees(paise["tax_before_cess"]),
+        "cess": _rupees(paise["cess"]),
+        "tax_after_cess": _rupees(paise["tax_after_cess"]),
+        "rebate_87a": _rupees(paise["rebate_87a"]),
+        "final_tax": final_tax,
+        "effective_rate": (final_tax / calc_input.gross_income * 100) if calc_input.gross_income > 0 else 0,
+        "regime": regime.name,
+        "financial_year": rules.financial_year
+    })
+    if regime.name == "new":
+        result["compliance_status"] = rules.compliance_status
+    else:
+        result["age_category"] = age_category(calc_input.age)
+    if include_breakdown:
+        table = regime.table
+        result["breakdown"] = [
+            {
+                "slab": table.descriptions[index],
+                "rate": table.rate_labels[index],
+                "taxable_amount": _rupees(amount),
+                "tax": _rupees(tax)
+            }
+            for index, amount, tax in regime.paise_table.slab_amounts(paise["taxable_income"])
+        ]
+    return result
+
+def calculate_new_regime_tax_exact(calc_input: TaxCalculationInput,
+                                   rules: Optional[TaxRuleSet] = None,
+                                   statutory: bool = False,
+                                   include_breakdown: bool = True) -> Dict[str, Any]:
+    """Fixed-point calculate_new_regime_tax_fy2025"""
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    paise = regime_tax_paise(rules.new, rules.cess_bp, calc_input.gross_income,
+                             calc_input.age, calc_input.is_salaried, statutory=statutory)
+    return _result(calc_input, rules, rules.new, paise, include_breakdown)
+
+def calculate_old_regime_tax_exact(calc_input: TaxCalculationInput,
+                                   rules: Optional[TaxRuleSet] = None,
+                                   statutory: bool = False,
+                                   include_breakdown: bool = True) -> Dict[str, Any]:
+    """Fixed-point calculate_old_regime_tax_fy2025"""
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    deductions = calc_input.deductions_80c + calc_input.health_insurance_premium
+    paise = regime_tax_paise(rules.old, rules.cess_bp, calc_input.gross_income,
+                             calc_input.age, calc_input.is_salaried, deductions, statutory)
+    return _result(calc_input, rules, rules.old, paise, include_breakdown)
+
+def calculate_tax_exact(calc_input: TaxCalculationInput,
+                        rules: Optional[TaxRuleSet] = None,
+                        statutory: bool = False,
+                        include_breakdown: bool = True) -> Dict[str, Any]:
+    """Fixed-point calculate_tax_fy2025"""
+    if calc_input.regime.lower() == "new":
+        return calculate_new_regime_tax_exact(calc_input, rules, statutory, include_breakdown)
+    return calculate_old_regime_tax_exact(calc_input, rules, statutory, include_breakdown)
+
+def calculate_tax_with_engine(calc_input: TaxCalculationInput,
+                              engine: str = "float",
+                              rules: Optional[TaxRuleSet] = None,
+                              include_breakdown: bool = True) -> Dict[str, Any]:
+    """Calculate with one of ENGINES; float is the original calculator"""
+    if engine == "float":
+        return calculate_tax_fy2025(calc_input, rules, include_breakdown)
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+    return calculate_tax_exact(calc_input, rules, engine == "statutory", include_breakdown)
+
+def regime_paise_arrays(regime: RegimeRules,
+                        cess_bp: int,
+                        gross_income: np.ndarray,
+                        age: np.ndarray,
+                        is_salaried: np.ndarray,
+                        deductions: np.ndarray,
+                        statutory: bool = False) -> Dict[str, np.ndarray]:
+    """Array version of regime_tax_paise; float rupees in, int64 paise out"""
+    standard_deduction = np.where(is_salaried, float(regime.standard_deduction), 0.0)
+    income_after_deductions = np.maximum(0, gross_income - standard_deduction - deductions)
+    total_income = to_paise_array(income_after_deductions)
+    if statutory:
+        total_income = _round_ten_rupees(total_income)
+        within_rebate_limit = total_income <= to_paise(regime.rebate_income_limit)
+    else:
+        within_rebate_limit = income_after_deductions <= regime.rebate_income_limit
+    exemptions = {category: to_paise(amount) for category, amount in regime.basic_exemptions.items()}
+    basic_exemption = np.where(age >= 80, exemptions["super_senior"],
+                               np.where(age >= 60, exemptions["senior"], exemptions["regular"]))
+    taxable_income = np.maximum(0, total_income - basic_exemption)
+    
+    tax_scaled = regime.paise_table.tax_scaled_array(taxable_income)
+    tax = div_half_up(tax_scaled, BASIS_POINTS)
+    rebate_max = np.where(within_rebate_limit, to_paise(regime.rebate_max), 0)
+    if statutory:
+        rebate_87a = np.minimum(tax, rebate_max)
+        if regime.rebate_marginal_relief:
+            excess = total_income - to_paise(regime.rebate_income_limit)
+            rebate_87a = np.where(within_rebate_limit, rebate_87a, np.maximum(0, tax - excess))
+        tax_after_cess = tax + div_half_up((tax - rebate_87a) * cess_bp, BASIS_POINTS)
+    else:
+        tax_after_cess = _with_rate(tax_scaled, BASIS_POINTS + cess_bp)
+        rebate_87a = np.minimum(tax_after_cess, rebate_max)
+    
+    final_tax = tax_after_cess - rebate_87a
+    if statutory:
+        final_tax = _round_ten_rupees(final_tax)
+    return {
+        "standard_deduction": to_paise_array(standard_deduction),
+        "total_deductions": to_paise_array(deductions),
+        "total_income": total_income,
+        "basic_exemption": basic_exemption,
+        "taxable_income": taxable_income,
+        "tax_before_cess": tax,
+        "cess": tax_after_cess - tax,
+        "tax_after_cess": tax_after_cess,
+        "rebate_87a": rebate_87a,
+        "final_tax": final_tax
+    }
+
+def calculate_tax_arrays_exact(gross_income: ArrayLike,
+                               age: ArrayLike = 30,
+                               regime: ArrayLike = "new",
+                               is_salaried: ArrayLike = True,
+                               deductions_80c: ArrayLike = 0,
+                               health_insurance_premium: ArrayLike = 0,
+                               financial_year: Optional[str] = None,
+                               rules: Optional[TaxRuleSet] = None,
+                               statutory: bool = False,
+                               as_paise: bool = False) -> Dict[str, Any]:
+    """
+    Fixed-point calculate_tax_arrays (without breakdowns)
+    
+    Amounts are float rupee arrays (exact paise / 100) or, with as_paise=True,
+    the underlying int64 paise arrays; effective_rate is always a float percent.
+    """
+    rules = rules or rule_registry.get(financial_year)
+    gross_income, age, is_new_regime, is_salaried, deductions_80c, health_insurance_premium = input_columns(
+        gross_income, age, regime, is_salaried, deductions_80c, health_insurance_premium
+    )
+    new = regime_paise_arrays(rules.new, rules.cess_bp, gross_income, age, is_salaried, 0.0, statutory)
+    old = regime_paise_arrays(rules.old, rules.cess_bp, gross_income, age, is_salaried,
+                              deductions_80c + health_insurance_premium, statutory)
+    
+    result = {"gross_income": gross_income, "is_new_regime": is_new_regime, "rule_set": rules}
+    for key in ("basic_exemption", "taxable_income", "tax_before_cess", "cess",
+                "tax_after_cess", "rebate_87a", "final_tax"):
+        result[key] = np.where(is_new_regime, new[key], old[key])
+    result["standard_deduction"] = np.where(is_new_regime, new["standard_deduction"], 0)
+    result["total_deductions"] = np.where(is_new_regime, 0, old["total_deductions"])
+    
+    # Same division as the scalar engine, so effective rates agree bit for bit too
+    safe_income = np.where(gross_income > 0, gross_income, 1)
+    result["effective_rate"] = np.where(gross_income > 0, result["final_tax"] / 100 / safe_income * 100, 0.0)
+    if not as_paise:
+        for key in ("basic_exemption", "taxable_income", "tax_before_cess", "cess", "tax_after_cess",
+                    "rebate_87a", "final_tax", "standard_deduction", "total_deductions"):
+            result[key] = result[key] / 100
+    return result
@@ -0,0 +1,77 @@
+"""
+Income Sweep - tax, effective rate and marginal rate over an income range
+One vectorized pass per regime over the whole grid, returned as columns
+(one list per field) so long curves serialize compactly
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .rules import TaxRuleSet, rule_registry
+from .vectorized import calculate_new_regime_arrays, calculate_old_regime_arrays
+
+def sweep_points(start: float, stop: float, step: float) -> int:
+    """Number of grid points from start to stop (inclusive) in steps of step"""
+    if step <= 0:
+        raise ValueError("step must be positive")
+    if stop < start:
+        raise ValueError("stop must not be below start")
+    return int(np.floor((stop - start) / step + 1e-9)) + 1
+
+def _marginal_rate(regime_result: Dict[str, np.ndarray], table, cess_multiplier: float) -> np.ndarray:
+    """Percent of the next rupee of gross income paid as tax (nil while the rebate absorbs it)"""
+    slab_rate = table.marginal_rate_array(regime_result["taxable_income"])
+    return np.where(regime_result["final_tax"] > 0, slab_rate * cess_multiplier * 100, 0.0)
+
+def income_sweep_fy2025(start: float,
+                        stop: float,
+                        step: float,
+                        age: int = 30,
+                        regimes: Tuple[str, ...] = ("new", "old"),
+                        is_salaried: bool = True,
+                        deductions_80c: float = 0,
+                        health_insurance_premium: float = 0,
+                        financial_year: Optional[str] = None,
+                        rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """
+    Evaluate the regimes on the grid start, start + step, ..., stop
+    
+    Returns gross_income plus final_tax, effective_rate and marginal_rate (percent)
+    per regime as plain lists; amounts rounded to paise, rates to 4 decimals.
+    """
+    rules = rules or rule_registry.get(financial_year)
+    points = sweep_points(start, stop, step)
+    
+    # Step 1: Grid and broadcast profile columns
+    gross_income = start + step * np.arange(points, dtype=np.float64)
+    age_column = np.full(points, age, dtype=np.int64)
+    salaried_column = np.full(points, is_salaried, dtype=bool)
+    
+    # Step 2: One vectorized pass per requested regime
+    columns = {}
+    for regime_name in regimes:
+        if regime_name == "new":
+            result = calculate_new_regime_arrays(gross_income, age_column, salaried_column, rules)
+        else:
+            result = calculate_old_regime_arrays(
+                gross_income, age_column, salaried_column,
+                np.full(points, float(deductions_80c)),
+                np.full(points, float(health_insurance_premium)),
+                rules
+            )
+        marginal_rate = _marginal_rate(result, rules.regime(regime_name).table, rules.cess_multiplier)
+        columns[regime_name] = {
+            "final_tax": np.round(result["final_tax"], 2).tolist(),
+            "effective_rate": np.round(result["effective_rate"], 4).tolist(),
+            "marginal_rate": np.round(marginal_rate, 4).tolist()
+        }
+    
+    return {
+        "financial_year": rules.financial_year,
+        "start": start,
+        "stop": stop,
+        "step": step,
+        "points": points,
+        "gross_income": np.round(gross_income, 2).tolist(),
+        "regimes": columns
+    }
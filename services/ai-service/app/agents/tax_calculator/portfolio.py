@@ -0,0 +1,162 @@
+"""
+Portfolio Analytics - aggregates over a CA firm's whole client book
+Records are validated like batch rows, then both regimes are evaluated for
+every client in one vectorized pass; all aggregates are columnar (one list
+per field) so they chart directly
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from pydantic import ValidationError
+
+from .batch import _validation_errors, detect_format, read_records
+from .rules import RegimeRules, TaxRuleSet, rule_registry
+from .vectorized import calculate_new_regime_arrays, calculate_old_regime_arrays
+from ...models.tax_models import TaxData
+
+REGIMES = ("new", "old")
+
+# Effective rates lie in [0, 100], so this width caps the histogram at 1000 bins
+MIN_RATE_BIN_WIDTH = 0.1
+
+def load_client_columns(records: Iterable[Any],
+                        financial_year: Optional[str] = None,
+                        start: int = 0) -> Dict[str, Any]:
+    """
+    Validate records into column lists; rejected records are reported by index
+    With financial_year set, records tagged with another year are rejected
+    """
+    columns = {key: [] for key in ("index", "income", "age", "is_new_regime", "is_salaried",
+                                   "deductions_80c", "health_insurance_premium")}
+    errors = []
+    for index, record in enumerate(records, start):
+        if not isinstance(record, dict):
+            errors.append({"index": index, "errors": [{"field": "", "message": "Record must be a JSON object"}]})
+            continue
+        try:
+            tax_data = TaxData(**record)
+        except ValidationError as e:
+            errors.append({"index": index, "errors": _validation_errors(e)})
+            continue
+        if financial_year is not None and tax_data.financial_year not in (None, financial_year):
+            errors.append({"index": index, "errors": [{
+                "field": "financial_year",
+                "message": f"Client book is analysed for FY {financial_year}"
+            }]})
+            continue
+        
+        columns["index"].append(index)
+        columns["income"].append(tax_data.income)
+        columns["age"].append(tax_data.age)
+        columns["is_new_regime"].append(tax_data.regime == "new")
+        columns["is_salaried"].append(tax_data.is_salaried)
+        columns["deductions_80c"].append(tax_data.deductions_80c)
+        columns["health_insurance_premium"].append(tax_data.health_insurance_premium)
+    return {"columns": columns, "errors": errors}
+
+def _slab_counts(regime: RegimeRules, taxable_income: np.ndarray) -> Dict[str, List[Any]]:
+    """Clients per top slab, with clients inside the basic exemption counted first"""
+    nil = taxable_income <= 0
+    counts = np.bincount(regime.table.slab_index_array(taxable_income[~nil]), minlength=len(regime.table))
+    return {
+        "slab": ["Within basic exemption", *regime.table.descriptions],
+        "rate": ["0%", *regime.table.rate_labels],
+        "clients": [int(nil.sum()), *counts.tolist()]
+    }
+
+def _histogram(values: np.ndarray, bin_width: float) -> Dict[str, List[float]]:
+    top = (np.floor(values.max() / bin_width) + 1) * bin_width if values.size else bin_width
+    edges = np.arange(0, top + bin_width / 2, bin_width)
+    counts, _ = np.histogram(values, bins=edges)
+    return {
+        "bin_start": np.round(edges[:-1], 4).tolist(),
+        "bin_end": np.round(edges[1:], 4).tolist(),
+        "clients": counts.tolist()
+    }
+
+def analyze_portfolio(records: Iterable[Any],
+                      financial_year: Optional[str] = None,
+                      rate_bin_width: float = 2.5,
+                      include_clients: bool = False,
+                      rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """
+    Aggregate tax analytics for a client book
+    
+    Each record is a TaxData-shaped dict (regime = the client's current regime).
+    Covers liability per regime, clients who would save by switching, the
+    effective rate histogram (current regime), clients per top slab and the
+    87A rebate zone. include_clients adds per-client columns.
+    """
+    if not rate_bin_width >= MIN_RATE_BIN_WIDTH:
+        raise ValueError(f"rate_bin_width must be at least {MIN_RATE_BIN_WIDTH}")
+    rules = rules or rule_registry.get(financial_year)
+    loaded = load_client_columns(records, rules.financial_year)
+    columns, errors = loaded["columns"], loaded["errors"]
+    
+    # Step 1: Both regimes for every client in one vectorized pass each
+    gross_income = np.asarray(columns["income"], dtype=np.float64)
+    age = np.asarray(columns["age"], dtype=np.int64)
+    is_salaried = np.asarray(columns["is_salaried"], dtype=bool)
+    is_new_regime = np.asarray(columns["is_new_regime"], dtype=bool)
+    results = {
+        "new": calculate_new_regime_arrays(gross_income, age, is_salaried, rules),
+        "old": calculate_old_regime_arrays(
+            gross_income, age, is_salaried,
+            np.asarray(columns["deductions_80c"], dtype=np.float64),
+            np.asarray(columns["health_insurance_premium"], dtype=np.float64),
+            rules
+        )
+    }
+    new_tax, old_tax = results["new"]["final_tax"], results["old"]["final_tax"]
+    
+    # Step 2: Current position and the switching opportunity
+    current_tax = np.where(is_new_regime, new_tax, old_tax)
+    alternative_tax = np.where(is_new_regime, old_tax, new_tax)
+    switch_savings = np.maximum(0, current_tax - alternative_tax)
+    current_rate = np.where(is_new_regime, results["new"]["effective_rate"], results["old"]["effective_rate"])
+    in_regime = {"new": is_new_regime, "old": ~is_new_regime}
+    
+    analytics = {
+        "financial_year": rules.financial_year,
+        "clients": int(gross_income.size),
+        "rejected": len(errors),
+        "errors": errors,
+        "total_liability": float(current_tax.sum()),
+        "optimal_liability": float(np.minimum(new_tax, old_tax).sum()),
+        "regimes": {
+            "regime": list(REGIMES),
+            "clients": [int(in_regime[name].sum()) for name in REGIMES],
+            "current_liability": [float(current_tax[in_regime[name]].sum()) for name in REGIMES],
+            "liability_if_all_clients": [float(results[name]["final_tax"].sum()) for name in REGIMES],
+            "clients_in_rebate_zone": [
+                int((results[name]["rebate_87a"][in_regime[name]] > 0).sum()) for name in REGIMES
+            ],
+            "rebate_total": [float(results[name]["rebate_87a"][in_regime[name]].sum()) for name in REGIMES]
+        },
+        "switching": {
+            "from_regime": list(REGIMES),
+            "to_regime": list(reversed(REGIMES)),
+            "clients_who_save": [int((switch_savings[in_regime[name]] > 0).sum()) for name in REGIMES],
+            "total_savings": [float(switch_savings[in_regime[name]].sum()) for name in REGIMES]
+        },
+        "effective_rate_histogram": _histogram(current_rate, rate_bin_width),
+        "slabs": {
+            name: _slab_counts(rules.regime(name), results[name]["taxable_income"][in_regime[name]])
+            for name in REGIMES
+        }
+    }
+    
+    if include_clients:
+        analytics["client_results"] = {
+            "index": columns["index"],
+            "regime": np.where(is_new_regime, "new", "old").tolist(),
+            "final_tax": current_tax.tolist(),
+            "alternative_regime_tax": alternative_tax.tolist(),
+            "savings_if_switched": switch_savings.tolist(),
+            "effective_rate": np.round(current_rate, 4).tolist()
+        }
+    return analytics
+
+def analyze_portfolio_file(path: str, input_format: Optional[str] = None, **options: Any) -> Dict[str, Any]:
+    """analyze_portfolio over a CSV or JSONL client book, streamed record by record"""
+    return analyze_portfolio(read_records(path, detect_format(path, input_format)), **options)
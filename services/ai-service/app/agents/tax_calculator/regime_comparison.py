@@ -0,0 +1,72 @@
+"""
+Regime Comparison - both FY 2025-26 regimes from one input, with breakeven analysis
+
+The breakeven 80C/80D deduction is solved from the slab breakpoints: old regime
+tax is non-decreasing in income after deductions, so the largest such income
+whose old regime tax does not exceed the new regime tax is read off the
+inverted slab table (max_income_for_tax), and the breakeven deduction follows directly.
+"""
+import math
+from dataclasses import replace
+from typing import Dict, Any, Optional
+
+from .calculator_fy2025 import (
+    TaxCalculationInput,
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025
+)
+from .reverse_calculator import max_income_for_tax
+from .rules import TaxRuleSet, rule_registry
+
+def breakeven_deductions(calc_input: TaxCalculationInput,
+                         target_tax: float,
+                         rules: TaxRuleSet) -> float:
+    """Smallest total 80C + 80D deduction (whole rupees) at which the old regime tax is at most target_tax"""
+    standard_deduction = rules.old.standard_deduction if calc_input.is_salaried else 0
+    ceiling = max_income_for_tax(rules, rules.old, calc_input.age, target_tax)
+    if math.isinf(ceiling):
+        return 0
+    
+    deductions = max(0, math.ceil(round(calc_input.gross_income - standard_deduction - ceiling, 6)))
+    
+    # The closed form is exact up to float rounding; confirm once and step a rupee if needed
+    probe = replace(calc_input, deductions_80c=deductions, health_insurance_premium=0)
+    if calculate_old_regime_tax_fy2025(probe, rules)["final_tax"] > target_tax:
+        deductions += 1
+    return deductions
+
+def compare_regimes_fy2025(calc_input: TaxCalculationInput,
+                           rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """Evaluate both regimes and the breakeven deduction against one rule set"""
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    
+    # Step 1: Both regimes from the same input and rules
+    new_result = calculate_new_regime_tax_fy2025(calc_input, rules)
+    old_result = calculate_old_regime_tax_fy2025(calc_input, rules)
+    new_tax = new_result["final_tax"]
+    old_tax = old_result["final_tax"]
+    
+    # Step 2: Recommendation (a tie goes to the default new regime)
+    recommended_regime = "old" if old_tax < new_tax else "new"
+    savings = abs(new_tax - old_tax)
+    
+    # Step 3: Breakeven deduction for the old regime
+    breakeven = breakeven_deductions(calc_input, new_tax, rules)
+    current_deductions = calc_input.deductions_80c + calc_input.health_insurance_premium
+    max_eligible = sum(rules.deduction_limits.get(section, 0) for section in ("80C", "80D"))
+    
+    return {
+        "financial_year": rules.financial_year,
+        "new_regime": new_result,
+        "old_regime": old_result,
+        "recommended_regime": recommended_regime,
+        "savings": savings,
+        "recommendation_reason": f"Save ₹{savings:,.0f} with {recommended_regime} regime",
+        "breakeven": {
+            "breakeven_total_deductions": breakeven,
+            "current_deductions": current_deductions,
+            "additional_deductions_needed": max(0, breakeven - current_deductions),
+            "max_eligible_deductions": max_eligible,
+            "achievable_within_limits": breakeven <= max_eligible
+        }
+    }
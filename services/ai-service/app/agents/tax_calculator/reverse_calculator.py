@@ -0,0 +1,168 @@
+"""
+Reverse Calculator - gross income for a target take-home or target tax (FY 2025-26)
+
+Final tax is piecewise linear in gross income between the slab breakpoints,
+except for the jump where the 87A rebate stops applying. Both inverses are
+solved on those pieces directly: a target tax through the inverted slab
+table, a target take-home by walking the linear segments of gross - tax.
+"""
+import math
+from dataclasses import replace
+from typing import Dict, Any, List, Optional, Tuple
+
+from .calculator_fy2025 import (
+    TaxCalculationInput,
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025
+)
+from .rules import RegimeRules, TaxRuleSet, rule_registry
+
+def regime_final_tax(rules: TaxRuleSet, regime: RegimeRules, age: int, income: float) -> float:
+    """Final tax (cess and 87A rebate included) on income after standard deduction and deductions"""
+    taxable_income = max(0, income - regime.basic_exemption_for(age))
+    tax_with_cess = regime.table.tax(taxable_income) * rules.cess_multiplier
+    if income <= regime.rebate_income_limit:
+        return max(0, tax_with_cess - regime.rebate_max)
+    return tax_with_cess
+
+def max_income_for_tax(rules: TaxRuleSet, regime: RegimeRules, age: int, target_tax: float) -> float:
+    """Largest income after deductions whose final tax does not exceed target_tax"""
+    exemption = regime.basic_exemption_for(age)
+    
+    # Without the 87A rebate: tax_before_cess * cess_multiplier <= target_tax
+    ceiling = exemption + regime.table.income_for_tax(target_tax / rules.cess_multiplier)
+    if ceiling > regime.rebate_income_limit:
+        return ceiling
+    
+    # Within the rebate limit the rebate absorbs up to rebate_max more tax
+    with_rebate = exemption + regime.table.income_for_tax(
+        (target_tax + regime.rebate_max) / rules.cess_multiplier
+    )
+    return min(regime.rebate_income_limit, with_rebate)
+
+def _income_offset(rules: TaxRuleSet, regime: RegimeRules, calc_input: TaxCalculationInput) -> float:
+    """Gross income minus income after deductions (standard deduction, plus 80C/80D in the old regime)"""
+    offset = regime.standard_deduction if calc_input.is_salaried else 0
+    if regime.allows_deductions:
+        offset += calc_input.deductions_80c + calc_input.health_insurance_premium
+    return offset
+
+def _breakpoints(rules: TaxRuleSet, regime: RegimeRules, age: int, offset: float) -> List[float]:
+    """Gross incomes where gross - final tax changes slope or jumps"""
+    exemption = regime.basic_exemption_for(age)
+    incomes = [0.0, regime.rebate_income_limit]
+    incomes += [exemption + lower for lower in regime.table.lower_bounds]
+    # Inside the rebate zone tax is nil until it exceeds the maximum rebate
+    incomes.append(max_income_for_tax(rules, regime, age, 0))
+    return sorted({income + offset for income in incomes if income + offset >= 0} | {0.0})
+
+def _solve_net(rules: TaxRuleSet, regime: RegimeRules, age: int, offset: float,
+               target_net: float, start: float = 0.0) -> Optional[float]:
+    """Smallest gross income >= start whose take-home (gross - final tax) equals target_net"""
+    def net(gross: float) -> float:
+        return gross - regime_final_tax(rules, regime, age, max(0, gross - offset))
+    
+    points = [point for point in _breakpoints(rules, regime, age, offset) if point > start]
+    for low, high in zip([start] + points, points + [float('inf')]):
+        # net is linear on the open segment; take its slope and value from interior points
+        probe = low + 1 if high == float('inf') else (low + high) / 2
+        probe_low = low + (probe - low) / 2
+        slope = (net(probe) - net(probe_low)) / (probe - probe_low)
+        if slope <= 0:
+            continue
+        gross = probe + (target_net - net(probe)) / slope
+        if low <= gross <= high:
+            return max(start, gross)
+    return None
+
+def _solve(calc_input: TaxCalculationInput, rules: TaxRuleSet, regime_name: str,
+           target_type: str, target_amount: float) -> Dict[str, Any]:
+    """Gross income for the target under one regime, with the calculation at that income"""
+    regime = rules.regime(regime_name)
+    offset = _income_offset(rules, regime, calc_input)
+    
+    # Step 1: Analytic inverse
+    if target_type == "tax":
+        gross_income = offset + max_income_for_tax(rules, regime, calc_input.age, target_amount)
+    else:
+        gross_income = _solve_net(rules, regime, calc_input.age, offset, target_amount)
+    
+    # Step 2: Income band just above the 87A limit where a raise lowers take-home
+    limit_gross = offset + regime.rebate_income_limit
+    limit_net = limit_gross - regime_final_tax(rules, regime, calc_input.age, regime.rebate_income_limit)
+    recovery_gross = _solve_net(rules, regime, calc_input.age, offset, limit_net, start=limit_gross + 1e-9)
+    
+    result = {
+        "regime": regime_name,
+        "rebate_cliff": {
+            "gross_income_limit": limit_gross,
+            "take_home_at_limit": limit_net,
+            "take_home_recovered_at": recovery_gross
+        }
+    }
+    if gross_income is None or gross_income == float('inf'):
+        return {**result, "gross_income": None, "exact": False, "calculation": None}
+    
+    # Step 3: Confirm with the scalar calculator
+    solved_input = TaxCalculationInput(
+        gross_income=gross_income,
+        age=calc_input.age,
+        regime=regime_name,
+        is_salaried=calc_input.is_salaried,
+        deductions_80c=calc_input.deductions_80c,
+        health_insurance_premium=calc_input.health_insurance_premium,
+        financial_year=calc_input.financial_year
+    )
+    calculate = calculate_new_regime_tax_fy2025 if regime_name == "new" else calculate_old_regime_tax_fy2025
+    calculation = calculate(solved_input, rules)
+    
+    # Subtracting the deductions back out can round past the 87A limit; step back a few ulps
+    for _ in range(8):
+        final_tax = calculation["final_tax"]
+        missed = (final_tax > target_amount + 0.01 if target_type == "tax"
+                  else gross_income - final_tax < target_amount - 0.01)
+        if not missed:
+            break
+        gross_income = math.nextafter(gross_income, 0)
+        calculation = calculate(replace(solved_input, gross_income=gross_income), rules)
+    
+    final_tax = calculation["final_tax"]
+    achieved = final_tax if target_type == "tax" else gross_income - final_tax
+    
+    return {
+        **result,
+        "gross_income": gross_income,
+        "final_tax": final_tax,
+        "take_home": gross_income - final_tax,
+        # False when the target falls in the gap the rebate cliff leaves in final tax
+        "exact": abs(achieved - target_amount) < 0.01,
+        "calculation": calculation
+    }
+
+def reverse_calculate_fy2025(calc_input: TaxCalculationInput,
+                             target_type: str,
+                             target_amount: float,
+                             regimes: Tuple[str, ...] = ("new", "old"),
+                             rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """
+    Gross income per regime for a target take-home ("net") or target tax ("tax")
+    
+    calc_input supplies age, employment and deductions; its gross_income and regime
+    are ignored. A target net is met at the smallest gross income reaching it; a
+    target tax at the largest gross income whose tax does not exceed it.
+    """
+    if target_type not in ("net", "tax"):
+        raise ValueError('target_type must be "net" or "tax"')
+    if target_amount < 0:
+        raise ValueError("target_amount must not be negative")
+    rules = rules or rule_registry.get(calc_input.financial_year)
+    
+    return {
+        "financial_year": rules.financial_year,
+        "target_type": target_type,
+        "target_amount": target_amount,
+        "results": {
+            regime_name: _solve(calc_input, rules, regime_name, target_type, target_amount)
+            for regime_name in regimes
+        }
+    }
@@ -0,0 +1,303 @@
+"""
+Tax Rule Registry - versioned, data-driven rules per financial year
+
+Rule files in data/tax-rules (one JSON file per financial year) are compiled
+once into immutable TaxRuleSet objects. The registry polls the files for
+changes and swaps in a freshly compiled mapping in a single assignment, so a
+calculation that has fetched its TaxRuleSet never sees a half-loaded update.
+"""
+import copy
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .slab_table import PaiseSlabTable, SlabTable, rate_to_basis_points
+from ...core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Built-in FY 2025-26 rules (Union Budget 2025); used when no rule file for the year is found
+BUILTIN_RULES: Dict[str, Any] = {
+    "financial_year": "2025-26",
+    "assessment_year": "2026-27",
+    "compliance_status": "Budget 2025 Compliant",
+    "cess_percent": 4,
+    "deduction_limits": {"80C": 150000, "80D": 25000},
+    "regimes": {
+        "new": {
+            "standard_deduction": 75000,
+            "basic_exemption": {"regular": 400000, "senior": 400000, "super_senior": 400000},
+            "allows_deductions": False,
+            "slabs": [
+                {"width": 400000, "rate_percent": 5, "label": "₹4L - ₹8L"},
+                {"width": 400000, "rate_percent": 10, "label": "₹8L - ₹12L"},
+                {"width": 400000, "rate_percent": 15, "label": "₹12L - ₹16L"},
+                {"width": 400000, "rate_percent": 20, "label": "₹16L - ₹20L"},
+                {"width": 400000, "rate_percent": 25, "label": "₹20L - ₹24L"},
+                {"width": None, "rate_percent": 30, "label": "Above ₹24L"}
+            ],
+            "rebate_87a": {"income_limit": 1200000, "max_rebate": 60000, "marginal_relief": True}
+        },
+        "old": {
+            "standard_deduction": 0,
+            "basic_exemption": {"regular": 250000, "senior": 300000, "super_senior": 500000},
+            "allows_deductions": True,
+            "slabs": [
+                {"width": 250000, "rate_percent": 5, "label": "₹2.5L - ₹5L"},
+                {"width": 750000, "rate_percent": 20, "label": "₹5L - ₹10L"},
+                {"width": None, "rate_percent": 30, "label": "Above ₹10L"}
+            ],
+            "rebate_87a": {"income_limit": 500000, "max_rebate": 12500}
+        }
+    }
+}
+
+def age_category(age: int) -> str:
+    """Age bucket used by the age-based exemptions"""
+    if age >= 80:
+        return "super_senior"
+    if age >= 60:
+        return "senior"
+    return "regular"
+
+@dataclass(frozen=True)
+class RegimeRules:
+    """Compiled rules of one regime"""
+    name: str
+    standard_deduction: float
+    basic_exemptions: Dict[str, float]
+    allows_deductions: bool
+    table: SlabTable
+    rebate_income_limit: float
+    rebate_max: float
+    paise_table: PaiseSlabTable = field(repr=False, compare=False)  # Integer twin of table
+    # s.87A proviso: above the income limit, tax is capped at the income over the limit
+    rebate_marginal_relief: bool = False
+    
+    def basic_exemption_for(self, age: int) -> float:
+        return self.basic_exemptions[age_category(age)]
+
+@dataclass(frozen=True)
+class TaxRuleSet:
+    """Compiled, immutable rules of one financial year"""
+    financial_year: str
+    assessment_year: str
+    compliance_status: str
+    cess_rate: float
+    cess_multiplier: float
+    cess_bp: int  # Cess in basis points for the fixed-point engine
+    deduction_limits: Dict[str, float]
+    new: RegimeRules
+    old: RegimeRules
+    source: str
+    loaded_at: float = field(default_factory=time.time)
+    data: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)  # Raw rule data
+    
+    def regime(self, name: str) -> RegimeRules:
+        return self.new if name.lower() == "new" else self.old
+    
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "financial_year": self.financial_year,
+            "assessment_year": self.assessment_year,
+            "compliance_status": self.compliance_status,
+            "cess_rate": self.cess_rate,
+            "deduction_limits": self.deduction_limits,
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+            "regimes": {
+                regime.name: {
+                    "standard_deduction": regime.standard_deduction,
+                    "basic_exemption": regime.basic_exemptions,
+                    "allows_deductions": regime.allows_deductions,
+                    "slabs": [
+                        {"label": label, "rate": rate_label}
+                        for label, rate_label in zip(regime.table.descriptions, regime.table.rate_labels)
+                    ],
+                    "rebate_87a": {
+                        "income_limit": regime.rebate_income_limit,
+                        "max_rebate": regime.rebate_max,
+                        "marginal_relief": regime.rebate_marginal_relief
+                    }
+                }
+                for regime in (self.new, self.old)
+            }
+        }
+
+def _compile_regime(name: str, data: Dict[str, Any]) -> RegimeRules:
+    slabs = data["slabs"]
+    if not slabs:
+        raise ValueError(f"{name} regime has no slabs")
+    
+    compiled_slabs = []
+    for position, slab in enumerate(slabs):
+        width = slab["width"]
+        is_last = position == len(slabs) - 1
+        if width is None:
+            if not is_last:
+                raise ValueError(f"{name} regime: only the last slab may be open-ended")
+            width = float('inf')
+        elif width <= 0:
+            raise ValueError(f"{name} regime: slab widths must be positive")
+        
+        if not 0 <= slab["rate_percent"] <= 100:
+            raise ValueError(f"{name} regime: rate_percent must be between 0 and 100")
+        compiled_slabs.append((width, slab["rate_percent"] / 100, slab["label"]))
+    
+    exemptions = data["basic_exemption"]
+    table = SlabTable(compiled_slabs)
+    return RegimeRules(
+        name=name,
+        standard_deduction=data.get("standard_deduction", 0),
+        basic_exemptions={
+            category: exemptions.get(category, exemptions["regular"])
+            for category in ("regular", "senior", "super_senior")
+        },
+        allows_deductions=data.get("allows_deductions", False),
+        table=table,
+        rebate_income_limit=data["rebate_87a"]["income_limit"],
+        rebate_max=data["rebate_87a"]["max_rebate"],
+        paise_table=PaiseSlabTable(table),
+        rebate_marginal_relief=bool(data["rebate_87a"].get("marginal_relief", False))
+    )
+
+def compile_rule_set(data: Dict[str, Any], source: str = "builtin") -> TaxRuleSet:
+    """Validate raw rule data and compile it into a TaxRuleSet"""
+    try:
+        cess_rate = data["cess_percent"] / 100
+        return TaxRuleSet(
+            financial_year=data["financial_year"],
+            assessment_year=data.get("assessment_year", ""),
+            compliance_status=data.get("compliance_status", f"FY {data['financial_year']} Compliant"),
+            cess_rate=cess_rate,
+            cess_multiplier=1 + cess_rate,
+            cess_bp=rate_to_basis_points(cess_rate),
+            deduction_limits=dict(data.get("deduction_limits", {})),
+            new=_compile_regime("new", data["regimes"]["new"]),
+            old=_compile_regime("old", data["regimes"]["old"]),
+            source=source,
+            data=copy.deepcopy(data)
+        )
+    except KeyError as e:
+        raise ValueError(f"Rule set {source} is missing required key {e}") from e
+    except (TypeError, AttributeError) as e:
+        raise ValueError(f"Rule set {source} is malformed: {e}") from e
+
+def merge_rule_data(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule data with overrides applied; nested objects merge key by key, lists (slabs) are replaced"""
+    merged = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_rule_data(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+def _default_rules_dir() -> Optional[Path]:
+    """data/tax-rules under the working directory (container) or the repository root"""
+    candidates = [Path.cwd() / "data" / "tax-rules"]
+    parents = Path(__file__).resolve().parents
+    if len(parents) > 5:
+        candidates.append(parents[5] / "data" / "tax-rules")
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    return None
+
+class RuleRegistry:
+    """Per-financial-year rule sets with polling hot reload and atomic swap"""
+    
+    def __init__(self, rules_dir: Optional[Path], default_year: str, reload_interval: float):
+        self.rules_dir = rules_dir
+        self.default_year = default_year
+        self.reload_interval = reload_interval
+        self._reload_lock = threading.Lock()
+        self._last_check = time.monotonic()
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._rule_sets: Dict[str, TaxRuleSet] = {}
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        self.load()
+    
+    def get(self, financial_year: Optional[str] = None) -> TaxRuleSet:
+        """Rule set for financial_year (default year when None)"""
+        if self.reload_interval > 0 and time.monotonic() - self._last_check >= self.reload_interval:
+            self._reload_if_changed()
+        
+        rule_sets = self._rule_sets  # One read: the mapping is only ever replaced, never mutated
+        year = financial_year or self.default_year
+        try:
+            return rule_sets[year]
+        except KeyError:
+            raise ValueError(
+                f"No tax rules for financial year {year}; available: {', '.join(sorted(rule_sets))}"
+            ) from None
+    
+    def financial_years(self) -> List[str]:
+        return sorted(self._rule_sets)
+    
+    def load(self):
+        """Compile every rule file and swap the result in; keeps the old rules on any error"""
+        with self._reload_lock:
+            snapshot = self._scan()
+            rule_sets = {BUILTIN_RULES["financial_year"]: compile_rule_set(BUILTIN_RULES)}
+            try:
+                for path in sorted(snapshot):
+                    with open(path, encoding="utf-8") as rule_file:
+                        data = json.load(rule_file)
+                    if "financial_year" not in data:
+                        logger.warning(f"Skipping {path}: not a financial-year rule file")
+                        continue
+                    rule_sets[data["financial_year"]] = compile_rule_set(data, source=path)
+            except (OSError, ValueError) as e:
+                self.last_error = str(e)
+                logger.error(f"Tax rule reload failed, keeping previous rules: {e}")
+                if self._rule_sets:
+                    self._snapshot = snapshot  # Don't retry the same broken files every poll
+                    return
+            else:
+                self.last_error = None
+            
+            self._rule_sets = rule_sets
+            self._snapshot = snapshot
+            self.reloads += 1
+            logger.info(f"Loaded tax rules for FY {', '.join(sorted(rule_sets))}")
+    
+    def _reload_if_changed(self):
+        self._last_check = time.monotonic()
+        if self._scan() != self._snapshot:
+            self.load()
+    
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """mtime/size of every rule file - cheap enough to run on every poll"""
+        if self.rules_dir is None or not self.rules_dir.is_dir():
+            return {}
+        snapshot = {}
+        for path in self.rules_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "default_financial_year": self.default_year,
+            "rules_dir": str(self.rules_dir) if self.rules_dir else None,
+            "reload_interval_seconds": self.reload_interval,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+            "financial_years": [self._rule_sets[year].describe() for year in self.financial_years()]
+        }
+
+# Global rule registry
+rule_registry = RuleRegistry(
+    rules_dir=Path(settings.tax_rules_dir) if settings.tax_rules_dir else _default_rules_dir(),
+    default_year=settings.default_financial_year,
+    reload_interval=settings.tax_rules_reload_seconds
+)
@@ -0,0 +1,210 @@
+"""
+Policy Scenario Engine - diff two rule sets across a population
+
+A baseline and an alternative rule set (the data/tax-rules JSON shape, given
+as overrides on a loaded financial year) are evaluated over the same people,
+either a seeded synthetic income distribution or a payroll file. The
+population is processed in fixed-size chunks with the vectorized engine and
+only per-band totals are kept, so memory is bounded by the chunk size rather
+than the population size.
+"""
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .batch import detect_format, read_records
+from .portfolio import load_client_columns
+from .rules import TaxRuleSet, compile_rule_set, merge_rule_data, rule_registry
+from .vectorized import calculate_new_regime_arrays, calculate_old_regime_arrays
+
+# Lower edges of the gross income bands (the last band is open-ended)
+DEFAULT_INCOME_BANDS = (0, 500000, 1000000, 1500000, 2000000, 3000000, 5000000, 10000000)
+REGIME_CHOICES = ("optimal", "recorded")
+
+Columns = Dict[str, np.ndarray]
+
+def build_scenario_rules(financial_year: Optional[str] = None,
+                         baseline_overrides: Optional[Dict[str, Any]] = None,
+                         alternative_overrides: Optional[Dict[str, Any]] = None) -> Tuple[TaxRuleSet, TaxRuleSet]:
+    """Baseline and alternative rule sets as overrides on a loaded financial year"""
+    base = rule_registry.get(financial_year)
+    baseline = base
+    if baseline_overrides:
+        baseline = compile_rule_set(merge_rule_data(base.data, baseline_overrides), source="scenario:baseline")
+    alternative = compile_rule_set(
+        merge_rule_data(base.data, alternative_overrides or {}), source="scenario:alternative"
+    )
+    return baseline, alternative
+
+@dataclass
+class SyntheticPopulation:
+    """Seeded synthetic taxpayers; the same parameters and chunk size give the same people"""
+    size: int = 1000000
+    seed: int = 2025
+    median_income: float = 900000
+    income_sigma: float = 0.8  # Shape of the lognormal income distribution
+    min_income: float = 100000
+    salaried_share: float = 0.75
+    new_regime_share: float = 0.7  # Recorded regime choice
+    senior_share: float = 0.1
+    super_senior_share: float = 0.02
+    deduction_claim_share: float = 0.6  # Share claiming 80C / 80D
+    # Intended claims are drawn up to these amounts whatever either rule set
+    # allows; each rule set then caps them at its own deduction limits
+    max_claim_80c: float = 250000
+    max_claim_80d: float = 50000
+    
+    def describe(self) -> Dict[str, Any]:
+        return {"source": "synthetic", **asdict(self)}
+    
+    def chunks(self, chunk_size: int, rules: TaxRuleSet) -> Iterator[Columns]:
+        for chunk_index, start in enumerate(range(0, self.size, chunk_size)):
+            n = min(chunk_size, self.size - start)
+            rng = np.random.default_rng([self.seed, chunk_index])
+            
+            income = np.maximum(self.min_income, self.median_income * rng.lognormal(0.0, self.income_sigma, n))
+            age_draw = rng.random(n)
+            age = np.where(age_draw < self.super_senior_share, rng.integers(80, 96, n),
+                           np.where(age_draw < self.super_senior_share + self.senior_share,
+                                    rng.integers(60, 80, n), rng.integers(22, 60, n)))
+            claims = rng.random(n) < self.deduction_claim_share
+            yield {
+                "income": np.round(income),
+                "age": age,
+                "is_salaried": rng.random(n) < self.salaried_share,
+                "is_new_regime": rng.random(n) < self.new_regime_share,
+                "deductions_80c": np.where(claims, np.round(rng.uniform(0, self.max_claim_80c, n)), 0.0),
+                "health_insurance_premium": np.where(claims, np.round(rng.uniform(0, self.max_claim_80d, n)), 0.0)
+            }
+
+class FilePopulation:
+    """Taxpayers streamed from a CSV / JSONL payroll file, validated like batch rows"""
+    
+    def __init__(self, path: str, input_format: Optional[str] = None, max_errors: int = 100):
+        self.path = path
+        self.input_format = detect_format(path, input_format)
+        self.max_errors = max_errors
+        self.rejected = 0
+        self.errors: List[Dict[str, Any]] = []
+    
+    def describe(self) -> Dict[str, Any]:
+        return {"source": "file", "path": self.path, "rejected": self.rejected, "errors": self.errors}
+    
+    def chunks(self, chunk_size: int, rules: TaxRuleSet) -> Iterator[Columns]:
+        records = read_records(self.path, self.input_format)
+        start = 0
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            loaded = load_client_columns(chunk, start=start)
+            start += len(chunk)
+            self.rejected += len(loaded["errors"])
+            self.errors.extend(loaded["errors"][:self.max_errors - len(self.errors)])
+            columns = loaded["columns"]
+            yield {
+                "income": np.asarray(columns["income"], dtype=np.float64),
+                "age": np.asarray(columns["age"], dtype=np.int64),
+                "is_salaried": np.asarray(columns["is_salaried"], dtype=bool),
+                "is_new_regime": np.asarray(columns["is_new_regime"], dtype=bool),
+                "deductions_80c": np.asarray(columns["deductions_80c"], dtype=np.float64),
+                "health_insurance_premium": np.asarray(columns["health_insurance_premium"], dtype=np.float64)
+            }
+
+def _chunk_tax(rules: TaxRuleSet, columns: Columns, regime_choice: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Final tax per person under rules, and whether the new regime applies"""
+    new_tax = calculate_new_regime_arrays(columns["income"], columns["age"], columns["is_salaried"], rules)["final_tax"]
+    # Claims count only up to this rule set's limits (no limit = uncapped)
+    limits = rules.deduction_limits
+    old_tax = calculate_old_regime_arrays(
+        columns["income"], columns["age"], columns["is_salaried"],
+        np.minimum(columns["deductions_80c"], limits.get("80C", np.inf)),
+        np.minimum(columns["health_insurance_premium"], limits.get("80D", np.inf)),
+        rules
+    )["final_tax"]
+    # Optimal: everyone files under the cheaper regime (a tie goes to the default new regime)
+    chose_new = new_tax <= old_tax if regime_choice == "optimal" else columns["is_new_regime"]
+    return np.where(chose_new, new_tax, old_tax), chose_new
+
+def _rate(tax: np.ndarray, income: np.ndarray) -> np.ndarray:
+    return np.where(income > 0, tax / np.where(income > 0, income, 1) * 100, 0.0)
+
+def run_scenario(baseline: TaxRuleSet,
+                 alternative: TaxRuleSet,
+                 population: Any,
+                 chunk_size: int = 250000,
+                 income_bands: Sequence[float] = DEFAULT_INCOME_BANDS,
+                 regime_choice: str = "optimal",
+                 tolerance: float = 1.0) -> Dict[str, Any]:
+    """
+    Revenue delta, winners / losers and effective rate change per income band
+    
+    population is a SyntheticPopulation or FilePopulation. A person wins (loses)
+    when the alternative changes their tax by more than tolerance rupees.
+    """
+    if regime_choice not in REGIME_CHOICES:
+        raise ValueError(f"regime_choice must be one of {', '.join(REGIME_CHOICES)}")
+    edges = np.asarray(sorted(income_bands), dtype=np.float64)
+    if edges.size == 0 or edges[0] > 0:
+        edges = np.concatenate([[0.0], edges])
+    bands = edges.size
+    totals = {key: np.zeros(bands) for key in ("people", "income", "baseline_tax", "alternative_tax",
+                                               "winners", "losers")}
+    new_regime_people = {"baseline": 0, "alternative": 0}
+    chunks = 0
+    
+    for columns in population.chunks(chunk_size, baseline):
+        if columns["income"].size == 0:
+            continue
+        chunks += 1
+        # Step 1: Both rule sets over the same people
+        baseline_tax, baseline_new = _chunk_tax(baseline, columns, regime_choice)
+        alternative_tax, alternative_new = _chunk_tax(alternative, columns, regime_choice)
+        delta = alternative_tax - baseline_tax
+        new_regime_people["baseline"] += int(baseline_new.sum())
+        new_regime_people["alternative"] += int(alternative_new.sum())
+    
+        # Step 2: Fold the chunk into per-band totals
+        band = np.searchsorted(edges, columns["income"], side="right") - 1
+        for key, weights in (("people", None), ("income", columns["income"]),
+                             ("baseline_tax", baseline_tax), ("alternative_tax", alternative_tax),
+                             ("winners", delta < -tolerance), ("losers", delta > tolerance)):
+            totals[key] += np.bincount(band, weights=weights, minlength=bands)
+    
+    # Step 3: Revenue and per-band rates from the totals
+    people = int(totals["people"].sum())
+    baseline_revenue = float(totals["baseline_tax"].sum())
+    alternative_revenue = float(totals["alternative_tax"].sum())
+    baseline_rate = _rate(totals["baseline_tax"], totals["income"])
+    alternative_rate = _rate(totals["alternative_tax"], totals["income"])
+    
+    return {
+        "population": {**population.describe(), "people": people, "chunks": chunks},
+        "regime_choice": regime_choice,
+        "rule_sets": {"baseline": baseline.describe(), "alternative": alternative.describe()},
+        "revenue": {
+            "baseline": baseline_revenue,
+            "alternative": alternative_revenue,
+            "delta": alternative_revenue - baseline_revenue,
+            "delta_percent": (alternative_revenue - baseline_revenue) / baseline_revenue * 100 if baseline_revenue else None
+        },
+        "new_regime_share": {
+            name: count / people if people else None for name, count in new_regime_people.items()
+        },
+        "bands": {
+            "band_start": edges.tolist(),
+            "band_end": [*edges[1:].tolist(), None],
+            "people": totals["people"].astype(np.int64).tolist(),
+            "baseline_tax": np.round(totals["baseline_tax"], 2).tolist(),
+            "alternative_tax": np.round(totals["alternative_tax"], 2).tolist(),
+            "revenue_delta": np.round(totals["alternative_tax"] - totals["baseline_tax"], 2).tolist(),
+            "winners": totals["winners"].astype(np.int64).tolist(),
+            "losers": totals["losers"].astype(np.int64).tolist(),
+            "unchanged": (totals["people"] - totals["winners"] - totals["losers"]).astype(np.int64).tolist(),
+            "baseline_effective_rate": np.round(baseline_rate, 4).tolist(),
+            "alternative_effective_rate": np.round(alternative_rate, 4).tolist(),
+            "effective_rate_change": np.round(alternative_rate - baseline_rate, 4).tolist()
+        }
+    }
@@ -0,0 +1,203 @@
+"""
+Compiled slab tables - progressive tax schedules as piecewise-linear functions
+Each schedule is compiled once into slab lower bounds, rates and the cumulative
+tax at every bound, so tax for any income is a bisect plus one multiply
+"""
+import math
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BASIS_POINTS = 10000  # 100% in basis points
+MAX_ARRAY_PAISE = 10 ** 14  # Largest income the int64 paths take without overflow (₹1 lakh crore)
+
+def format_rate(rate: float) -> str:
+    """Display form of a slab rate, e.g. 0.25 -> '25%'"""
+    return f"{rate * 100:g}%"
+
+def to_paise(amount: float) -> int:
+    """Rupees to integer paise; half a paisa rounds up, exactly as to_paise_array"""
+    return math.floor(amount * 100 + 0.5)
+
+def to_paise_array(amounts: np.ndarray) -> np.ndarray:
+    """Vectorized to_paise()"""
+    return np.floor(np.asarray(amounts, dtype=np.float64) * 100 + 0.5).astype(np.int64)
+
+def div_half_up(numerator, denominator: int):
+    """Integer division rounding half up; works on ints and int64 arrays (numerator >= 0)"""
+    return (numerator + denominator // 2) // denominator
+
+def rate_to_basis_points(rate: float) -> int:
+    """Fractional rate to integer basis points, e.g. 0.04 -> 400"""
+    basis_points = round(rate * BASIS_POINTS)
+    if abs(rate * BASIS_POINTS - basis_points) > 1e-6:
+        raise ValueError(f"Rate {format_rate(rate)} is finer than a basis point")
+    return basis_points
+
+class SlabTable:
+    """Immutable compiled slab schedule"""
+    
+    __slots__ = ("lower_bounds", "widths", "rates", "cumulative_tax",
+                 "descriptions", "rate_labels", "_bounds_array",
+                 "_rates_array", "_cumulative_array")
+    
+    def __init__(self, slabs: Sequence[Tuple[float, float, str]]):
+        """slabs: (width, rate, description) from the lowest slab up; the last width may be inf"""
+        lower_bounds, cumulative_tax = [], []
+        lower, tax = 0.0, 0
+        for width, rate, _ in slabs:
+            lower_bounds.append(lower)
+            cumulative_tax.append(tax)
+            # Same accumulation order as walking the slabs, so results are unchanged
+            tax += width * rate
+            lower += width
+        
+        self.lower_bounds = tuple(lower_bounds)
+        self.widths = tuple(width for width, _, _ in slabs)
+        self.rates = tuple(rate for _, rate, _ in slabs)
+        self.cumulative_tax = tuple(cumulative_tax)
+        self.descriptions = tuple(description for _, _, description in slabs)
+        self.rate_labels = tuple(format_rate(rate) for rate in self.rates)
+        
+        self._bounds_array = np.array(self.lower_bounds)
+        self._rates_array = np.array(self.rates)
+        self._cumulative_array = np.array(self.cumulative_tax, dtype=np.float64)
+    
+    def slab_index(self, income: float) -> int:
+        """Index of the slab containing income (an income on a bound belongs to the upper slab)"""
+        return max(0, bisect_right(self.lower_bounds, income) - 1)
+    
+    def tax(self, income: float) -> float:
+        """Tax before cess on income"""
+        if income <= 0:
+            return 0
+        index = bisect_right(self.lower_bounds, income) - 1
+        return self.cumulative_tax[index] + (income - self.lower_bounds[index]) * self.rates[index]
+    
+    def income_for_tax(self, tax: float) -> float:
+        """Inverse of tax(): the largest income whose tax does not exceed the given tax"""
+        if tax < 0:
+            return 0.0
+        # bisect_right skips zero-rate slabs, whose upper neighbour has the same cumulative tax
+        index = bisect_right(self.cumulative_tax, tax) - 1
+        if self.rates[index] == 0:
+            return float('inf')
+        return self.lower_bounds[index] + (tax - self.cumulative_tax[index]) / self.rates[index]
+    
+    def marginal_rate(self, income: float) -> float:
+        """Rate applied to the next rupee of income"""
+        return self.rates[self.slab_index(income)]
+    
+    def breakdown(self, income: float, label_key: str = "slab") -> List[Dict[str, Any]]:
+        """Per-slab taxable amount and tax for income"""
+        breakdown = []
+        if income <= 0:
+            return breakdown
+        
+        for index in range(self.slab_index(income) + 1):
+            amount = min(income - self.lower_bounds[index], self.widths[index])
+            if amount > 0:
+                breakdown.append({
+                    label_key: self.descriptions[index],
+                    "rate": self.rate_labels[index],
+                    "taxable_amount": amount,
+                    "tax": amount * self.rates[index]
+                })
+        return breakdown
+    
+    def tax_array(self, incomes: np.ndarray) -> np.ndarray:
+        """Vectorized tax(): one searchsorted and one multiply-add per element"""
+        incomes = np.maximum(incomes, 0)
+        index = np.searchsorted(self._bounds_array, incomes, side="right") - 1
+        return self._cumulative_array[index] + (incomes - self._bounds_array[index]) * self._rates_array[index]
+    
+    def slab_index_array(self, incomes: np.ndarray) -> np.ndarray:
+        """Vectorized slab_index()"""
+        return np.maximum(np.searchsorted(self._bounds_array, incomes, side="right") - 1, 0)
+    
+    def marginal_rate_array(self, incomes: np.ndarray) -> np.ndarray:
+        return self._rates_array[self.slab_index_array(incomes)]
+    
+    def slab_amounts_array(self, incomes: np.ndarray) -> np.ndarray:
+        """(n, slabs) matrix of income falling in each slab"""
+        amounts = np.asarray(incomes, dtype=np.float64)[:, None] - self._bounds_array[None, :]
+        return np.clip(amounts, 0, np.array(self.widths))
+    
+    def __len__(self) -> int:
+        return len(self.rates)
+
+class PaiseSlabTable:
+    """
+    Integer twin of a SlabTable: bounds in paise, rates in basis points
+    
+    Cumulative tax is kept exactly in paise x basis points, so tax for any
+    income is one integer multiply-add and a single half-up rounding to the
+    paisa - no float error, identical on every machine.
+    """
+    
+    __slots__ = ("lower_bounds", "widths", "rates_bp", "cumulative_tax",
+                 "_bounds_array", "_rates_array", "_cumulative_array")
+    
+    def __init__(self, table: SlabTable):
+        lower_bounds, widths, rates_bp, cumulative_tax = [], [], [], []
+        lower, tax = 0, 0
+        for width, rate in zip(table.widths, table.rates):
+            rate_bp = rate_to_basis_points(rate)
+            width_paise = None if math.isinf(width) else to_paise(width)
+            lower_bounds.append(lower)
+            widths.append(width_paise)
+            rates_bp.append(rate_bp)
+            cumulative_tax.append(tax)
+            if width_paise is not None:
+                tax += width_paise * rate_bp
+                lower += width_paise
+        
+        self.lower_bounds = tuple(lower_bounds)
+        self.widths: Tuple[Optional[int], ...] = tuple(widths)
+        self.rates_bp = tuple(rates_bp)
+        self.cumulative_tax = tuple(cumulative_tax)  # paise x basis points
+        
+        self._bounds_array = np.array(self.lower_bounds, dtype=np.int64)
+        self._rates_array = np.array(self.rates_bp, dtype=np.int64)
+        self._cumulative_array = np.array(self.cumulative_tax, dtype=np.int64)
+    
+    def tax_scaled(self, income: int) -> int:
+        """Unrounded tax before cess in paise x basis points on an income in paise"""
+        if income <= 0:
+            return 0
+        index = bisect_right(self.lower_bounds, income) - 1
+        return self.cumulative_tax[index] + (income - self.lower_bounds[index]) * self.rates_bp[index]
+    
+    def tax(self, income: int) -> int:
+        """Tax before cess in paise on an income in paise"""
+        return div_half_up(self.tax_scaled(income), BASIS_POINTS)
+    
+    def slab_amounts(self, income: int) -> List[Tuple[int, int, int]]:
+        """(slab index, taxable paise, tax paise) for every slab income reaches"""
+        amounts = []
+        if income <= 0:
+            return amounts
+        
+        for index in range(bisect_right(self.lower_bounds, income)):
+            amount = income - self.lower_bounds[index]
+            if self.widths[index] is not None:
+                amount = min(amount, self.widths[index])
+            if amount > 0:
+                amounts.append((index, amount, div_half_up(amount * self.rates_bp[index], BASIS_POINTS)))
+        return amounts
+    
+    def tax_scaled_array(self, incomes: np.ndarray) -> np.ndarray:
+        """Vectorized tax_scaled() over int64 paise"""
+        incomes = np.maximum(incomes, 0)
+        if incomes.size and incomes.max() > MAX_ARRAY_PAISE:
+            raise ValueError("Income exceeds the fixed-point array range")
+        index = np.searchsorted(self._bounds_array, incomes, side="right") - 1
+        return self._cumulative_array[index] + (incomes - self._bounds_array[index]) * self._rates_array[index]
+    
+    def tax_array(self, incomes: np.ndarray) -> np.ndarray:
+        """Vectorized tax() over int64 paise"""
+        return div_half_up(self.tax_scaled_array(incomes), BASIS_POINTS)
+    
+    def __len__(self) -> int:
+        return len(self.rates_bp)
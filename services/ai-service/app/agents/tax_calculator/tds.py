@@ -0,0 +1,314 @@
+"""
+TDS Projection - month-by-month salary withholding (section 192) over the FY calculators
+
+A TdsLedger keeps every employee's year-to-date income and tax deducted as
+columns. Payroll events (joins, salary revisions, bonuses, 80C / 80D
+declarations, exits) only mark the employees they touch; closing a month
+re-evaluates the projected annual tax for those employees alone, in one
+vectorized pass, and spreads the tax still due over the remaining months.
+Everyone else reuses their cached annual tax.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+from pydantic import ValidationError
+
+from .calculator_fy2025 import TaxCalculationInput
+from .fixed_point import ENGINES, calculate_tax_arrays_exact, calculate_tax_with_engine
+from .rules import TaxRuleSet, rule_registry
+from .vectorized import calculate_tax_arrays
+from ...models.tax_models import TdsEmployee, TdsEvent
+
+FY_MONTHS = ("Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", "Jan", "Feb", "Mar")
+
+# Ledger columns: persisted employee state, then pending events and the cached projection
+_DTYPES = {
+    "monthly_salary": np.float64,
+    "age": np.int64,
+    "is_new_regime": bool,
+    "is_salaried": bool,
+    "deductions_80c": np.float64,
+    "health_insurance_premium": np.float64,
+    "income_to_date": np.float64,
+    "tds_to_date": np.float64,
+    "active": bool,
+    "bonus": np.float64,
+    "exiting": bool,
+    "dirty": bool,
+    "projected_income": np.float64,
+    "annual_tax": np.float64
+}
+
+def _round_rupee(amounts: np.ndarray) -> np.ndarray:
+    """TDS is deducted in whole rupees (s.288B)"""
+    return np.floor(amounts + 0.5)
+
+class TdsLedger:
+    """Year-to-date payroll tax state of one employer for one financial year"""
+    
+    def __init__(self, financial_year: Optional[str] = None, engine: str = "float", months_closed: int = 0):
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+        if not 0 <= months_closed <= len(FY_MONTHS):
+            raise ValueError("months_closed must be between 0 and 12")
+        self.financial_year = rule_registry.get(financial_year).financial_year
+        self.engine = engine
+        self.months_closed = months_closed
+        self.employee_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.columns = {name: np.zeros(0, dtype=dtype) for name, dtype in _DTYPES.items()}
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Any], **options: Any) -> "TdsLedger":
+        """Ledger over TdsEmployee-shaped records (dicts or models)"""
+        ledger = cls(**options)
+        employees = []
+        for index, record in enumerate(records):
+            try:
+                employees.append(record if isinstance(record, TdsEmployee) else TdsEmployee(**record))
+            except (TypeError, ValidationError) as e:
+                raise ValueError(f"Employee record {index} is invalid: {e}") from e
+        ledger.add_employees(employees)
+        return ledger
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TdsLedger":
+        """Inverse of to_state(); the cached projections are restored so no one is recalculated"""
+        ledger = cls.from_records(
+            state["employees"],
+            financial_year=state["financial_year"],
+            engine=state.get("engine", "float"),
+            months_closed=state["months_closed"]
+        )
+        columns = ledger.columns
+        for row, employee in enumerate(state["employees"]):
+            if employee.get("projected_annual_income") is not None:
+                columns["projected_income"][row] = employee["projected_annual_income"]
+                columns["annual_tax"][row] = employee["projected_annual_tax"]
+                columns["dirty"][row] = False
+        return ledger
+    
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-safe snapshot; take it after close_month, pending events are not kept"""
+        columns = self.columns
+        projected_income = columns["projected_income"]
+        employees = []
+        for row, employee_id in enumerate(self.employee_ids):
+            employees.append({
+                "employee_id": employee_id,
+                "monthly_salary": float(columns["monthly_salary"][row]),
+                "age": int(columns["age"][row]),
+                "regime": "new" if columns["is_new_regime"][row] else "old",
+                "is_salaried": bool(columns["is_salaried"][row]),
+                "deductions_80c": float(columns["deductions_80c"][row]),
+                "health_insurance_premium": float(columns["health_insurance_premium"][row]),
+                "income_to_date": float(columns["income_to_date"][row]),
+                "tds_to_date": float(columns["tds_to_date"][row]),
+                "active": bool(columns["active"][row]),
+                "projected_annual_income": None if np.isnan(projected_income[row]) else float(projected_income[row]),
+                "projected_annual_tax": float(columns["annual_tax"][row])
+            })
+        return {
+            "financial_year": self.financial_year,
+            "engine": self.engine,
+            "months_closed": self.months_closed,
+            "employees": employees
+        }
+    
+    def __len__(self) -> int:
+        return len(self.employee_ids)
+    
+    def add_employees(self, employees: List[TdsEmployee]) -> None:
+        """Append employees in one concatenation per column"""
+        if not employees:
+            return
+        for employee in employees:
+            if employee.employee_id in self._rows:
+                raise ValueError(f"Employee {employee.employee_id} is already on the ledger")
+            self._rows[employee.employee_id] = len(self.employee_ids)
+            self.employee_ids.append(employee.employee_id)
+        
+        added = {
+            "monthly_salary": [e.monthly_salary for e in employees],
+            "age": [e.age for e in employees],
+            "is_new_regime": [e.regime == "new" for e in employees],
+            "is_salaried": [e.is_salaried for e in employees],
+            "deductions_80c": [e.deductions_80c for e in employees],
+            "health_insurance_premium": [e.health_insurance_premium for e in employees],
+            "income_to_date": [e.income_to_date for e in employees],
+            "tds_to_date": [e.tds_to_date for e in employees],
+            "active": [e.active for e in employees]
+        }
+        count = len(employees)
+        for name, dtype in _DTYPES.items():
+            if name in added:
+                values = np.asarray(added[name], dtype=dtype)
+            elif name == "dirty":
+                values = np.ones(count, dtype=bool)
+            elif name == "projected_income":
+                values = np.full(count, np.nan)
+            else:
+                values = np.zeros(count, dtype=dtype)
+            self.columns[name] = np.concatenate([self.columns[name], values])
+    
+    def _row(self, employee_id: Optional[str]) -> int:
+        if employee_id not in self._rows:
+            raise ValueError(f"Unknown employee {employee_id}")
+        return self._rows[employee_id]
+    
+    def apply_event(self, event: Union[TdsEvent, Dict[str, Any]]) -> None:
+        """Record one payroll event for the next month to close; nothing is recalculated yet"""
+        if not isinstance(event, TdsEvent):
+            try:
+                event = TdsEvent(**event)
+            except (TypeError, ValidationError) as e:
+                raise ValueError(f"Invalid payroll event: {e}") from e
+        if event.type == "join":
+            self.add_employees([event.employee])
+            return
+        
+        columns = self.columns
+        row = self._row(event.employee_id)
+        if event.type == "salary":
+            columns["monthly_salary"][row] = event.amount
+        elif event.type == "bonus":
+            columns["bonus"][row] += event.amount
+        elif event.type == "declaration":
+            if event.deductions_80c is not None:
+                columns["deductions_80c"][row] = event.deductions_80c
+            if event.health_insurance_premium is not None:
+                columns["health_insurance_premium"][row] = event.health_insurance_premium
+        elif event.type == "exit":
+            columns["exiting"][row] = True
+        columns["dirty"][row] = True
+    
+    def apply_events(self, events: Iterable[Union[TdsEvent, Dict[str, Any]]]) -> int:
+        count = 0
+        for event in events:
+            self.apply_event(event)
+            count += 1
+        return count
+    
+    def _next_month(self) -> int:
+        if self.months_closed >= len(FY_MONTHS):
+            raise ValueError(f"All months of FY {self.financial_year} are already closed")
+        return self.months_closed + 1
+    
+    def _projection(self, month: int) -> Dict[str, np.ndarray]:
+        """This month's pay and the projected annual income, assuming no further events"""
+        columns = self.columns
+        salary = np.where(columns["active"], columns["monthly_salary"], 0.0)
+        pay = salary + columns["bonus"]
+        later_months = np.where(columns["exiting"], 0, len(FY_MONTHS) - month)
+        return {"pay": pay, "projected_income": columns["income_to_date"] + pay + salary * later_months,
+                "months_left": later_months + 1}
+    
+    def _annual_tax(self, rows: np.ndarray, projected_income: np.ndarray, rules: TaxRuleSet) -> np.ndarray:
+        """Projected annual tax of the given rows in one vectorized pass"""
+        columns = self.columns
+        arguments = dict(
+            gross_income=projected_income,
+            age=columns["age"][rows],
+            regime=np.where(columns["is_new_regime"][rows], "new", "old"),
+            is_salaried=columns["is_salaried"][rows],
+            deductions_80c=columns["deductions_80c"][rows],
+            health_insurance_premium=columns["health_insurance_premium"][rows],
+            rules=rules
+        )
+        if self.engine == "float":
+            return calculate_tax_arrays(**arguments)["final_tax"]
+        return calculate_tax_arrays_exact(**arguments, statutory=self.engine == "statutory")["final_tax"]
+    
+    def close_month(self, events: Iterable[Union[TdsEvent, Dict[str, Any]]] = ()) -> Dict[str, Any]:
+        """
+        Apply the month's events, then compute every active employee's TDS
+        
+        Only employees with events (or whose projected income moved) have their
+        annual tax recalculated. Returns the month's register as columns.
+        """
+        month = self._next_month()
+        events_applied = self.apply_events(events)
+        columns = self.columns
+        rules = rule_registry.get(self.financial_year)
+        
+        # Step 1: Re-project the stale employees only
+        projection = self._projection(month)
+        projected_income = projection["projected_income"]
+        stale = columns["dirty"] | (projected_income != columns["projected_income"])
+        rows = np.flatnonzero(stale)
+        if rows.size:
+            columns["annual_tax"][rows] = self._annual_tax(rows, projected_income[rows], rules)
+            columns["projected_income"][rows] = projected_income[rows]
+        
+        # Step 2: Spread the tax still due evenly over the months left (all of it on exit)
+        due = np.maximum(0.0, columns["annual_tax"] - columns["tds_to_date"])
+        tds = np.where(columns["active"], _round_rupee(due / projection["months_left"]), 0.0)
+        
+        # Step 3: Post the month
+        columns["income_to_date"] += projection["pay"]
+        columns["tds_to_date"] += tds
+        columns["active"] &= ~columns["exiting"]
+        for name in ("bonus", "exiting", "dirty"):
+            columns[name][:] = 0
+        self.months_closed = month
+        
+        return {
+            "financial_year": self.financial_year,
+            "month": month,
+            "month_name": FY_MONTHS[month - 1],
+            "employees": len(self),
+            "events_applied": events_applied,
+            "recalculated": int(rows.size),
+            "total_tds": float(tds.sum()),
+            "register": {
+                "employee_id": list(self.employee_ids),
+                "gross_pay": projection["pay"].tolist(),
+                "tds": tds.tolist(),
+                "income_to_date": columns["income_to_date"].tolist(),
+                "tds_to_date": columns["tds_to_date"].tolist(),
+                "projected_annual_income": columns["projected_income"].tolist(),
+                "projected_annual_tax": columns["annual_tax"].tolist()
+            }
+        }
+    
+    def project(self, employee_id: str) -> Dict[str, Any]:
+        """
+        Remaining-month TDS schedule of one employee, including pending events
+        Read-only: the ledger is not advanced
+        """
+        row = self._row(employee_id)
+        month = self._next_month()
+        columns = self.columns
+        projection = self._projection(month)
+        projected_income = float(projection["projected_income"][row])
+        annual_tax = float(calculate_tax_with_engine(TaxCalculationInput(
+            gross_income=projected_income,
+            age=int(columns["age"][row]),
+            regime="new" if columns["is_new_regime"][row] else "old",
+            is_salaried=bool(columns["is_salaried"][row]),
+            deductions_80c=float(columns["deductions_80c"][row]),
+            health_insurance_premium=float(columns["health_insurance_premium"][row]),
+            financial_year=self.financial_year
+        ), self.engine, include_breakdown=False)["final_tax"])
+        
+        # Same spreading as close_month, one month at a time
+        months_left = int(projection["months_left"][row]) if columns["active"][row] else 0
+        salary = float(columns["monthly_salary"][row])
+        due = max(0.0, annual_tax - float(columns["tds_to_date"][row]))
+        schedule = {"month": [], "gross_pay": [], "tds": []}
+        for offset in range(months_left):
+            tds = float(_round_rupee(due / (months_left - offset)))
+            due -= tds
+            schedule["month"].append(FY_MONTHS[month - 1 + offset])
+            schedule["gross_pay"].append(float(projection["pay"][row]) if offset == 0 else salary)
+            schedule["tds"].append(tds)
+        
+        return {
+            "employee_id": employee_id,
+            "financial_year": self.financial_year,
+            "projected_annual_income": projected_income,
+            "projected_annual_tax": annual_tax,
+            "income_to_date": float(columns["income_to_date"][row]),
+            "tds_to_date": float(columns["tds_to_date"][row]),
+            "schedule": schedule
+        }
@@ -0,0 +1,193 @@
+"""
+Vectorized FY 2025-26 tax engine - NumPy arrays in, NumPy arrays out
+Evaluates the same compiled rule set and slab tables as calculator_fy2025
+operation for operation, so every element is bit-identical to the scalar
+result; breakdowns are only built on request
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .rules import RegimeRules, TaxRuleSet, rule_registry
+
+ArrayLike = Union[float, int, bool, str, np.ndarray, List[Any]]
+
+def _effective_rate(final_tax: np.ndarray, gross_income: np.ndarray) -> np.ndarray:
+    safe_income = np.where(gross_income > 0, gross_income, 1)
+    return np.where(gross_income > 0, final_tax / safe_income * 100, 0.0)
+
+def _basic_exemption_array(regime: RegimeRules, age: np.ndarray) -> np.ndarray:
+    exemptions = regime.basic_exemptions
+    return np.where(age >= 80, float(exemptions["super_senior"]),
+                    np.where(age >= 60, float(exemptions["senior"]), float(exemptions["regular"])))
+
+def calculate_new_regime_arrays(gross_income: np.ndarray,
+                                age: np.ndarray,
+                                is_salaried: np.ndarray,
+                                rules: TaxRuleSet,
+                                include_breakdown: bool = False) -> Dict[str, np.ndarray]:
+    """Array version of calculate_new_regime_tax_fy2025"""
+    regime = rules.new
+    
+    standard_deduction = np.where(is_salaried, float(regime.standard_deduction), 0.0)
+    income_after_std_deduction = np.maximum(0, gross_income - standard_deduction)
+    
+    basic_exemption = _basic_exemption_array(regime, age)
+    taxable_income = np.maximum(0, income_after_std_deduction - basic_exemption)
+    
+    tax = regime.table.tax_array(taxable_income)
+    tax_with_cess = tax * rules.cess_multiplier
+    
+    rebate_87a = np.where(income_after_std_deduction <= regime.rebate_income_limit,
+                          np.minimum(tax_with_cess, regime.rebate_max), 0.0)
+    final_tax = np.maximum(0, tax_with_cess - rebate_87a)
+    
+    result = {
+        "gross_income": gross_income,
+        "standard_deduction": standard_deduction,
+        "basic_exemption": basic_exemption,
+        "taxable_income": taxable_income,
+        "tax_before_cess": tax,
+        "cess": tax * rules.cess_rate,
+        "tax_after_cess": tax_with_cess,
+        "rebate_87a": rebate_87a,
+        "final_tax": final_tax,
+        "effective_rate": _effective_rate(final_tax, gross_income)
+    }
+    if include_breakdown:
+        result["slab_taxable"] = regime.table.slab_amounts_array(taxable_income)
+    return result
+
+def calculate_old_regime_arrays(gross_income: np.ndarray,
+                                age: np.ndarray,
+                                is_salaried: np.ndarray,
+                                deductions_80c: np.ndarray,
+                                health_insurance_premium: np.ndarray,
+                                rules: TaxRuleSet,
+                                include_breakdown: bool = False) -> Dict[str, np.ndarray]:
+    """Array version of calculate_old_regime_tax_fy2025"""
+    regime = rules.old
+    
+    basic_exemption = _basic_exemption_array(regime, age)
+    
+    total_deductions = deductions_80c + health_insurance_premium
+    standard_deduction = np.where(is_salaried, float(regime.standard_deduction), 0.0)
+    income_after_deductions = np.maximum(0, gross_income - standard_deduction - total_deductions)
+    taxable_income = np.maximum(0, income_after_deductions - basic_exemption)
+    
+    tax = regime.table.tax_array(taxable_income)
+    tax_with_cess = tax * rules.cess_multiplier
+    
+    rebate_87a = np.where(income_after_deductions <= regime.rebate_income_limit,
+                          np.minimum(tax_with_cess, regime.rebate_max), 0.0)
+    final_tax = np.maximum(0, tax_with_cess - rebate_87a)
+    
+    result = {
+        "gross_income": gross_income,
+        "total_deductions": total_deductions,
+        "basic_exemption": basic_exemption,
+        "taxable_income": taxable_income,
+        "tax_before_cess": tax,
+        "cess": tax * rules.cess_rate,
+        "tax_after_cess": tax_with_cess,
+        "rebate_87a": rebate_87a,
+        "final_tax": final_tax,
+        "effective_rate": _effective_rate(final_tax, gross_income)
+    }
+    if include_breakdown:
+        result["slab_taxable"] = regime.table.slab_amounts_array(taxable_income)
+    return result
+
+def input_columns(gross_income: ArrayLike,
+                  age: ArrayLike,
+                  regime: ArrayLike,
+                  is_salaried: ArrayLike,
+                  deductions_80c: ArrayLike,
+                  health_insurance_premium: ArrayLike) -> Tuple[np.ndarray, ...]:
+    """
+    Broadcast mixed scalar / array inputs to equal-length columns
+    Returns (gross_income, age, is_new_regime, is_salaried, deductions_80c, health_insurance_premium)
+    """
+    gross_income = np.atleast_1d(np.asarray(gross_income, dtype=np.float64))
+    n = gross_income.shape[0]
+    
+    def column(values, dtype) -> np.ndarray:
+        return np.broadcast_to(np.asarray(values, dtype=dtype), (n,))
+    
+    if isinstance(regime, str):
+        is_new_regime = np.full(n, regime.lower() == "new")
+    else:
+        regime = column(regime, str)
+        is_new_regime = regime == "new"
+        if not (is_new_regime | (regime == "old")).all():
+            is_new_regime = np.char.lower(regime) == "new"  # slow path for mixed case
+    return (
+        gross_income,
+        column(age, np.int64),
+        is_new_regime,
+        column(is_salaried, bool),
+        column(deductions_80c, np.float64),
+        column(health_insurance_premium, np.float64)
+    )
+
+def calculate_tax_arrays(gross_income: ArrayLike,
+                         age: ArrayLike = 30,
+                         regime: ArrayLike = "new",
+                         is_salaried: ArrayLike = True,
+                         deductions_80c: ArrayLike = 0,
+                         health_insurance_premium: ArrayLike = 0,
+                         include_breakdown: bool = False,
+                         financial_year: Optional[str] = None,
+                         rules: Optional[TaxRuleSet] = None) -> Dict[str, Any]:
+    """
+    Calculate FY 2025-26 tax for whole arrays of taxpayers in one pass
+    
+    Scalars broadcast against arrays. regime may be one string or an array of
+    "new"/"old". Returns the scalar calculators' numeric fields as float arrays
+    plus a boolean "is_new_regime" and the "rule_set" used; with
+    include_breakdown=True also "slab_taxable_new"/"slab_taxable_old" for
+    breakdown_for().
+    """
+    rules = rules or rule_registry.get(financial_year)
+    gross_income, age, is_new_regime, is_salaried, deductions_80c, health_insurance_premium = input_columns(
+        gross_income, age, regime, is_salaried, deductions_80c, health_insurance_premium
+    )
+    
+    new = calculate_new_regime_arrays(gross_income, age, is_salaried, rules, include_breakdown)
+    old = calculate_old_regime_arrays(gross_income, age, is_salaried, deductions_80c,
+                                      health_insurance_premium, rules, include_breakdown)
+    
+    result = {"gross_income": gross_income, "is_new_regime": is_new_regime, "rule_set": rules}
+    for key in ("basic_exemption", "taxable_income", "tax_before_cess", "cess",
+                "tax_after_cess", "rebate_87a", "final_tax", "effective_rate"):
+        result[key] = np.where(is_new_regime, new[key], old[key])
+    result["standard_deduction"] = np.where(is_new_regime, new["standard_deduction"], 0.0)
+    result["total_deductions"] = np.where(is_new_regime, 0.0, old["total_deductions"])
+    
+    if include_breakdown:
+        result["slab_taxable_new"] = new["slab_taxable"]
+        result["slab_taxable_old"] = old["slab_taxable"]
+    return result
+
+def breakdown_for(result: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+    """Materialize the scalar-style breakdown list for one row of calculate_tax_arrays"""
+    if "slab_taxable_new" not in result:
+        raise ValueError("calculate_tax_arrays was called without include_breakdown=True")
+    
+    rules = result["rule_set"]
+    if result["is_new_regime"][index]:
+        table, slab_taxable = rules.new.table, result["slab_taxable_new"][index]
+    else:
+        table, slab_taxable = rules.old.table, result["slab_taxable_old"][index]
+    
+    breakdown = []
+    for description, rate_label, rate, amount in zip(table.descriptions, table.rate_labels,
+                                                     table.rates, slab_taxable):
+        if amount > 0:
+            breakdown.append({
+                "slab": description,
+                "rate": rate_label,
+                "taxable_amount": float(amount),
+                "tax": float(amount * rate)
+            })
+    return breakdown
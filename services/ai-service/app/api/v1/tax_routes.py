@@ -1,17 +1,48 @@
 """
 Tax Calculation API Routes - WITH AI INSIGHTS INTEGRATION
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Any, Awaitable, Iterator, List, Optional, Tuple
+import asyncio
+import json
+import orjson
 import time
 import logging
 
-from ...agents.tax_calculator.calculator_fy2025 import (
-    calculate_new_regime_tax_fy2025,
-    calculate_old_regime_tax_fy2025,
-    TaxCalculationInput
+from ...agents.tax_calculator.batch import BATCH_COLUMNS, iter_batch_results, parse_csv_records
+from ...agents.tax_calculator.calculator_fy2025 import CompactTaxResult, TaxCalculationInput
+from ...agents.tax_calculator.deduction_optimizer import (
+    optimize_deductions_fy2025,
+    DeductionOptimizationInput
+)
+from ...agents.tax_calculator.fixed_point import calculate_tax_with_engine
+from ...agents.tax_calculator.income_sweep import income_sweep_fy2025, sweep_points
+from ...agents.tax_calculator.portfolio import MIN_RATE_BIN_WIDTH, analyze_portfolio
+from ...agents.tax_calculator.regime_comparison import compare_regimes_fy2025
+from ...agents.tax_calculator.reverse_calculator import reverse_calculate_fy2025
+from ...agents.tax_calculator.scenario import (
+    DEFAULT_INCOME_BANDS,
+    SyntheticPopulation,
+    build_scenario_rules,
+    run_scenario
+)
+from ...agents.tax_calculator.rules import rule_registry
+from ...agents.tax_calculator.tds import TdsLedger
+from ...core.config import settings
+from ...core.metrics import observe_validation, stage_duration
+from ...models.tax_models import (
+    DeductionOptimizationRequest,
+    IncomeSweepRequest,
+    ReverseCalculationRequest,
+    ScenarioRequest,
+    TaxData,
+    TdsProjectionRequest
 )
-from ...models.tax_models import TaxData
 from ...services.ai_service import ai_service
+from ...services.insight_cache import insight_cache
+from ...services.insight_jobs import insight_jobs, INSIGHTS_FALLBACK
 
 router = APIRouter(prefix="/tax", tags=["ai-powered-tax-calculation"])
 logger = logging.getLogger(__name__)
@@ -21,74 +52,593 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "ai-powered-tax-calculation",
-        "ai_enabled": ai_service.is_available(),
+        "ai_enabled": ai_service.status() == "available",
+        "ai_status": ai_service.status(),
         "compliance": "FY 2025-26 Budget 2025 Compliant",
-        "model": "Claude 3 Haiku" if ai_service.is_available() else "None"
+        "model": "Claude 3 Haiku" if ai_service.status() == "available" else "None"
     }
 
+def _calculation_input(tax_data: TaxData) -> TaxCalculationInput:
+    return TaxCalculationInput(
+        gross_income=tax_data.income,
+        age=tax_data.age,
+        regime=tax_data.regime,
+        is_salaried=tax_data.is_salaried,
+        deductions_80c=tax_data.deductions_80c,
+        health_insurance_premium=tax_data.health_insurance_premium,
+        financial_year=tax_data.financial_year
+    )
+
+def _calculate(tax_data: TaxData, include_breakdown: bool = True) -> Dict[str, Any]:
+    """Deterministic FY 2025-26 calculation for the requested regime"""
+    return calculate_tax_with_engine(_calculation_input(tax_data), settings.calculation_engine,
+                                     include_breakdown=include_breakdown)
+
+def _requested_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Comma-separated response fields, or None for the whole body"""
+    if fields is None:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    if not requested:
+        raise HTTPException(status_code=422, detail="fields must name at least one response field")
+    return requested
+
+def _select_fields(body: Dict[str, Any], requested: Optional[List[str]]) -> Dict[str, Any]:
+    if requested is None:
+        return body
+    unknown = [name for name in requested if name not in body]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown response fields: {', '.join(unknown)}")
+    return {name: body[name] for name in requested}
+
+def _ai_service_status() -> str:
+    """active | initializing | disabled, without building the Bedrock client on the event loop"""
+    status = ai_service.status()
+    if status == "available":
+        return "active"
+    return "initializing" if status == "not_initialized" else "disabled"
+
+def _latency_budget_ms(header_value: Optional[float]) -> Optional[float]:
+    """Effective end-to-end budget: the request header wins over the configured default"""
+    if header_value is not None and header_value > 0:
+        return header_value
+    return settings.calculation_latency_budget_ms
+
+async def _resolve_insights(insight_coro: Awaitable[str],
+                            async_insights: bool,
+                            budget_ms: Optional[float],
+                            start_time: float) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    Run an insight generation as a background job or inline within the latency budget
+    Returns (ai_insights, ai_insights_status, insight_id)
+    """
+    if not ai_service.enabled:
+        insight_coro.close()
+        return None, "disabled", None
+    
+    if async_insights:
+        return None, "pending", insight_jobs.submit(insight_coro).insight_id
+    
+    logger.info("Generating AI insights...")
+    insight_task = asyncio.ensure_future(insight_coro)
+    remaining_s = None
+    if budget_ms is not None:
+        remaining_s = max(0.0, budget_ms / 1000 - (time.time() - start_time))
+    
+    try:
+        return await asyncio.wait_for(asyncio.shield(insight_task), remaining_s), "completed", None
+    except asyncio.TimeoutError:
+        logger.warning(f"AI insights exceeded the {budget_ms:.0f} ms latency budget")
+        insight_id = None
+        if settings.park_timed_out_insights:
+            insight_id = insight_jobs.submit(insight_task).insight_id
+        else:
+            insight_task.cancel()
+        return None, "timed_out", insight_id
+    except Exception as e:
+        logger.error(f"AI insights generation failed: {e}")
+        return INSIGHTS_FALLBACK, "completed", None
+
 @router.post("/calculate")
-async def calculate_tax_with_ai_insights(tax_data: TaxData):
+async def calculate_tax_with_ai_insights(tax_data: TaxData,
+                                         request: Request,
+                                         async_insights: bool = False,
+                                         bypass_cache: bool = False,
+                                         compact: bool = False,
+                                         fields: Optional[str] = Query(None, description="Comma-separated response fields"),
+                                         latency_budget_ms: Optional[float] = Header(None, alias="X-Latency-Budget-Ms")):
     """
     Calculate tax using FY 2025-26 rules WITH AI-POWERED INSIGHTS
+    
+    With async_insights=true the calculation is returned immediately together
+    with an insight_id; the insights are then fetched from /tax/insights/{insight_id}.
+    bypass_cache=true forces a fresh Bedrock generation.
+    
+    Inline insights are bounded by the latency budget (X-Latency-Budget-Ms header,
+    else CALCULATION_LATENCY_BUDGET_MS). When it runs out the calculation is
+    returned with ai_insights_status="timed_out", and the unfinished generation is
+    either parked as an insight job or cancelled.
+    
+    compact=true returns only the numbers (CompactTaxResult) plus the insight
+    fields, without the slab breakdown or status strings. fields=a,b,c returns
+    just those keys of the response; the breakdown is only computed when asked for.
     """
+    observe_validation(request.scope)
     start_time = time.time()
+    budget_ms = _latency_budget_ms(latency_budget_ms)
+    requested = _requested_fields(fields)
+    include_breakdown = not compact and (requested is None or "breakdown" in requested)
     
     try:
         # Step 1: Perform deterministic tax calculation
-        calc_input = TaxCalculationInput(
-            gross_income=tax_data.income,
-            age=tax_data.age,
-            regime=tax_data.regime,
-            is_salaried=tax_data.is_salaried,
-            deductions_80c=tax_data.deductions_80c,
-            health_insurance_premium=tax_data.health_insurance_premium
+        with stage_duration.time(stage="calculation"):
+            calculation_result = _calculate(tax_data, include_breakdown)
+        
+        # Step 2: Generate AI insights (inline, or as a background job)
+        insight_coro = ai_service.generate_tax_insights(
+            tax_data=tax_data.dict(),
+            calculation_result=calculation_result,
+            use_cache=not bypass_cache
+        )
+        ai_insights, ai_insights_status, insight_id = await _resolve_insights(
+            insight_coro, async_insights, budget_ms, start_time
         )
         
-        if tax_data.regime.lower() == "new":
-            calculation_result = calculate_new_regime_tax_fy2025(calc_input)
+        # Step 3: Calculate processing time
+        processing_time = (time.time() - start_time) * 1000
+        
+        # Step 4: Return enhanced response with AI insights
+        if compact:
+            body = {
+                **CompactTaxResult.from_result(calculation_result).to_dict(),
+                "ai_insights": ai_insights,
+                "ai_insights_status": ai_insights_status,
+                "insight_id": insight_id,
+                "processing_time_ms": round(processing_time, 2)
+            }
         else:
-            calculation_result = calculate_old_regime_tax_fy2025(calc_input)
+            body = {
+                **calculation_result,
+                "ai_insights": ai_insights,
+                "ai_insights_status": ai_insights_status,
+                "ai_insights_pending": insight_id is not None,
+                "insight_id": insight_id,
+                "ai_powered": ai_service.enabled,
+                "processing_time_ms": round(processing_time, 2),
+                "ai_service_status": _ai_service_status(),
+                "message": "AI-powered FY 2025-26 tax calculation completed",
+                "budget_compliance": "Union Budget 2025 Updated with AI Analysis"
+            }
         
-        # Step 2: Generate AI insights
-        logger.info("Generating AI insights...")
-        try:
-            ai_insights = await ai_service.generate_tax_insights(
+    except Exception as e:
+        logger.error(f"Tax calculation failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"AI-powered tax calculation failed: {str(e)}"
+        )
+    
+    # Plain dict of floats and strings; orjson skips FastAPI's generic encoder
+    body = _select_fields(body, requested)
+    with stage_duration.time(stage="serialization"):
+        content = orjson.dumps(body)
+    return Response(content, media_type="application/json")
+
+@router.post("/compare")
+async def compare_tax_regimes(tax_data: TaxData,
+                              include_insights: bool = False,
+                              async_insights: bool = False,
+                              bypass_cache: bool = False,
+                              latency_budget_ms: Optional[float] = Header(None, alias="X-Latency-Budget-Ms")):
+    """
+    Compare the new and old regimes for one taxpayer in a single pass
+    
+    Reports both calculations, the savings of the recommended regime and the
+    breakeven 80C/80D deduction at which the old regime matches the new one.
+    The regime field of the input is ignored. include_insights=true adds AI
+    insights from one Bedrock call covering both regimes, with the same
+    async_insights / latency budget behaviour as /tax/calculate.
+    """
+    start_time = time.time()
+    budget_ms = _latency_budget_ms(latency_budget_ms)
+    
+    try:
+        # Step 1: Both regimes and the breakeven from one rule set
+        comparison = compare_regimes_fy2025(_calculation_input(tax_data))
+        
+        # Step 2: At most one AI insight generation for the whole comparison
+        ai_insights, ai_insights_status, insight_id = None, "not_requested", None
+        if include_insights:
+            insight_coro = ai_service.generate_comparison_insights(
                 tax_data=tax_data.dict(),
-                calculation_result=calculation_result
+                comparison=comparison,
+                use_cache=not bypass_cache
+            )
+            ai_insights, ai_insights_status, insight_id = await _resolve_insights(
+                insight_coro, async_insights, budget_ms, start_time
             )
-        except Exception as e:
-            logger.error(f"AI insights generation failed: {e}")
-            ai_insights = "AI insights temporarily unavailable due to technical issues"
-        
-        # Step 3: Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
         
-        # Step 4: Return enhanced response with AI insights
-        return {
-            **calculation_result,
+        return Response(orjson.dumps({
+            **comparison,
             "ai_insights": ai_insights,
-            "ai_powered": True,
-            "processing_time_ms": round(processing_time, 2),
-            "ai_service_status": "active" if ai_service.is_available() else "disabled",
-            "message": "AI-powered FY 2025-26 tax calculation completed",
-            "budget_compliance": "Union Budget 2025 Updated with AI Analysis"
-        }
+            "ai_insights_status": ai_insights_status,
+            "ai_insights_pending": insight_id is not None,
+            "insight_id": insight_id,
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2)
+        }), media_type="application/json")
+        
+    except Exception as e:
+        logger.error(f"Regime comparison failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Regime comparison failed: {str(e)}"
+        )
+
+@router.post("/optimize-deductions")
+async def optimize_tax_deductions(request: DeductionOptimizationRequest):
+    """
+    Tax-minimizing regime and 80C / health premium allocation within the given caps
+    
+    Deterministic and cheap enough to call on every keystroke; never calls the AI service.
+    """
+    try:
+        return optimize_deductions_fy2025(DeductionOptimizationInput(
+            gross_income=request.income,
+            age=request.age,
+            is_salaried=request.is_salaried,
+            max_80c=request.max_80c,
+            max_health_insurance_premium=request.max_health_insurance_premium,
+            financial_year=request.financial_year
+        ))
+    except Exception as e:
+        logger.error(f"Deduction optimization failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Deduction optimization failed: {str(e)}"
+        )
+
+@router.post("/reverse")
+async def reverse_calculate_tax(request: ReverseCalculationRequest):
+    """
+    Gross income that yields a target take-home (target_type="net") or target tax
+    
+    Solved per regime (both unless one is given) as an analytic inverse of the
+    FY 2025-26 calculators. Each result reports the income band above the 87A
+    rebate limit where a raise lowers take-home (rebate_cliff), and exact=false
+    when a target tax falls in the jump the rebate cliff leaves in final tax.
+    """
+    try:
+        return reverse_calculate_fy2025(
+            TaxCalculationInput(
+                gross_income=0,
+                age=request.age,
+                regime=request.regime or "new",
+                is_salaried=request.is_salaried,
+                deductions_80c=request.deductions_80c,
+                health_insurance_premium=request.health_insurance_premium,
+                financial_year=request.financial_year
+            ),
+            target_type=request.target_type,
+            target_amount=request.target_amount,
+            regimes=(request.regime,) if request.regime else ("new", "old")
+        )
+    except Exception as e:
+        logger.error(f"Reverse calculation failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Reverse calculation failed: {str(e)}"
+        )
+
+@router.post("/sweep")
+async def sweep_income_range(request: IncomeSweepRequest):
+    """
+    Tax, effective rate and marginal rate from start to stop in steps of step
+    
+    For one regime or both, with fixed age and deductions. Vectorized over the
+    whole grid and returned as columns (one list per field) for charting.
+    """
+    if request.stop < request.start:
+        raise HTTPException(status_code=422, detail="stop must not be below start")
+    points = sweep_points(request.start, request.stop, request.step)
+    if points > settings.sweep_max_points:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Sweep of {points} points exceeds the limit of {settings.sweep_max_points}"
+        )
+    
+    result = income_sweep_fy2025(
+        start=request.start,
+        stop=request.stop,
+        step=request.step,
+        age=request.age,
+        regimes=(request.regime,) if request.regime else ("new", "old"),
+        is_salaried=request.is_salaried,
+        deductions_80c=request.deductions_80c,
+        health_insurance_premium=request.health_insurance_premium,
+        financial_year=request.financial_year
+    )
+    # Plain float lists; orjson skips the generic encoder for large curves
+    return Response(orjson.dumps(result), media_type="application/json")
+
+def _stream_batch_results(records: List[Any], start_time: float) -> Iterator[bytes]:
+    """Emit the batch response as JSON chunks while rows are being calculated"""
+    yield b'{"columns":' + orjson.dumps(BATCH_COLUMNS) + b',"rows":['
+    
+    errors = []
+    succeeded = 0
+    pending = []
+    for row, error in iter_batch_results(records, engine=settings.calculation_engine):
+        if error is not None:
+            errors.append(error)
+            continue
         
+        pending.append(orjson.dumps(row))
+        succeeded += 1
+        if len(pending) >= settings.batch_stream_chunk_rows:
+            yield (b"," if succeeded > len(pending) else b"") + b",".join(pending)
+            pending = []
+    
+    if pending:
+        yield (b"," if succeeded > len(pending) else b"") + b",".join(pending)
+    
+    yield b'],"errors":' + orjson.dumps(errors) + b"," + orjson.dumps({
+        "count": len(records),
+        "succeeded": succeeded,
+        "failed": len(errors),
+        "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        "ai_powered": False,
+        "default_financial_year": rule_registry.default_year
+    })[1:]
+
+async def _read_batch_body(request: Request) -> bytes:
+    """
+    Request body of a batch upload, capped at batch_max_rows x batch_max_record_bytes
+    
+    The cap is checked against Content-Length up front and again while the body
+    streams in, so an oversized upload is rejected with 413 before it is held in
+    memory.
+    """
+    max_bytes = settings.batch_max_rows * settings.batch_max_record_bytes
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Request body exceeds the limit of {max_bytes} bytes"
+    )
+    
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+def _batch_records(payload: Any) -> List[Any]:
+    """Records of a batch payload (array or {"records": [...]}) within batch_max_rows"""
+    records = payload.get("records") if isinstance(payload, dict) else payload
+    if not isinstance(records, list):
+        raise HTTPException(
+            status_code=422,
+            detail='Expected a JSON array of records or {"records": [...]}'
+        )
+    if len(records) > settings.batch_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(records)} records exceeds the limit of {settings.batch_max_rows}"
+        )
+    return records
+
+@router.post("/calculate/batch")
+async def calculate_tax_batch(request: Request):
+    """
+    Calculate tax for many taxpayers at once (no AI insights)
+    
+    Body: a JSON array of TaxData records, or {"records": [...]}. Each record is
+    validated on its own; results are compact rows in BATCH_COLUMNS order and
+    invalid records are reported in "errors" by index. Bodies over
+    batch_max_rows x batch_max_record_bytes are rejected with 413.
+    """
+    start_time = time.time()
+    body = await _read_batch_body(request)
+    
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    
+    records = _batch_records(payload)
+    
+    # A sync generator is iterated in the threadpool, keeping the event loop free
+    return StreamingResponse(
+        _stream_batch_results(records, start_time),
+        media_type="application/json"
+    )
+
+@router.post("/portfolio")
+async def analyze_client_portfolio(request: Request,
+                                   financial_year: Optional[str] = None,
+                                   rate_bin_width: float = 2.5,
+                                   include_clients: bool = False):
+    """
+    Aggregate analytics over a whole client book (no AI insights)
+    
+    Body: the /tax/calculate/batch JSON payload, or a CSV file with the TaxData
+    columns (Content-Type: text/csv). Returns columnar aggregates: liability per
+    regime, clients who would save by switching, an effective rate histogram,
+    clients per top slab and the 87A rebate zone; include_clients=true adds
+    per-client columns. The batch body size limit applies; rate_bin_width must be
+    at least MIN_RATE_BIN_WIDTH (0.1 percentage points, at most 1000 bins).
+    """
+    start_time = time.time()
+    if not rate_bin_width >= MIN_RATE_BIN_WIDTH:
+        raise HTTPException(status_code=422, detail=f"rate_bin_width must be at least {MIN_RATE_BIN_WIDTH}")
+    body = await _read_batch_body(request)
+    
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        records = _batch_records(list(parse_csv_records(body.decode("utf-8-sig").splitlines())))
+    else:
+        try:
+            records = _batch_records(orjson.loads(body))
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    
+    try:
+        rules = rule_registry.get(financial_year)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    # CPU-bound: keep the event loop free while the book is evaluated
+    analytics = await run_in_threadpool(
+        analyze_portfolio, records,
+        rate_bin_width=rate_bin_width,
+        include_clients=include_clients,
+        rules=rules
+    )
+    analytics["processing_time_ms"] = round((time.time() - start_time) * 1000, 2)
+    return Response(orjson.dumps(analytics), media_type="application/json")
+
+@router.post("/scenario")
+async def simulate_policy_scenario(request: ScenarioRequest):
+    """
+    Diff a proposed rule change against a baseline over a synthetic population
+    
+    baseline / alternative are overrides on the financial year's rules in the
+    data/tax-rules JSON shape (nested objects merge, slab lists replace).
+    Returns the revenue delta plus winners, losers and effective rate change
+    per income band. Larger populations and payroll files: python -m app.scenario.
+    """
+    start_time = time.time()
+    if request.population.size > settings.scenario_max_population:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Population of {request.population.size} exceeds the limit of {settings.scenario_max_population}"
+        )
+    try:
+        baseline, alternative = build_scenario_rules(
+            request.financial_year, request.baseline, request.alternative
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    # CPU-bound: keep the event loop free while the population is simulated
+    result = await run_in_threadpool(
+        run_scenario, baseline, alternative,
+        SyntheticPopulation(**request.population.dict()),
+        chunk_size=settings.scenario_chunk_size,
+        income_bands=request.income_bands or DEFAULT_INCOME_BANDS,
+        regime_choice=request.regime_choice
+    )
+    result["processing_time_ms"] = round((time.time() - start_time) * 1000, 2)
+    return Response(orjson.dumps(result), media_type="application/json")
+
+@router.post("/tds/projection")
+async def project_monthly_tds(request: TdsProjectionRequest):
+    """
+    Month-by-month TDS for the rest of the financial year for one employee
+    
+    events (salary revision, bonus, declaration, exit) take effect in the next
+    month. Whole-company monthly payroll runs: python -m app.tds.
+    """
+    try:
+        ledger = TdsLedger(request.financial_year, settings.calculation_engine, request.months_closed)
+        ledger.add_employees([request.employee])
+        for event in request.events:
+            if event.type == "join" or event.employee_id != request.employee.employee_id:
+                raise ValueError("Events must apply to the projected employee")
+            ledger.apply_event(event)
+        return ledger.project(request.employee.employee_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@router.post("/calculate/stream")
+async def calculate_tax_with_streamed_insights(tax_data: TaxData, bypass_cache: bool = False):
+    """
+    Calculate tax and stream AI insights over Server-Sent Events
+    
+    Events: `calculation` (the deterministic result, sent first), one `insight`
+    per generated text chunk, then `done`.
+    """
+    start_time = time.time()
+    
+    try:
+        calculation_result = _calculate(tax_data)
     except Exception as e:
         logger.error(f"Tax calculation failed: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"AI-powered tax calculation failed: {str(e)}"
         )
+    
+    async def event_stream():
+        yield _sse_event("calculation", calculation_result)
+        
+        if not ai_service.enabled:
+            yield _sse_event("done", {
+                "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+                "ai_service_status": "disabled"
+            })
+            return
+        
+        try:
+            async for chunk in ai_service.stream_tax_insights(
+                tax_data=tax_data.dict(),
+                calculation_result=calculation_result,
+                use_cache=not bypass_cache
+            ):
+                yield _sse_event("insight", {"text": chunk})
+        except Exception as e:
+            logger.error(f"AI insights streaming failed: {e}")
+            yield _sse_event("insight", {"text": INSIGHTS_FALLBACK})
+        
+        yield _sse_event("done", {
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+            "ai_service_status": _ai_service_status()
+        })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/insights/{insight_id}")
+async def get_tax_insights(insight_id: str):
+    """Fetch the AI insights of an async_insights calculation"""
+    job = insight_jobs.get(insight_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown or expired insight_id: {insight_id}"
+        )
+    return job.to_dict()
+
+@router.get("/rules")
+async def get_tax_rules():
+    """Loaded tax rule sets per financial year"""
+    return rule_registry.describe()
 
 @router.get("/ai-status")
 async def get_ai_service_status():
-    """Get current AI service status and configuration"""
+    """
+    Get current AI service status and configuration
+    
+    Never builds the Bedrock client here: until warm-up has run, ai_status is
+    "not_initialized" and the service is reported as not yet available.
+    """
     return {
         "ai_service_available": ai_service.is_available(),
+        "ai_status": ai_service.status(),
         "model_id": ai_service.model_id if ai_service.is_available() else None,
         "aws_region": ai_service.region,
-        "client_initialized": ai_service.client is not None,
+        "client_initialized": ai_service.is_available(),
+        "bedrock_executor": ai_service.get_stats(),
+        "circuit_breaker": ai_service.breaker.get_state(),
+        "insight_cache": insight_cache.get_stats(),
         "features": {
             "tax_insights": ai_service.is_available(),
             "regime_comparison": ai_service.is_available(),
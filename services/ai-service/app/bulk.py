@@ -0,0 +1,242 @@
+"""
+Bulk FY 2025-26 tax calculation - offline CLI for payroll-sized CSV / JSONL files
+
+    python -m app.bulk payroll.csv results.csv --workers 8
+    python -m app.bulk payroll.jsonl results.jsonl --resume
+
+Records are streamed from the input in chunks, calculated on a process pool
+and written in input order, so memory stays constant regardless of file size.
+Rejected records go to <output>.errors.jsonl. After every written chunk a
+checkpoint (<output>.checkpoint.json) records progress and output sizes;
+--resume truncates the outputs back to it and continues from the next record.
+Never calls the AI service.
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import orjson
+
+from .agents.tax_calculator.batch import BATCH_COLUMNS, detect_format, iter_batch_results, read_records
+from .agents.tax_calculator.fixed_point import ENGINES
+
+logger = logging.getLogger("app.bulk")
+
+def process_chunk(start: int,
+                  records: List[Any],
+                  engine: str = "float") -> Tuple[int, List[Tuple[Any, ...]], List[Dict[str, Any]]]:
+    """Worker entry point: (record count, result rows, errors) for one chunk"""
+    rows, errors = [], []
+    for row, error in iter_batch_results(records, start, engine):
+        if error is not None:
+            errors.append(error)
+        else:
+            rows.append(row)
+    return len(records), rows, errors
+
+class ResultWriter:
+    """Append-only result and error files whose byte sizes make the checkpoint"""
+    
+    def __init__(self, output_path: str, output_format: str, output_bytes: int = 0, errors_bytes: int = 0):
+        self.output_format = output_format
+        self.errors_path = f"{output_path}.errors.jsonl"
+        self._output = self._open(output_path, output_bytes)
+        self._errors = self._open(self.errors_path, errors_bytes)
+        if output_format == "csv" and output_bytes == 0:
+            self._output.write(self._csv_lines([BATCH_COLUMNS]))
+    
+    @staticmethod
+    def _open(path: str, size: int):
+        if size and not os.path.exists(path):
+            raise ValueError(f"Cannot resume: {path} is missing")
+        handle = open(path, "r+b" if size else "wb")
+        handle.truncate(size)
+        handle.seek(size)
+        return handle
+    
+    @staticmethod
+    def _csv_lines(rows: List[Tuple[Any, ...]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+    
+    def write(self, rows: List[Tuple[Any, ...]], errors: List[Dict[str, Any]]) -> None:
+        if rows:
+            if self.output_format == "csv":
+                self._output.write(self._csv_lines(rows))
+            else:
+                self._output.write(b"".join(orjson.dumps(dict(zip(BATCH_COLUMNS, row))) + b"\n" for row in rows))
+        if errors:
+            self._errors.write(b"".join(orjson.dumps(error) + b"\n" for error in errors))
+        self._output.flush()
+        self._errors.flush()
+    
+    def sizes(self) -> Tuple[int, int]:
+        return self._output.tell(), self._errors.tell()
+    
+    def close(self) -> None:
+        self._output.close()
+        self._errors.close()
+
+def load_checkpoint(path: str, input_path: str) -> Optional[Dict[str, Any]]:
+    """The checkpoint of a previous run over the same input, if any"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as handle:
+        checkpoint = json.load(handle)
+    if checkpoint.get("input") != os.path.abspath(input_path):
+        raise ValueError(f"Checkpoint {path} belongs to {checkpoint.get('input')}, not {input_path}")
+    return checkpoint
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write atomically so an interrupted run never leaves a torn checkpoint"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(checkpoint, handle)
+    os.replace(temp_path, path)
+
+def _completed_future(result: Any) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+def run_bulk(input_path: str,
+             output_path: str,
+             input_format: Optional[str] = None,
+             output_format: Optional[str] = None,
+             workers: int = 1,
+             chunk_size: int = 1000,
+             resume: bool = False,
+             progress_seconds: float = 5.0,
+             engine: str = "float") -> Dict[str, Any]:
+    """Calculate every record of input_path into output_path; returns the run summary"""
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+    start_time = time.time()
+    input_format = detect_format(input_path, input_format)
+    output_format = detect_format(output_path, output_format)
+    checkpoint_path = f"{output_path}.checkpoint.json"
+    
+    # Step 1: Resume from the checkpoint, or start over
+    checkpoint = load_checkpoint(checkpoint_path, input_path) if resume else None
+    if checkpoint is None:
+        checkpoint = {
+            "input": os.path.abspath(input_path),
+            "records_done": 0, "succeeded": 0, "failed": 0,
+            "output_bytes": 0, "errors_bytes": 0, "completed": False
+        }
+    elif checkpoint["completed"]:
+        logger.info(f"{input_path} was already fully processed into {output_path}")
+        return {**checkpoint, "resumed_from": checkpoint["records_done"], "elapsed_seconds": 0.0}
+    resumed_from = checkpoint["records_done"]
+    
+    writer = ResultWriter(output_path, output_format, checkpoint["output_bytes"], checkpoint["errors_bytes"])
+    records = islice(read_records(input_path, input_format), resumed_from, None)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    # Bounded in-flight chunks keep memory constant; results are written in input order
+    pending: Deque[Future] = deque()
+    window = workers * 2 if executor is not None else 1
+    last_report = time.time()
+    
+    def drain_one() -> None:
+        nonlocal last_report
+        count, rows, errors = pending.popleft().result()
+        writer.write(rows, errors)
+        checkpoint["records_done"] += count
+        checkpoint["succeeded"] += len(rows)
+        checkpoint["failed"] += len(errors)
+        checkpoint["output_bytes"], checkpoint["errors_bytes"] = writer.sizes()
+        save_checkpoint(checkpoint_path, checkpoint)
+    
+        if time.time() - last_report >= progress_seconds:
+            last_report = time.time()
+            processed = checkpoint["records_done"] - resumed_from
+            rate = processed / max(last_report - start_time, 1e-9)
+            logger.info(f"{checkpoint['records_done']:,} records ({rate:,.0f}/s), {checkpoint['failed']:,} failed")
+    
+    try:
+        # Step 2: Chunk, distribute and write back in order
+        index = resumed_from
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            if executor is not None:
+                pending.append(executor.submit(process_chunk, index, chunk, engine))
+            else:
+                pending.append(_completed_future(process_chunk(index, chunk, engine)))
+            index += len(chunk)
+            if len(pending) >= window:
+                drain_one()
+        while pending:
+            drain_one()
+    
+        checkpoint["completed"] = True
+        save_checkpoint(checkpoint_path, checkpoint)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        writer.close()
+    
+    # Step 3: Summary with throughput
+    elapsed = time.time() - start_time
+    processed = checkpoint["records_done"] - resumed_from
+    return {
+        **checkpoint,
+        "resumed_from": resumed_from,
+        "errors_file": writer.errors_path,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(processed / elapsed, 1) if elapsed > 0 else None
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.bulk",
+        description="Calculate FY 2025-26 tax for every record of a CSV or JSONL payroll file"
+    )
+    parser.add_argument("input", help="Input file (.csv, .jsonl or .ndjson)")
+    parser.add_argument("output", help="Output file (.csv, .jsonl or .ndjson)")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"])
+    parser.add_argument("--output-format", choices=["csv", "jsonl"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (1 = calculate in this process)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Records per work item")
+    parser.add_argument("--resume", action="store_true", help="Continue from the output's checkpoint")
+    parser.add_argument("--engine", choices=ENGINES, default="float",
+                        help="float, exact (integer paise) or statutory (paise with Income Tax Act rounding)")
+    parser.add_argument("--progress-seconds", type=float, default=5.0, help="Seconds between progress reports")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", stream=sys.stderr)
+    try:
+        summary = run_bulk(
+            args.input, args.output,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            workers=args.workers,
+            chunk_size=max(1, args.chunk_size),
+            resume=args.resume,
+            progress_seconds=args.progress_seconds,
+            engine=args.engine
+        )
+    except KeyboardInterrupt:
+        logger.warning("Interrupted - rerun with --resume to continue from the last checkpoint")
+        return 130
+    except (OSError, ValueError) as e:
+        logger.error(f"Bulk calculation failed: {e}")
+        return 1
+    
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
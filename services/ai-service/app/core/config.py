@@ -5,11 +5,77 @@ from pydantic_settings import BaseSettings
 from typing import Optional
 
 class Settings(BaseSettings):
+    # Service mode: full, or calculation (no AI - boto3 / LangChain are never imported)
+    service_mode: str = "full"
+    ai_warmup_on_startup: bool = True  # Build the Bedrock client in the background at startup
+    
     # AWS Configuration
     aws_region: str = "us-east-1"
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     
+    # AWS Bedrock
+    bedrock_model_id: str = "anthropic.claude-3-haiku-20240307-v1:0"
+    bedrock_max_concurrency: int = 8  # Max in-flight Bedrock calls per worker
+    bedrock_max_queue_depth: int = 64  # Calls waiting for a free slot before shedding
+    bedrock_max_attempts: int = 3
+    bedrock_retry_base_seconds: float = 0.25  # Full-jitter exponential backoff
+    bedrock_retry_max_seconds: float = 2.0
+    bedrock_deadline_seconds: float = 10.0  # Total budget for one insight incl. retries
+    
+    # Bedrock circuit breaker
+    breaker_window_size: int = 20
+    breaker_min_calls: int = 5
+    breaker_failure_rate: float = 0.5
+    breaker_open_seconds: float = 30.0
+    breaker_half_open_probes: int = 1
+    
+    # Tax rules (one JSON file per financial year; defaults to data/tax-rules)
+    tax_rules_dir: Optional[str] = None
+    default_financial_year: str = "2025-26"
+    tax_rules_reload_seconds: float = 5.0  # Poll interval for hot reload; 0 disables
+    
+    # Calculation engine: float (original), exact (integer paise, same rule order)
+    # or statutory (integer paise with Income Tax Act ss.87A / 288A / 288B order and
+    # rounding, including the new regime's 87A marginal relief)
+    calculation_engine: str = "float"
+    
+    # End-to-end latency budget for /tax/calculate (None = wait for insights)
+    calculation_latency_budget_ms: Optional[float] = 3000
+    park_timed_out_insights: bool = True  # Keep generating as an insight job vs cancel
+    
+    # Batch calculation
+    batch_max_rows: int = 100000
+    batch_stream_chunk_rows: int = 1000  # Rows serialized per response chunk
+    batch_max_record_bytes: int = 512  # Request body limit is batch_max_rows x this
+    
+    # Income sweep (/tax/sweep)
+    sweep_max_points: int = 50000
+    
+    # Policy scenarios (/tax/scenario; the app.scenario CLI has no limit)
+    scenario_max_population: int = 2000000
+    scenario_chunk_size: int = 250000
+    
+    # Background AI insight jobs
+    insight_job_ttl_seconds: int = 900
+    insight_job_max_entries: int = 10000
+    
+    # AI insight cache (profile-keyed; Redis tier enabled when REDIS_URL is set)
+    insight_cache_enabled: bool = True
+    insight_cache_ttl_seconds: int = 6 * 3600
+    insight_cache_max_entries: int = 5000
+    insight_cache_income_band: int = 100000  # ₹1L income bands
+    insight_cache_deduction_band: int = 25000  # ₹25k 80C+80D bands (comparison insights)
+    insight_cache_redis_timeout_seconds: float = 0.05
+    redis_url: Optional[str] = None
+    
+    # Per-request cProfile dumps (see app.core.profiling); when disabled the
+    # middleware is not installed at all
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.0  # Fraction of requests profiled without the X-Profile header
+    profiling_token: Optional[str] = None  # Required X-Profile header value, when set
+    profile_dir: str = "/app/logs"
+    
     # Application
     app_name: str = "Tax AI Service"
     debug: bool = False
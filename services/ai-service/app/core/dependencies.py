@@ -2,10 +2,23 @@
 FastAPI dependency injection
 """
 from functools import lru_cache
-from ..agents.tax_calculator.agent import TaxCalculatorAgent
+from typing import TYPE_CHECKING
+
+from fastapi import HTTPException
+
+from .config import settings
+
+if TYPE_CHECKING:
+    from ..agents.tax_calculator.legacy_tax import TaxCalculatorAgent
 
 @lru_cache()
-def get_tax_calculator_agent() -> TaxCalculatorAgent:
-    """Dependency injection for Tax Calculator Agent"""
-    return TaxCalculatorAgent(aws_region="us-east-1")
+def _tax_calculator_agent() -> "TaxCalculatorAgent":
+    # LangChain and boto3 load with the agent, on first use only
+    from ..agents.tax_calculator.legacy_tax import TaxCalculatorAgent
+    return TaxCalculatorAgent(aws_region=settings.aws_region)
 
+def get_tax_calculator_agent() -> "TaxCalculatorAgent":
+    """Dependency injection for Tax Calculator Agent"""
+    if settings.service_mode == "calculation":
+        raise HTTPException(status_code=503, detail="AI agents are disabled in calculation-only mode")
+    return _tax_calculator_agent()
@@ -0,0 +1,84 @@
+"""
+Per-request profiling - cProfile dumps of selected requests
+
+Installed by app.main only when PROFILING_ENABLED is set, so a disabled
+service runs no profiling code at all. A request is profiled when it carries
+the X-Profile header (equal to PROFILING_TOKEN, when one is set) or is picked
+by PROFILING_SAMPLE_RATE. Its stats are written to profile_dir as
+<timestamp>-<request id>.prof (load with pstats or snakeviz) and the response
+names the dump in X-Profile-Path.
+
+cProfile follows the event loop thread, so a dump also holds whatever other
+requests ran on the loop meanwhile; work handed to executor threads (Bedrock
+calls, run_in_threadpool) shows up only as the await. One request is profiled
+at a time per worker.
+"""
+import asyncio
+import cProfile
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+REQUEST_ID_HEADER = b"x-request-id"
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+class ProfilingMiddleware:
+    """ASGI middleware writing a cProfile dump for selected requests"""
+    
+    def __init__(self, app, profile_dir: str, sample_rate: float = 0.0, token: Optional[str] = None):
+        self.app = app
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.token = token
+        self._active = False
+        os.makedirs(profile_dir, exist_ok=True)
+    
+    def _selected(self, headers) -> bool:
+        requested = headers.get(PROFILE_HEADER)
+        if requested is not None:
+            return self.token is None or requested.decode("latin-1") == self.token
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active:
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        if not self._selected(headers):
+            return await self.app(scope, receive, send)
+        
+        # Step 1: Name the dump after the caller's request id (or a fresh one)
+        request_id = headers.get(REQUEST_ID_HEADER, b"").decode("latin-1")
+        if not _REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        path = os.path.join(self.profile_dir, f"{time.strftime('%Y%m%dT%H%M%S')}-{request_id}.prof")
+        
+        async def send_with_profile_path(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-profile-path", path.encode()),
+                    (REQUEST_ID_HEADER, request_id.encode())
+                ]
+            await send(message)
+        
+        # Step 2: Profile the request, then dump the stats off the event loop
+        profiler = cProfile.Profile()
+        self._active = True
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_path)
+        finally:
+            profiler.disable()
+            self._active = False
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, profiler.dump_stats, path)
+                logger.info(f"Profiled {scope['method']} {scope['path']} -> {path}")
+            except OSError as e:
+                logger.error(f"Could not write profile {path}: {e}")
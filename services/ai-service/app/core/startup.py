@@ -0,0 +1,31 @@
+"""
+Startup timing - how long this worker took to import and start, for /health
+Imported first by app.main so the clock starts before any heavy import
+"""
+import sys
+import time
+from typing import Any, Dict, Optional
+
+IMPORT_STARTED = time.perf_counter()
+
+# Modules a calculation-only worker should never load
+HEAVY_MODULES = ("boto3", "botocore", "langchain_core", "langchain_aws")
+
+_marks: Dict[str, float] = {}
+
+def mark(name: str) -> None:
+    """Record the first time a startup phase ("imported", "started") completed"""
+    _marks.setdefault(name, time.perf_counter())
+
+def _elapsed_ms(name: str) -> Optional[float]:
+    if name not in _marks:
+        return None
+    return round((_marks[name] - IMPORT_STARTED) * 1000, 1)
+
+def startup_report() -> Dict[str, Any]:
+    return {
+        "import_ms": _elapsed_ms("imported"),
+        "startup_ms": _elapsed_ms("started"),
+        "uptime_seconds": round(time.perf_counter() - IMPORT_STARTED, 1),
+        "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in sys.modules]
+    }
@@ -1,7 +1,19 @@
 """Main FastAPI Application - FY 2025-26 Compliant"""
+from .core.startup import mark, startup_report  # First: starts the startup clock
+
+import asyncio
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from .api.v1.tax_routes import router as tax_router
+from .core.config import settings
+from .core.metrics import CONTENT_TYPE, RequestClockMiddleware, registry
+from .core.profiling import ProfilingMiddleware
+from .services.ai_service import ai_service
+
+logging.basicConfig(level=logging.INFO)
 
 def create_application() -> FastAPI:
     app = FastAPI(
@@ -10,6 +22,15 @@ def create_application() -> FastAPI:
         version="2.1.0"
     )
     
+    if settings.profiling_enabled:
+        # Innermost, so dumps hold the request itself rather than the middleware stack
+        app.add_middleware(
+            ProfilingMiddleware,
+            profile_dir=settings.profile_dir,
+            sample_rate=settings.profiling_sample_rate,
+            token=settings.profiling_token
+        )
+    
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
@@ -17,12 +38,26 @@ def create_application() -> FastAPI:
         allow_methods=["GET", "POST", "PUT", "DELETE"],
         allow_headers=["*"],
     )
+    # Outermost, so the validation stage includes everything before the handler
+    app.add_middleware(RequestClockMiddleware)
     
     app.include_router(tax_router, prefix="/api/v1")
     
+    @app.on_event("startup")
+    async def start_service():
+        if ai_service.enabled and settings.ai_warmup_on_startup:
+            # Off the startup path: the worker takes traffic while the AWS SDK loads
+            asyncio.ensure_future(ai_service.warm_up())
+        mark("started")
+    
+    @app.on_event("shutdown")
+    async def shutdown_ai_service():
+        ai_service.shutdown()
+    
     return app
 
 app = create_application()
+mark("imported")
 
 @app.get("/")
 async def root():
@@ -41,7 +76,19 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "service": "tax-ai-service-fy2025"}
+    return {
+        "status": "healthy",
+        "service": "tax-ai-service-fy2025",
+        "service_mode": settings.service_mode,
+        "ai_status": ai_service.status(),
+        "ai_client_init_ms": ai_service.client_init_ms,
+        "startup": startup_report()
+    }
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint: stage latencies, Bedrock usage and load"""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
 
 if __name__ == "__main__":
     import uvicorn
@@ -3,6 +3,13 @@ from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
+from ..agents.tax_calculator.rules import rule_registry
+
+def _check_financial_year(v: Optional[str]) -> Optional[str]:
+    if v is not None and v not in rule_registry.financial_years():
+        raise ValueError(f'No tax rules for financial year {v}; available: {", ".join(rule_registry.financial_years())}')
+    return v
+
 class TaxData(BaseModel):
     income: float = Field(..., description="Gross annual income", gt=0)
     age: int = Field(..., description="Age of taxpayer", ge=18, le=100)
@@ -10,6 +17,120 @@ class TaxData(BaseModel):
     is_salaried: bool = Field(True, description="Is taxpayer salaried")
     deductions_80c: float = Field(0, description="Section 80C deductions", ge=0, le=150000)
     health_insurance_premium: float = Field(0, description="Health insurance premium", ge=0)
+    financial_year: Optional[str] = Field(None, description="Financial year, e.g. '2025-26' (defaults to current rules)")
+    
+    @validator('regime')
+    def validate_regime(cls, v):
+        if v.lower() not in ['new', 'old']:
+            raise ValueError('Regime must be "new" or "old"')
+        return v.lower()
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
+class DeductionOptimizationRequest(BaseModel):
+    income: float = Field(..., description="Gross annual income", gt=0)
+    age: int = Field(..., description="Age of taxpayer", ge=18, le=100)
+    is_salaried: bool = Field(True, description="Is taxpayer salaried")
+    max_80c: float = Field(150000, description="Most the taxpayer can invest under Section 80C", ge=0)
+    max_health_insurance_premium: float = Field(25000, description="Most the taxpayer can pay as health insurance premium", ge=0)
+    financial_year: Optional[str] = Field(None, description="Financial year, e.g. '2025-26' (defaults to current rules)")
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
+class ReverseCalculationRequest(BaseModel):
+    target_type: str = Field(..., description="Target to solve for: 'net' (take-home) or 'tax'")
+    target_amount: float = Field(..., description="Target annual take-home or tax", ge=0)
+    age: int = Field(..., description="Age of taxpayer", ge=18, le=100)
+    regime: Optional[str] = Field(None, description="Tax regime: 'new', 'old' or omitted for both")
+    is_salaried: bool = Field(True, description="Is taxpayer salaried")
+    deductions_80c: float = Field(0, description="Section 80C deductions", ge=0, le=150000)
+    health_insurance_premium: float = Field(0, description="Health insurance premium", ge=0)
+    financial_year: Optional[str] = Field(None, description="Financial year, e.g. '2025-26' (defaults to current rules)")
+    
+    @validator('target_type')
+    def validate_target_type(cls, v):
+        if v.lower() not in ['net', 'tax']:
+            raise ValueError('Target type must be "net" or "tax"')
+        return v.lower()
+    
+    @validator('regime')
+    def validate_regime(cls, v):
+        if v is not None and v.lower() not in ['new', 'old']:
+            raise ValueError('Regime must be "new" or "old"')
+        return v.lower() if v is not None else v
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
+class IncomeSweepRequest(BaseModel):
+    start: float = Field(0, description="First gross income of the sweep", ge=0)
+    stop: float = Field(..., description="Last gross income of the sweep (inclusive)", gt=0)
+    step: float = Field(..., description="Gross income increment", gt=0)
+    age: int = Field(30, description="Age of taxpayer", ge=18, le=100)
+    regime: Optional[str] = Field(None, description="Tax regime: 'new', 'old' or omitted for both")
+    is_salaried: bool = Field(True, description="Is taxpayer salaried")
+    deductions_80c: float = Field(0, description="Section 80C deductions", ge=0, le=150000)
+    health_insurance_premium: float = Field(0, description="Health insurance premium", ge=0)
+    financial_year: Optional[str] = Field(None, description="Financial year, e.g. '2025-26' (defaults to current rules)")
+    
+    @validator('regime')
+    def validate_regime(cls, v):
+        if v is not None and v.lower() not in ['new', 'old']:
+            raise ValueError('Regime must be "new" or "old"')
+        return v.lower() if v is not None else v
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
+class SyntheticPopulationSpec(BaseModel):
+    size: int = Field(100000, description="Number of synthetic taxpayers", gt=0)
+    seed: int = Field(2025, description="Random seed; the same seed gives the same population")
+    median_income: float = Field(900000, description="Median gross income", gt=0)
+    income_sigma: float = Field(0.8, description="Shape of the lognormal income distribution", ge=0)
+    min_income: float = Field(100000, description="Lowest gross income", ge=0)
+    salaried_share: float = Field(0.75, ge=0, le=1)
+    new_regime_share: float = Field(0.7, description="Share recorded under the new regime", ge=0, le=1)
+    senior_share: float = Field(0.1, ge=0, le=1)
+    super_senior_share: float = Field(0.02, ge=0, le=1)
+    deduction_claim_share: float = Field(0.6, description="Share claiming 80C / 80D deductions", ge=0, le=1)
+    max_claim_80c: float = Field(250000, description="Largest intended 80C claim, before each rule set's limit", ge=0)
+    max_claim_80d: float = Field(50000, description="Largest intended 80D claim, before each rule set's limit", ge=0)
+
+class ScenarioRequest(BaseModel):
+    financial_year: Optional[str] = Field(None, description="Rules both scenarios start from (defaults to current rules)")
+    baseline: Dict[str, Any] = Field(default_factory=dict, description="Overrides on those rules for the baseline")
+    alternative: Dict[str, Any] = Field(..., description="Overrides on those rules for the proposal")
+    population: SyntheticPopulationSpec = Field(default_factory=SyntheticPopulationSpec)
+    income_bands: Optional[List[float]] = Field(None, description="Lower edges of the gross income bands")
+    regime_choice: str = Field("optimal", description="'optimal' (cheaper regime) or 'recorded'")
+    
+    @validator('regime_choice')
+    def validate_regime_choice(cls, v):
+        if v not in ['optimal', 'recorded']:
+            raise ValueError('Regime choice must be "optimal" or "recorded"')
+        return v
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
+class TdsEmployee(BaseModel):
+    employee_id: str = Field(..., description="Payroll identifier", min_length=1)
+    monthly_salary: float = Field(..., description="Current gross monthly salary", ge=0)
+    age: int = Field(30, description="Age of employee", ge=18, le=100)
+    regime: str = Field("new", description="Tax regime: 'new' or 'old'")
+    is_salaried: bool = Field(True, description="Standard deduction applies")
+    deductions_80c: float = Field(0, description="Declared Section 80C deductions", ge=0, le=150000)
+    health_insurance_premium: float = Field(0, description="Declared health insurance premium", ge=0)
+    income_to_date: float = Field(0, description="Gross income paid this financial year so far", ge=0)
+    tds_to_date: float = Field(0, description="Tax deducted this financial year so far", ge=0)
+    active: bool = Field(True, description="False once the employee has left")
     
     @validator('regime')
     def validate_regime(cls, v):
@@ -17,6 +138,45 @@ class TaxData(BaseModel):
             raise ValueError('Regime must be "new" or "old"')
         return v.lower()
 
+class TdsEvent(BaseModel):
+    type: str = Field(..., description="'join', 'salary', 'bonus', 'declaration' or 'exit'")
+    employee_id: Optional[str] = Field(None, description="Employee the event applies to (join: taken from employee)")
+    amount: Optional[float] = Field(None, description="salary: new monthly salary; bonus: one-off paid this month", ge=0)
+    deductions_80c: Optional[float] = Field(None, description="declaration: revised Section 80C deductions", ge=0, le=150000)
+    health_insurance_premium: Optional[float] = Field(None, description="declaration: revised health insurance premium", ge=0)
+    employee: Optional[TdsEmployee] = Field(None, description="join: the new employee")
+    
+    @validator('type')
+    def validate_type(cls, v):
+        if v not in ['join', 'salary', 'bonus', 'declaration', 'exit']:
+            raise ValueError('Event type must be "join", "salary", "bonus", "declaration" or "exit"')
+        return v
+    
+    @validator('employee', always=True)
+    def validate_employee(cls, v, values):
+        if values.get('type') == 'join':
+            if v is None:
+                raise ValueError('A join event needs the employee')
+        elif values.get('employee_id') is None:
+            raise ValueError('employee_id is required')
+        return v
+    
+    @validator('amount', always=True)
+    def validate_amount(cls, v, values):
+        if values.get('type') in ['salary', 'bonus'] and v is None:
+            raise ValueError('Salary and bonus events need an amount')
+        return v
+
+class TdsProjectionRequest(BaseModel):
+    employee: TdsEmployee
+    months_closed: int = Field(0, description="Payroll months already closed this financial year (0 = April is next)", ge=0, le=11)
+    events: List[TdsEvent] = Field(default_factory=list, description="Changes taking effect in the next month")
+    financial_year: Optional[str] = Field(None, description="Financial year, e.g. '2025-26' (defaults to current rules)")
+    
+    @validator('financial_year')
+    def validate_financial_year(cls, v):
+        return _check_financial_year(v)
+
 class TaxCalculationResult(BaseModel):
     gross_income: float
     final_tax: float
@@ -0,0 +1,92 @@
+"""
+Policy scenario CLI - model a budget proposal against current rules
+
+    python -m app.scenario proposal.json --population 10000000 --seed 7
+    python -m app.scenario proposal.json --input payroll.csv --regime-choice recorded
+
+proposal.json holds overrides on the financial year's rules in the
+data/tax-rules JSON shape. The population is a seeded synthetic income
+distribution unless --input names a CSV / JSONL payroll file; either way it
+is simulated in chunks, so memory stays bounded by --chunk-size.
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from .agents.tax_calculator.scenario import (
+    DEFAULT_INCOME_BANDS,
+    REGIME_CHOICES,
+    FilePopulation,
+    SyntheticPopulation,
+    build_scenario_rules,
+    run_scenario
+)
+
+logger = logging.getLogger("app.scenario")
+
+def _load_json(path: Optional[str]) -> Dict[str, Any]:
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.scenario",
+        description="Diff a proposed tax rule change against a baseline across a population"
+    )
+    parser.add_argument("alternative", help="JSON file of rule overrides for the proposal")
+    parser.add_argument("--baseline", help="JSON file of rule overrides for the baseline (default: rules as loaded)")
+    parser.add_argument("--financial-year", help="Rules both scenarios start from (default: current rules)")
+    parser.add_argument("--input", help="CSV / JSONL payroll file instead of a synthetic population")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"])
+    parser.add_argument("--population", type=int, default=1000000, help="Synthetic population size")
+    parser.add_argument("--seed", type=int, default=2025, help="Synthetic population seed")
+    parser.add_argument("--median-income", type=float, default=900000)
+    parser.add_argument("--income-sigma", type=float, default=0.8)
+    parser.add_argument("--chunk-size", type=int, default=250000, help="People simulated per chunk")
+    parser.add_argument("--regime-choice", choices=REGIME_CHOICES, default="optimal")
+    parser.add_argument("--bands", help="Comma-separated lower edges of the income bands")
+    parser.add_argument("--output", help="Write the JSON result here instead of stdout")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", stream=sys.stderr)
+    start_time = time.time()
+    try:
+        baseline, alternative = build_scenario_rules(
+            args.financial_year, _load_json(args.baseline), _load_json(args.alternative)
+        )
+        if args.input:
+            population = FilePopulation(args.input, args.input_format)
+        else:
+            population = SyntheticPopulation(
+                size=args.population,
+                seed=args.seed,
+                median_income=args.median_income,
+                income_sigma=args.income_sigma
+            )
+        bands = [float(edge) for edge in args.bands.split(",")] if args.bands else DEFAULT_INCOME_BANDS
+        result = run_scenario(
+            baseline, alternative, population,
+            chunk_size=max(1, args.chunk_size),
+            income_bands=bands,
+            regime_choice=args.regime_choice
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Scenario failed: {e}")
+        return 1
+    
+    logger.info(f"Simulated {result['population']['people']:,} people in {time.time() - start_time:.1f}s")
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output)
+    else:
+        print(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
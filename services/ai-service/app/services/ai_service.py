@@ -1,91 +1,338 @@
 """
 AI Service - AWS Bedrock Integration with Retry Logic
+
+The AWS SDK is imported and the Bedrock client built on first use, never at
+import time; with SERVICE_MODE=calculation neither ever happens.
 """
-import boto3
+import hashlib
 import json
 import asyncio
 import logging
-from typing import Dict, Any, Optional
-from botocore.exceptions import ClientError, NoCredentialsError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, AsyncIterator, Callable
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from ..core.config import settings
+from ..core.metrics import Gauge, bedrock_calls, bedrock_errors, bedrock_tokens, registry, stage_duration
+from ..agents.tax_calculator.rules import TaxRuleSet, age_category, rule_registry
+from .insight_cache import insight_cache
+from .resilience import CircuitBreaker
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class AIServiceUnavailable(Exception):
+    """Bedrock could not produce insights; the message is the user-facing fallback"""
+
+class CircuitOpenError(AIServiceUnavailable):
+    """The Bedrock circuit breaker is refusing calls"""
+
+class BedrockTimeout(AIServiceUnavailable):
+    """A Bedrock call did not finish within the remaining deadline"""
+    
+    def __init__(self, message: str, attempt_running: bool = False):
+        super().__init__(message)
+        self.attempt_running = attempt_running  # The abandoned call still holds an executor thread
+
+class BedrockOverloaded(AIServiceUnavailable):
+    """Our own Bedrock queue is full - local back-pressure, not a Bedrock failure"""
+
+# Transient Bedrock errors worth another (jittered) attempt
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+    "ModelTimeoutException",
+    "ModelNotReadyException"
+}
+
+def _is_client_error(error: BaseException) -> bool:
+    """botocore ClientError check that never imports botocore (no SDK loaded, no ClientError)"""
+    exceptions = sys.modules.get("botocore.exceptions")
+    return exceptions is not None and isinstance(error, exceptions.ClientError)
+
+def _error_code(error: BaseException) -> str:
+    """Short error code used for breaker accounting"""
+    if _is_client_error(error):
+        return error.response['Error']['Code']
+    if isinstance(error, BedrockTimeout):
+        return "Timeout"
+    return type(error).__name__
+
+def _is_retryable(error: BaseException) -> bool:
+    # A timed-out call whose thread is still running is not retried: during a brown-out
+    # another attempt would only stack more in-flight work behind it
+    if isinstance(error, BedrockTimeout):
+        return not error.attempt_running
+    return _is_client_error(error) and _error_code(error) in RETRYABLE_ERROR_CODES
+
+def _record_usage(usage: Optional[Dict[str, Any]]):
+    """Token counters from the usage block of a Bedrock (Anthropic) response"""
+    if not usage:
+        return
+    if usage.get('input_tokens'):
+        bedrock_tokens.inc(usage['input_tokens'], direction="input")
+    if usage.get('output_tokens'):
+        bedrock_tokens.inc(usage['output_tokens'], direction="output")
+
+def _rebate_applies(calculation_result: Dict[str, Any]) -> bool:
+    return calculation_result.get('rebate_87a', 0) > 0
+
+def _claimed_deductions(comparison: Dict[str, Any]) -> float:
+    """80C+80D claimed in a comparison, capped at the limits (claims beyond them change nothing)"""
+    breakeven = comparison['breakeven']
+    return min(breakeven['current_deductions'], breakeven['max_eligible_deductions'])
+
+def _rules_summary(rules: TaxRuleSet, regime_name: str, age: int) -> str:
+    """The selected rule set's headline figures for one regime, as prompt bullet lines"""
+    regime = rules.regime(regime_name)
+    lines = [f"- Basic exemption: ₹{regime.basic_exemption_for(age):,.0f} for this age group"]
+    if regime.standard_deduction > 0:
+        lines.append(f"- Standard deduction for salaried taxpayers: ₹{regime.standard_deduction:,.0f}")
+    if regime.rebate_max > 0:
+        lines.append(f"- Section 87A rebate: up to ₹{regime.rebate_max:,.0f} "
+                     f"(taxable income up to ₹{regime.rebate_income_limit:,.0f})")
+    lines.append("- Slabs: " + ", ".join(
+        f"{rate} on {description}"
+        for description, rate in zip(regime.table.descriptions, regime.table.rate_labels)
+    ))
+    if regime.allows_deductions:
+        lines.append("- Deduction limits: " + ", ".join(
+            f"{section} ₹{limit:,.0f}" for section, limit in rules.deduction_limits.items()
+        ))
+    return "\n".join(lines)
+
+AGE_GROUPS = {
+    "regular": "Below 60",
+    "senior": "60 to 79 (senior citizen)",
+    "super_senior": "80 and above (super senior citizen)"
+}
+
+# Marks the end of a response stream handed from the executor to the event loop
+_STREAM_END = object()
+
 class BedrockAIService:
     """AWS Bedrock AI service with retry logic and error handling"""
     
     def __init__(self):
-        self.client = None
-        self.model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-        self.region = "us-east-1"
-        self._initialize_client()
+        self._client = None
+        self._client_ready = False
+        self._client_lock = threading.Lock()
+        self.client_init_ms: Optional[float] = None
+        self.model_id = settings.bedrock_model_id
+        self.region = settings.aws_region
+        self.max_concurrency = settings.bedrock_max_concurrency
+        self.max_queue_depth = settings.bedrock_max_queue_depth
+        
+        # boto3 is blocking, so Bedrock round trips run on a dedicated, size-capped
+        # executor instead of the event loop (or the loop's shared default executor)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="bedrock"
+        )
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        
+        # Single-flight: prompt hash -> the Bedrock call currently generating it
+        self._inflight_prompts: Dict[str, asyncio.Future] = {}
+        self._single_flight_leaders = 0
+        self._single_flight_coalesced = 0
+        
+        self.breaker = CircuitBreaker(
+            window_size=settings.breaker_window_size,
+            min_calls=settings.breaker_min_calls,
+            failure_rate=settings.breaker_failure_rate,
+            open_seconds=settings.breaker_open_seconds,
+            half_open_probes=settings.breaker_half_open_probes
+        )
+        
+    @property
+    def enabled(self) -> bool:
+        """False in calculation-only mode, where AI is never initialized"""
+        return settings.service_mode != "calculation"
+    
+    @property
+    def client(self):
+        """Bedrock runtime client, created on first use"""
+        if not self._client_ready:
+            self._initialize_client()
+        return self._client
+    
+    @client.setter
+    def client(self, client):
+        self._client = client
+        self._client_ready = True
     
     def _initialize_client(self):
-        """Initialize AWS Bedrock client with error handling"""
-        try:
-            self.client = boto3.client(
-                'bedrock-runtime',
-                region_name=self.region
-            )
-            logger.info("AWS Bedrock client initialized successfully")
-        except NoCredentialsError:
-            logger.error("AWS credentials not found. AI features will be disabled.")
-            self.client = None
-        except Exception as e:
-            logger.error(f"Failed to initialize AWS Bedrock client: {e}")
-            self.client = None
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(ClientError)
-    )
+        """Initialize AWS Bedrock client with error handling (once, thread-safe)"""
+        with self._client_lock:
+            if self._client_ready:
+                return
+            if not self.enabled:
+                logger.info("Calculation-only mode: AI insights disabled")
+                self._client_ready = True
+                return
+            
+            started = time.perf_counter()
+            try:
+                import boto3
+                from botocore.exceptions import NoCredentialsError
+            except ImportError as e:
+                logger.error(f"AWS SDK unavailable ({e}). AI features will be disabled.")
+                self._client_ready = True
+                return
+            
+            try:
+                self._client = boto3.client(
+                    'bedrock-runtime',
+                    region_name=self.region
+                )
+                logger.info("AWS Bedrock client initialized successfully")
+            except NoCredentialsError:
+                logger.error("AWS credentials not found. AI features will be disabled.")
+                self._client = None
+            except Exception as e:
+                logger.error(f"Failed to initialize AWS Bedrock client: {e}")
+                self._client = None
+            self.client_init_ms = round((time.perf_counter() - started) * 1000, 1)
+            self._client_ready = True
+    
+    async def warm_up(self) -> None:
+        """
+        Build the client off the event loop, so the first insight request does not pay for it
+        
+        Async paths await this before touching .client, which would otherwise
+        import the AWS SDK synchronously on the event loop.
+        """
+        if self.enabled and not self._client_ready:
+            await asyncio.get_running_loop().run_in_executor(None, self._initialize_client)
+    
     async def invoke_model_with_retry(self, prompt: str, max_tokens: int = 2000) -> str:
         """Invoke Bedrock model with retry logic"""
+        try:
+            generated_text = await self._invoke_model_resilient(prompt, max_tokens)
+            logger.info("Successfully generated AI insights")
+            return generated_text
+        except Exception as e:
+            return self._fallback_message(e)
+    
+    async def _invoke_model_resilient(self, prompt: str, max_tokens: int = 2000) -> str:
+        """
+        _invoke_model behind the circuit breaker, with full-jitter retries of transient
+        errors that never sleep or wait past the bedrock_deadline_seconds budget
+        """
+        await self.warm_up()
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + settings.bedrock_deadline_seconds
+        backoff = wait_random_exponential(
+            multiplier=settings.bedrock_retry_base_seconds,
+            max=settings.bedrock_retry_max_seconds
+        )
+        
+        def wait_within_deadline(retry_state) -> float:
+            return max(0.0, min(backoff(retry_state), deadline_at - loop.time()))
+        
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(settings.bedrock_max_attempts),
+            wait=wait_within_deadline,
+            retry=retry_if_exception(_is_retryable),
+            reraise=True
+        )
+        
+        async for attempt in retrying:
+            with attempt:
+                remaining = deadline_at - loop.time()
+                if remaining <= 0:
+                    raise AIServiceUnavailable("AI insights temporarily unavailable - deadline exceeded")
+                generated_text = await self._invoke_model_guarded(prompt, max_tokens, remaining)
+        
+        return generated_text
+    
+    async def _invoke_model_guarded(self, prompt: str, max_tokens: int, timeout: float) -> str:
+        """A single attempt, admitted by and reported to the circuit breaker"""
         if not self.client:
-            return "AI insights unavailable - AWS Bedrock not configured"
+            raise AIServiceUnavailable("AI insights unavailable - AWS Bedrock not configured")
+        
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("AI insights temporarily unavailable - AI service circuit open")
         
+        attempt: Dict[str, Any] = {}
         try:
-            # Format request for Claude 3 Haiku
-            request_payload = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": max_tokens,
-                "temperature": 0.1,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [{"type": "text", "text": prompt}]
-                    }
-                ]
-            }
-            
-            # Convert to JSON
-            request_body = json.dumps(request_payload)
-            
-            # Invoke model
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=request_body,
-                contentType='application/json'
+            generated_text = await asyncio.wait_for(self._invoke_model(prompt, max_tokens, attempt), timeout)
+        except asyncio.TimeoutError:
+            self.breaker.record_failure("Timeout")
+            bedrock_errors.inc(code="Timeout")
+            # Cancelling the await only un-queues a call that has not started yet
+            future = attempt.get("future")
+            raise BedrockTimeout(
+                "AI insights temporarily unavailable - AI service timed out",
+                attempt_running=future is not None and not future.done()
             )
-            
-            # Parse response
-            response_body = json.loads(response['body'].read())
-            
-            # Extract generated text
-            if 'content' in response_body and len(response_body['content']) > 0:
-                generated_text = response_body['content'][0]['text']
-                logger.info("Successfully generated AI insights")
-                return generated_text
-            else:
-                logger.warning("No content in Bedrock response")
-                return "AI insights generation failed - no content returned"
-                
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            logger.error(f"AWS ClientError: {error_code} - {e}")
+        except (asyncio.CancelledError, BedrockOverloaded):
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self.breaker.record_failure(_error_code(e))
+            bedrock_errors.inc(code=_error_code(e))
+            raise
+        
+        self.breaker.record_success()
+        return generated_text
+    
+    async def _invoke_model(self, prompt: str, max_tokens: int = 2000,
+                            attempt: Optional[Dict[str, Any]] = None) -> str:
+        """Invoke Bedrock off the event loop, raising on any failure; attempt receives the executor future"""
+        if not self.client:
+            raise AIServiceUnavailable("AI insights unavailable - AWS Bedrock not configured")
+        
+        request_body = self._build_request_body(prompt, max_tokens)
+        
+        if not self._try_enqueue():
+            logger.warning("Bedrock queue full - shedding AI insights request")
+            raise BedrockOverloaded("AI insights temporarily unavailable - service busy")
+        
+        future = self._executor.submit(self._invoke_model_sync, request_body)
+        future.add_done_callback(self._release_if_cancelled)
+        if attempt is not None:
+            attempt["future"] = future
+        response_body = await asyncio.wrap_future(future)
+        
+        # Extract generated text
+        if 'content' in response_body and len(response_body['content']) > 0:
+            return response_body['content'][0]['text']
+        
+        logger.warning("No content in Bedrock response")
+        raise AIServiceUnavailable("AI insights generation failed - no content returned")
+    
+    async def _invoke_model_single_flight(self, prompt: str, max_tokens: int = 2000) -> str:
+        """_invoke_model_resilient, with concurrent identical prompts sharing one Bedrock call"""
+        prompt_hash = hashlib.sha256(f"{max_tokens}:{prompt}".encode()).hexdigest()
+        
+        shared = self._inflight_prompts.get(prompt_hash)
+        if shared is None:
+            shared = asyncio.ensure_future(self._invoke_model_resilient(prompt, max_tokens))
+            self._inflight_prompts[prompt_hash] = shared
+            shared.add_done_callback(lambda _: self._inflight_prompts.pop(prompt_hash, None))
+            self._single_flight_leaders += 1
+        else:
+            self._single_flight_coalesced += 1
+        
+        # Shielded so one caller disconnecting does not cancel the call for the others
+        return await asyncio.shield(shared)
+    
+    def _fallback_message(self, error: Exception) -> str:
+        """User-facing replacement text for a failed Bedrock call"""
+        if isinstance(error, AIServiceUnavailable):
+            return str(error)
+        
+        if _is_client_error(error):
+            error_code = error.response['Error']['Code']
+            logger.error(f"AWS ClientError: {error_code} - {error}")
             
             if error_code == 'AccessDeniedException':
                 return "AI insights unavailable - insufficient AWS permissions"
@@ -93,52 +340,401 @@ class BedrockAIService:
                 return "AI insights temporarily unavailable - service busy"
             else:
                 return f"AI insights unavailable - AWS error: {error_code}"
-                
+        
+        logger.error(f"Unexpected error in Bedrock call: {error}")
+        return "AI insights temporarily unavailable"
+    
+    async def stream_model(self, prompt: str, max_tokens: int = 2000) -> AsyncIterator[str]:
+        """Yield generated text chunks as Bedrock produces them (response-stream API)"""
+        await self.warm_up()
+        if not self.client:
+            raise AIServiceUnavailable("AI insights unavailable - AWS Bedrock not configured")
+        
+        if not self._try_enqueue():
+            logger.warning("Bedrock queue full - shedding AI insights stream")
+            raise BedrockOverloaded("AI insights temporarily unavailable - service busy")
+        
+        # The blocking event-stream iterator runs on the Bedrock executor and hands
+        # chunks back to the loop; stop_event lets a disconnected client end it early
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        stop_event = threading.Event()
+        
+        def emit(item):
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, item)
+            except RuntimeError:
+                stop_event.set()  # Loop already closed - nobody is listening
+        
+        future = self._executor.submit(
+            self._stream_model_sync,
+            self._build_request_body(prompt, max_tokens),
+            emit,
+            stop_event
+        )
+        future.add_done_callback(self._release_if_cancelled)
+        
+        try:
+            while True:
+                item = await chunks.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+            future.cancel()
+    
+    def _build_request_body(self, prompt: str, max_tokens: int) -> str:
+        """Format request for Claude 3 Haiku"""
+        return json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": 0.1,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"type": "text", "text": prompt}]
+                }
+            ]
+        })
+    
+    def _try_enqueue(self) -> bool:
+        """Reserve a queue slot, refusing once the backlog reaches max_queue_depth"""
+        with self._stats_lock:
+            if self._queued >= self.max_queue_depth:
+                self._rejected += 1
+                return False
+            self._queued += 1
+            return True
+    
+    def _release_if_cancelled(self, future):
+        """Give back the queue slot of a call cancelled before a worker picked it up"""
+        if future.cancelled():
+            with self._stats_lock:
+                self._queued -= 1
+    
+    def _invoke_model_sync(self, request_body: str) -> Dict[str, Any]:
+        """Blocking Bedrock round trip - only ever runs on the Bedrock executor"""
+        with self._stats_lock:
+            self._queued -= 1
+            self._in_flight += 1
+        
+        bedrock_calls.inc(api="invoke")
+        try:
+            with stage_duration.time(stage="bedrock_call"):
+                response = self.client.invoke_model(
+                    modelId=self.model_id,
+                    body=request_body,
+                    contentType='application/json'
+                )
+                response_body = json.loads(response['body'].read())
+            _record_usage(response_body.get('usage'))
+            return response_body
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+                self._completed += 1
+    
+    def _stream_model_sync(self, request_body: str, emit: Callable[[Any], None],
+                           stop_event: threading.Event):
+        """Blocking response-stream consumer - only ever runs on the Bedrock executor"""
+        with self._stats_lock:
+            self._queued -= 1
+            self._in_flight += 1
+        
+        bedrock_calls.inc(api="stream")
+        started = time.perf_counter()
+        try:
+            response = self.client.invoke_model_with_response_stream(
+                modelId=self.model_id,
+                body=request_body,
+                contentType='application/json'
+            )
+            for event in response['body']:
+                if stop_event.is_set():
+                    break
+                chunk = event.get('chunk')
+                if not chunk:
+                    continue
+                payload = json.loads(chunk['bytes'])
+                if payload.get('type') == 'content_block_delta':
+                    text = payload.get('delta', {}).get('text')
+                    if text:
+                        emit(text)
+                elif payload.get('type') == 'message_start':
+                    _record_usage(payload.get('message', {}).get('usage'))
+                elif payload.get('type') == 'message_delta':
+                    _record_usage(payload.get('usage'))
         except Exception as e:
-            logger.error(f"Unexpected error in Bedrock call: {e}")
-            return "AI insights temporarily unavailable"
+            emit(e)
+        finally:
+            stage_duration.observe(time.perf_counter() - started, stage="bedrock_call")
+            # Release the slot before the end marker, so the consumer never sees it held
+            with self._stats_lock:
+                self._in_flight -= 1
+                self._completed += 1
+            emit(_STREAM_END)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of Bedrock executor load"""
+        with self._stats_lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self._in_flight,
+                "queue_depth": self._queued,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "single_flight": {
+                    "in_flight_prompts": len(self._inflight_prompts),
+                    "leaders": self._single_flight_leaders,
+                    "coalesced": self._single_flight_coalesced
+                }
+            }
+    
+    def shutdown(self):
+        """Release executor threads on application shutdown"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
     
     async def generate_tax_insights(self, 
                                   tax_data: Dict[str, Any], 
+                                  calculation_result: Dict[str, Any],
+                                  use_cache: bool = True) -> str:
+        """Generate comprehensive tax insights, served from the insight cache when possible"""
+        return await self._generate_insights(
+            cache_key=insight_cache.key_for(tax_data, calculation_result.get('financial_year'),
+                                            _rebate_applies(calculation_result)),
+            build_prompt=lambda: self.build_tax_insights_prompt(tax_data, calculation_result),
+            build_fallback=lambda: self.build_fallback_insights(tax_data, calculation_result),
+            use_cache=use_cache
+        )
+    
+    async def generate_comparison_insights(self,
+                                           tax_data: Dict[str, Any],
+                                           comparison: Dict[str, Any],
+                                           use_cache: bool = True) -> str:
+        """One insight generation covering both regimes of a comparison"""
+        return await self._generate_insights(
+            cache_key=insight_cache.key_for(
+                {**tax_data, 'regime': f"compare_{comparison['recommended_regime']}"},
+                comparison['financial_year'],
+                _rebate_applies(comparison['new_regime']),
+                deductions=_claimed_deductions(comparison)
+            ),
+            build_prompt=lambda: self.build_comparison_insights_prompt(tax_data, comparison),
+            build_fallback=lambda: self.build_fallback_comparison_insights(comparison),
+            use_cache=use_cache
+        )
+    
+    async def _generate_insights(self,
+                                 cache_key: str,
+                                 build_prompt: Callable[[], str],
+                                 build_fallback: Callable[[], str],
+                                 use_cache: bool) -> str:
+        """Cache lookup, then a single-flight Bedrock call; fallbacks are never cached"""
+        if use_cache:
+            cached = await insight_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        with stage_duration.time(stage="prompt_build"):
+            prompt = build_prompt()
+        try:
+            generated_text = await self._invoke_model_single_flight(prompt)
+        except CircuitOpenError:
+            return build_fallback()
+        except Exception as e:
+            return self._fallback_message(e)
+        
+        logger.info("Successfully generated AI insights")
+        await insight_cache.set(cache_key, generated_text)
+        return generated_text
+    
+    async def stream_tax_insights(self,
+                                  tax_data: Dict[str, Any],
+                                  calculation_result: Dict[str, Any],
+                                  use_cache: bool = True) -> AsyncIterator[str]:
+        """Stream comprehensive tax insights chunk by chunk"""
+        cache_key = insight_cache.key_for(tax_data, calculation_result.get('financial_year'),
+                                          _rebate_applies(calculation_result))
+        if use_cache:
+            cached = await insight_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        await self.warm_up()
+        if self.client and not self.breaker.allow_request():
+            yield self.build_fallback_insights(tax_data, calculation_result)
+            return
+        
+        with stage_duration.time(stage="prompt_build"):
+            prompt = self.build_tax_insights_prompt(tax_data, calculation_result)
+        generated_chunks = []
+        try:
+            async for chunk in self.stream_model(prompt):
+                generated_chunks.append(chunk)
+                yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            self.breaker.release()
+            raise
+        except BedrockOverloaded as e:
+            self.breaker.release()
+            yield self._fallback_message(e)
+            return
+        except Exception as e:
+            if self.client:
+                self.breaker.record_failure(_error_code(e))
+                bedrock_errors.inc(code=_error_code(e))
+            yield self._fallback_message(e)
+            return
+        
+        self.breaker.record_success()
+        await insight_cache.set(cache_key, "".join(generated_chunks))
+    
+    def build_tax_insights_prompt(self,
+                                  tax_data: Dict[str, Any],
                                   calculation_result: Dict[str, Any]) -> str:
-        """Generate comprehensive tax insights"""
+        """
+        Build the tax insights prompt for a taxpayer's profile band
         
-        prompt = f"""You are an expert Indian tax consultant specializing in FY 2025-26 tax laws. 
-        Analyze this taxpayer's situation and provide actionable insights.
+        The generated insights are cached under insight_cache.key_for and shared
+        by everyone in the band, so the prompt carries only the key's canonical
+        values - never this taxpayer's exact income or tax figures.
+        """
+        lower, upper = insight_cache.income_range(tax_data.get('income', 0))
+        rebate_applies = _rebate_applies(calculation_result)
+        rules = rule_registry.get(calculation_result.get('financial_year'))
+        regime = str(tax_data.get('regime', 'new')).lower()
+        age = int(tax_data.get('age', 30))
+        return f"""You are an expert Indian tax consultant specializing in FY {rules.financial_year} tax laws. 
+        Analyze this taxpayer profile and provide actionable insights for taxpayers in it.
 
-TAXPAYER PROFILE:
-- Annual Income: ₹{tax_data.get('income', 0):,}
-- Age: {tax_data.get('age', 30)} years
-- Tax Regime: {tax_data.get('regime', 'new').upper()} regime
+TAXPAYER PROFILE (income band; individual figures are not shared):
+- Annual Income: ₹{lower:,} to ₹{upper:,} (around ₹{(lower + upper) // 2:,})
+- Age Group: {AGE_GROUPS[age_category(age)]}
+- Tax Regime: {regime.upper()} regime
 - Employment: {'Salaried' if tax_data.get('is_salaried', True) else 'Self-Employed'}
+- Section 87A Rebate: {'Applies - no tax payable after the rebate' if rebate_applies else 'Does not apply at this income'}
 
-TAX CALCULATION RESULTS (FY 2025-26):
-- Gross Income: ₹{calculation_result.get('gross_income', 0):,}
-- Taxable Income: ₹{calculation_result.get('taxable_income', 0):,}
-- Final Tax: ₹{calculation_result.get('final_tax', 0):,}
-- Effective Rate: {calculation_result.get('effective_rate', 0):.2f}%
-- Section 87A Rebate: ₹{calculation_result.get('rebate_87a', 0):,}
-
-UNION BUDGET 2025 KEY CHANGES:
-- Basic exemption increased to ₹4 lakh (from ₹3 lakh)
-- Section 87A rebate increased to ₹60,000 (up to ₹12 lakh income)
-- New 25% slab for ₹20L-₹24L income range
-- Standard deduction increased to ₹75,000
+FY {rules.financial_year} {regime.upper()} REGIME RULES ({rules.compliance_status}):
+{_rules_summary(rules, regime, age)}
 
 Please provide:
 
-1. **TAX OPTIMIZATION STRATEGIES**: 3 specific recommendations with exact amounts
-2. **BUDGET 2025 BENEFITS**: How this taxpayer benefits from new changes
+1. **TAX OPTIMIZATION STRATEGIES**: 3 specific recommendations with amounts for this income band
+2. **FY {rules.financial_year} BENEFITS**: How this taxpayer benefits from the rules above
 3. **INVESTMENT SUGGESTIONS**: Best tax-saving options for next FY
 4. **COMPLIANCE REMINDERS**: Key deadlines and requirements
 
 Keep advice practical, specific, and actionable. Use ₹ for amounts."""
+    
+    def build_comparison_insights_prompt(self,
+                                         tax_data: Dict[str, Any],
+                                         comparison: Dict[str, Any]) -> str:
+        """
+        Build the regime comparison prompt for a taxpayer's profile band
+        
+        Like the tax insights prompt it is cached per band (income, deductions,
+        recommended regime and 87A rebate), so it carries only those canonical
+        values - no exact income, deduction, tax or breakeven figures.
+        """
+        lower, upper = insight_cache.income_range(tax_data.get('income', 0))
+        deductions_lower, deductions_upper = insight_cache.deduction_range(_claimed_deductions(comparison))
+        rules = rule_registry.get(comparison['financial_year'])
+        age = int(tax_data.get('age', 30))
+        new_rebate = _rebate_applies(comparison['new_regime'])
+        return f"""You are an expert Indian tax consultant specializing in FY {rules.financial_year} tax laws.
+        Help taxpayers in this profile choose between the new and old tax regimes.
+
+TAXPAYER PROFILE (income and deduction bands; individual figures are not shared):
+- Annual Income: ₹{lower:,} to ₹{upper:,} (around ₹{(lower + upper) // 2:,})
+- Age Group: {AGE_GROUPS[age_category(age)]}
+- Employment: {'Salaried' if tax_data.get('is_salaried', True) else 'Self-Employed'}
+- Section 80C + 80D Deductions Claimed: ₹{deductions_lower:,} to ₹{deductions_upper:,}
+
+REGIME COMPARISON:
+- Recommended Regime: {comparison['recommended_regime'].upper()}
+- New regime Section 87A rebate: {'Applies - no tax payable after the rebate' if new_rebate else 'Does not apply at this income'}
+
+FY {rules.financial_year} NEW REGIME RULES:
+{_rules_summary(rules, 'new', age)}
+
+FY {rules.financial_year} OLD REGIME RULES:
+{_rules_summary(rules, 'old', age)}
 
-        return await self.invoke_model_with_retry(prompt)
+Please provide:
+
+1. **REGIME CHOICE**: Which regime to choose and why, in plain language
+2. **DEDUCTION PLANNING**: Whether extra 80C/80D investments could make the old regime worthwhile in this band
+3. **NEXT STEPS**: How to declare the regime choice to the employer or while filing
+
+Keep advice practical, specific, and actionable. Use ₹ for amounts."""
+    
+    def build_fallback_comparison_insights(self, comparison: Dict[str, Any]) -> str:
+        """Instant rule-based comparison summary served while the AI circuit is open"""
+        breakeven = comparison['breakeven']
+        tips = [
+            f"- The {comparison['recommended_regime'].upper()} regime saves you ₹{comparison['savings']:,.0f} this year.",
+            f"- The old regime catches up once total 80C/80D deductions reach ₹{breakeven['breakeven_total_deductions']:,.0f}"
+            + ("." if breakeven['achievable_within_limits'] else ", which is beyond the statutory limits.")
+        ]
+        return (
+            "Personalized AI insights are temporarily unavailable; here is a quick summary "
+            "of your regime comparison:\n" + "\n".join(tips)
+        )
+    
+    def build_fallback_insights(self,
+                                tax_data: Dict[str, Any],
+                                calculation_result: Dict[str, Any]) -> str:
+        """Instant rule-based insights served while the AI circuit is open"""
+        regime = str(tax_data.get('regime', 'new')).lower()
+        rules = rule_registry.get(calculation_result.get('financial_year'))
+        tips = [
+            f"- Your FY {rules.financial_year} tax under the {regime.upper()} regime is "
+            f"₹{calculation_result.get('final_tax', 0):,.0f} "
+            f"(effective rate {calculation_result.get('effective_rate', 0):.2f}%)."
+        ]
+        
+        if regime == "old":
+            unused_80c = max(0, rules.deduction_limits["80C"] - tax_data.get('deductions_80c', 0))
+            if unused_80c > 0:
+                tips.append(f"- You can still claim ₹{unused_80c:,.0f} under Section 80C (PPF, ELSS, EPF, life insurance).")
+            tips.append("- Compare with the new regime: it has no 80C/80D deductions but lower slab rates.")
+        else:
+            rebate_limit = rules.new.rebate_income_limit
+            tips.append(f"- Income up to ₹{rebate_limit:,.0f} (₹{rebate_limit + rules.new.standard_deduction:,.0f} for salaried "
+                        f"taxpayers) is tax-free under the new regime after the Section 87A rebate.")
+            tips.append("- Employer NPS contributions under Section 80CCD(2) remain deductible in the new regime.")
+        
+        tips.append(f"- File your income tax return for FY {rules.financial_year} by 31 July "
+                    f"{rules.assessment_year[:4]} to avoid late fees.")
+        
+        return (
+            "Personalized AI insights are temporarily unavailable; here are quick pointers "
+            "for your calculation:\n" + "\n".join(tips)
+        )
     
     def is_available(self) -> bool:
-        """Check if AI service is available"""
-        return self.client is not None
+        """True once a usable client is built; never initializes it (False until warm_up has run)"""
+        return self._client_ready and self._client is not None
+    
+    def status(self) -> str:
+        """disabled | not_initialized | available | unavailable, without initializing anything"""
+        if not self.enabled:
+            return "disabled"
+        if not self._client_ready:
+            return "not_initialized"
+        return "available" if self._client is not None else "unavailable"
 
 # Global AI service instance
 ai_service = BedrockAIService()
+
+registry.register(Gauge(
+    "bedrock_in_flight", "Bedrock calls currently running", lambda: ai_service.get_stats()["in_flight"]
+))
+registry.register(Gauge(
+    "bedrock_queue_depth", "Bedrock calls waiting for a worker", lambda: ai_service.get_stats()["queue_depth"]
+))
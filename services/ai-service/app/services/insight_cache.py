@@ -0,0 +1,193 @@
+"""
+Insight Cache - profile-keyed cache of AI insights
+
+Insights depend only on the coarse taxpayer profile, so near-identical profiles
+share one Bedrock generation. Two tiers: an in-process LRU+TTL map and an
+optional Redis tier shared by all replicas (enabled when REDIS_URL is set).
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..agents.tax_calculator.rules import age_category, rule_registry
+from ..core.config import settings
+from ..core.metrics import insight_cache_lookups
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_VERSION = "v2"
+
+class MemoryInsightCache:
+    """Bounded LRU map whose entries also expire after ttl_seconds"""
+    
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: str):
+        self._entries[key] = (time.time() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisInsightCache:
+    """Shared Redis tier; every failure is logged and treated as a miss"""
+    
+    def __init__(self, redis_url: str, ttl_seconds: float):
+        import redis.asyncio as redis_asyncio
+        
+        self.ttl_seconds = int(ttl_seconds)
+        self.client = redis_asyncio.from_url(
+            redis_url,
+            socket_timeout=settings.insight_cache_redis_timeout_seconds,
+            socket_connect_timeout=settings.insight_cache_redis_timeout_seconds
+        )
+        self.errors = 0
+    
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value = await self.client.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis insight cache get failed: {e}")
+            return None
+        return value.decode() if value is not None else None
+    
+    async def set(self, key: str, value: str):
+        try:
+            await self.client.set(key, value, ex=self.ttl_seconds)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis insight cache set failed: {e}")
+
+class InsightCache:
+    """Two-tier insight cache with hit/miss counters"""
+    
+    def __init__(self, enabled: bool, max_entries: int, ttl_seconds: float,
+                 income_band: int, deduction_band: int = 25000, redis_url: Optional[str] = None):
+        self.enabled = enabled
+        self.income_band = income_band
+        self.deduction_band = deduction_band
+        self.memory = MemoryInsightCache(max_entries, ttl_seconds)
+        self.redis: Optional[RedisInsightCache] = None
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        
+        if enabled and redis_url:
+            try:
+                self.redis = RedisInsightCache(redis_url, ttl_seconds)
+                logger.info("Redis insight cache tier enabled")
+            except ImportError:
+                logger.warning("REDIS_URL set but the redis package is not installed - using memory tier only")
+    
+    def income_range(self, income: float) -> Tuple[int, int]:
+        """[lower, upper) rupee bounds of the income band holding income"""
+        band = int(float(income) // self.income_band)
+        return band * self.income_band, (band + 1) * self.income_band
+    
+    def deduction_range(self, deductions: float) -> Tuple[int, int]:
+        """[lower, upper) rupee bounds of the 80C+80D deduction band holding deductions"""
+        band = int(float(deductions) // self.deduction_band)
+        return band * self.deduction_band, (band + 1) * self.deduction_band
+    
+    def key_for(self, tax_data: Dict[str, Any], financial_year: Optional[str] = None,
+                rebate_eligible: bool = False, deductions: Optional[float] = None) -> str:
+        """
+        Canonical cache key: financial year, regime, age category, salaried flag,
+        income band and whether the 87A rebate applies (the band can straddle the
+        rebate cliff), plus the 80C+80D deduction band when deductions is given.
+        Cached prompts may only use these values, never a taxpayer's exact figures.
+        
+        financial_year should be the year the calculation resolved to; None falls
+        back to the request's year, then the rule registry default.
+        """
+        financial_year = financial_year or tax_data.get('financial_year') or rule_registry.default_year
+        band = int(float(tax_data.get('income', 0)) // self.income_band)
+        parts = [
+            "insights",
+            CACHE_KEY_VERSION,
+            str(financial_year),
+            str(tax_data.get('regime', 'new')).lower(),
+            age_category(int(tax_data.get('age', 30))),
+            "salaried" if tax_data.get('is_salaried', True) else "self_employed",
+            str(band),
+            "rebate" if rebate_eligible else "no_rebate"
+        ]
+        if deductions is not None:
+            parts.append(f"d{int(float(deductions) // self.deduction_band)}")
+        return ":".join(parts)
+    
+    async def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            insight_cache_lookups.inc(result="memory_hit")
+            return value
+        
+        if self.redis is not None:
+            value = await self.redis.get(key)
+            if value is not None:
+                self.redis_hits += 1
+                insight_cache_lookups.inc(result="redis_hit")
+                self.memory.set(key, value)
+                return value
+        
+        self.misses += 1
+        insight_cache_lookups.inc(result="miss")
+        return None
+    
+    async def set(self, key: str, value: str):
+        if not self.enabled or not value:
+            return
+        
+        self.memory.set(key, value)
+        if self.redis is not None:
+            await self.redis.set(key, value)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.redis_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": "memory+redis" if self.redis is not None else "memory",
+            "entries": len(self.memory),
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+            "redis_errors": self.redis.errors if self.redis is not None else 0
+        }
+
+# Global insight cache instance
+insight_cache = InsightCache(
+    enabled=settings.insight_cache_enabled,
+    max_entries=settings.insight_cache_max_entries,
+    ttl_seconds=settings.insight_cache_ttl_seconds,
+    income_band=settings.insight_cache_income_band,
+    deduction_band=settings.insight_cache_deduction_band,
+    redis_url=settings.redis_url
+)
@@ -0,0 +1,94 @@
+"""
+Insight Jobs - in-process table of background AI insight generations
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INSIGHTS_FALLBACK = "AI insights temporarily unavailable due to technical issues"
+
+@dataclass
+class InsightJob:
+    """A single background insight generation"""
+    insight_id: str
+    status: str = "pending"  # pending | completed | failed
+    ai_insights: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    completed_at: Optional[float] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "insight_id": self.insight_id,
+            "status": self.status,
+            "ai_insights": self.ai_insights,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at
+        }
+
+class InsightJobStore:
+    """Job table with TTL eviction, capped at max_jobs entries (oldest evicted first)"""
+    
+    def __init__(self, ttl_seconds: float, max_jobs: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, InsightJob]" = OrderedDict()
+    
+    def submit(self, insight_coro: Awaitable[str]) -> InsightJob:
+        """Schedule insight generation on the running loop and return its job"""
+        self._evict()
+        
+        job = InsightJob(insight_id=uuid.uuid4().hex)
+        job.task = asyncio.ensure_future(insight_coro)
+        job.task.add_done_callback(lambda task: self._complete(job, task))
+        self._jobs[job.insight_id] = job
+        return job
+    
+    def get(self, insight_id: str) -> Optional[InsightJob]:
+        """Look up a job, treating expired entries as missing"""
+        self._evict()
+        return self._jobs.get(insight_id)
+    
+    def _complete(self, job: InsightJob, task: asyncio.Task):
+        job.completed_at = time.time()
+        job.task = None
+        
+        if task.cancelled():
+            job.status = "failed"
+            job.ai_insights = INSIGHTS_FALLBACK
+        elif task.exception() is not None:
+            logger.error(f"Background AI insights generation failed: {task.exception()}")
+            job.status = "failed"
+            job.ai_insights = INSIGHTS_FALLBACK
+        else:
+            job.status = "completed"
+            job.ai_insights = task.result()
+    
+    def _evict(self):
+        cutoff = time.time() - self.ttl_seconds
+        
+        # Jobs are kept in creation order, so expired ones are always at the front
+        while self._jobs:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.created_at > cutoff and len(self._jobs) < self.max_jobs:
+                break
+            self._jobs.popitem(last=False)
+            if oldest.task is not None:
+                oldest.task.cancel()
+    
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+# Global insight job table
+insight_jobs = InsightJobStore(
+    ttl_seconds=settings.insight_job_ttl_seconds,
+    max_jobs=settings.insight_job_max_entries
+)
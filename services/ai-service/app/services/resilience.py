@@ -0,0 +1,129 @@
+"""
+Resilience - circuit breaker guarding the Bedrock integration
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker
+    
+    Opens once at least min_calls outcomes are recorded and the failure rate in the
+    last window_size calls reaches failure_rate. While open every call is refused
+    immediately; after open_seconds a limited number of half-open probes decide
+    whether to close again or re-open.
+    """
+    
+    def __init__(self, window_size: int, min_calls: int, failure_rate: float,
+                 open_seconds: float, half_open_probes: int = 1, name: str = "bedrock"):
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at: Optional[float] = None
+        self._probes_in_flight = 0
+        self._last_error: Optional[str] = None
+        self._times_opened = 0
+        self._short_circuited = 0
+        self._errors_by_code: Dict[str, int] = {}
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+    
+    def allow_request(self) -> bool:
+        """Whether a call may go through now (reserves a probe slot when half-open)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            self._short_circuited += 1
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                logger.info(f"Circuit '{self.name}' closed after successful probe")
+                self._reset()
+                return
+            self._outcomes.append(True)
+    
+    def record_failure(self, error_code: str):
+        with self._lock:
+            self._last_error = error_code
+            self._errors_by_code[error_code] = self._errors_by_code.get(error_code, 0) + 1
+            
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._trip()
+                return
+            
+            self._outcomes.append(False)
+            if state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._trip()
+    
+    def release(self):
+        """Return a half-open probe slot for a call that ended without an outcome"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+    
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            recorded = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            retry_in = None
+            if state == OPEN:
+                retry_in = round(self._opened_at + self.open_seconds - time.monotonic(), 2)
+            return {
+                "state": state,
+                "failure_rate": round(failures / recorded, 4) if recorded else 0.0,
+                "window_calls": recorded,
+                "times_opened": self._times_opened,
+                "short_circuited_calls": self._short_circuited,
+                "last_error": self._last_error,
+                "errors_by_code": dict(self._errors_by_code),
+                "retry_in_seconds": retry_in
+            }
+    
+    def _current_state(self) -> str:
+        # OPEN lapses into HALF_OPEN lazily once the cool-down has elapsed
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+    
+    def _trip(self):
+        logger.warning(f"Circuit '{self.name}' opened (last error: {self._last_error})")
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._outcomes.clear()
+    
+    def _reset(self):
+        self._state = CLOSED
+        self._opened_at = None
+        self._probes_in_flight = 0
+        self._outcomes.clear()
@@ -0,0 +1,98 @@
+"""
+Monthly payroll TDS - close one month of a company's payroll per run
+
+    python -m app.tds ledger.json --roster employees.csv --register apr-tds.csv
+    python -m app.tds ledger.json --events may-events.jsonl --register may-tds.csv
+
+The ledger file holds every employee's year-to-date income and tax deducted.
+The first run of the year builds it from --roster; each run applies the
+month's payroll events (join, salary, bonus, declaration, exit), closes the
+next month and writes the ledger back. Only employees touched by an event
+have their annual tax recalculated.
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
+
+from .agents.tax_calculator.batch import detect_format, read_records
+from .agents.tax_calculator.fixed_point import ENGINES
+from .agents.tax_calculator.tds import TdsLedger
+from .bulk import save_checkpoint
+
+logger = logging.getLogger("app.tds")
+
+REGISTER_COLUMNS = ("employee_id", "gross_pay", "tds", "income_to_date", "tds_to_date",
+                    "projected_annual_income", "projected_annual_tax")
+
+def read_events(path: str, input_format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Payroll events; a flat join row (CSV) carries the new employee's fields itself"""
+    for index, record in enumerate(read_records(path, detect_format(path, input_format))):
+        if not isinstance(record, dict):
+            raise ValueError(f"Event {index} is not a JSON object")
+        if record.get("type") == "join" and "employee" not in record:
+            record = {"type": "join", "employee": {k: v for k, v in record.items() if k != "type"}}
+        yield record
+
+def write_register(path: str, register: Dict[str, List[Any]]) -> None:
+    rows = zip(*(register[column] for column in REGISTER_COLUMNS))
+    if detect_format(path) == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle, lineterminator="\n")
+            writer.writerow(REGISTER_COLUMNS)
+            writer.writerows(rows)
+        return
+    with open(path, "wb") as handle:
+        handle.write(b"".join(orjson.dumps(dict(zip(REGISTER_COLUMNS, row))) + b"\n" for row in rows))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.tds",
+        description="Close the next payroll month and compute every employee's TDS"
+    )
+    parser.add_argument("ledger", help="Ledger JSON file (read and written back)")
+    parser.add_argument("--roster", help="CSV / JSONL employees to start a new ledger from")
+    parser.add_argument("--events", help="CSV / JSONL payroll events of the month")
+    parser.add_argument("--register", help="Write the month's per-employee register here (.csv or .jsonl)")
+    parser.add_argument("--financial-year", help="Financial year of a new ledger (default: current rules)")
+    parser.add_argument("--engine", choices=ENGINES, default="float", help="Calculation engine of a new ledger")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", stream=sys.stderr)
+    start_time = time.time()
+    try:
+        # Step 1: Load the ledger, or start the year from the roster
+        if args.roster:
+            if os.path.exists(args.ledger):
+                raise ValueError(f"{args.ledger} already exists; --roster only starts a new ledger")
+            ledger = TdsLedger.from_records(
+                read_records(args.roster, detect_format(args.roster)),
+                financial_year=args.financial_year,
+                engine=args.engine
+            )
+        else:
+            with open(args.ledger, encoding="utf-8") as handle:
+                ledger = TdsLedger.from_state(json.load(handle))
+    
+        # Step 2: Close the month and persist
+        result = ledger.close_month(read_events(args.events) if args.events else ())
+        if args.register:
+            write_register(args.register, result["register"])
+        save_checkpoint(args.ledger, ledger.to_state())
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Payroll TDS failed: {e}")
+        return 1
+    
+    del result["register"]
+    result["elapsed_seconds"] = round(time.time() - start_time, 3)
+    print(json.dumps(result, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Performance benchmarks for the AI service (python -m benchmarks.suite)"""
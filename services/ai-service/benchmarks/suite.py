@@ -0,0 +1,360 @@
+"""
+Benchmark suite - hot-path timings saved as JSON and checked against a baseline
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --baseline before.json --threshold 0.15
+
+Groups:
+  fy2025  scalar FY 2025-26 calculators (float and fixed-point engines)
+  legacy  calculator.py slab functions
+  prompt  insight prompt construction and cache keying in generate_tax_insights
+  http    POST /api/v1/tax/calculate in process, with Bedrock stubbed out
+
+Inputs come from a seeded generator, so two runs time the same work. Micro
+benchmarks report per-call times over repeated rounds; http reports per-request
+latency percentiles and throughput. With --baseline, any benchmark whose median
+is slower than the baseline by more than --threshold is a regression and the
+exit status is 1. Run from services/ai-service.
+"""
+import argparse
+import asyncio
+import gc
+import io
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.agents.tax_calculator import calculator
+from app.agents.tax_calculator.calculator_fy2025 import (
+    TaxCalculationInput,
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    calculate_tax_fy2025
+)
+from app.agents.tax_calculator.fixed_point import calculate_tax_exact
+from app.agents.tax_calculator.rules import rule_registry
+
+GROUPS = ("fy2025", "legacy", "prompt", "http")
+SCHEMA_VERSION = 1
+
+logger = logging.getLogger("benchmarks")
+
+def _percentile(values: List[float], percent: float) -> float:
+    return float(np.percentile(values, percent))
+
+def sample_profiles(count: int, seed: int = 2025) -> List[Dict[str, Any]]:
+    """Seeded TaxData-shaped profiles spread over the slabs and both regimes"""
+    rng = random.Random(seed)
+    return [
+        {
+            "income": round(rng.lognormvariate(13.7, 0.8)),
+            "age": rng.choice([28, 35, 45, 62, 82]),
+            "regime": rng.choice(["new", "old"]),
+            "is_salaried": rng.random() < 0.75,
+            "deductions_80c": rng.choice([0, 50000, 150000]),
+            "health_insurance_premium": rng.choice([0, 25000])
+        }
+        for _ in range(count)
+    ]
+
+def _calculation_input(profile: Dict[str, Any]) -> TaxCalculationInput:
+    return TaxCalculationInput(
+        gross_income=profile["income"],
+        age=profile["age"],
+        regime=profile["regime"],
+        is_salaried=profile["is_salaried"],
+        deductions_80c=profile["deductions_80c"],
+        health_insurance_premium=profile["health_insurance_premium"]
+    )
+
+def time_call(name: str, group: str, function: Callable[[int], Any], rounds: int = 7,
+              min_round_seconds: float = 0.05) -> Dict[str, Any]:
+    """
+    Per-call timing of function(i) over rounds; each round runs enough calls
+    to last min_round_seconds, with the garbage collector paused as timeit does
+    """
+    # Step 1: Warm up and calibrate the calls per round
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for index in range(iterations):
+            function(index)
+        if time.perf_counter() - started >= min_round_seconds or iterations >= 1 << 20:
+            break
+        iterations *= 2
+    
+    # Step 2: Timed rounds
+    per_call = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for index in range(iterations):
+                function(index)
+            per_call.append((time.perf_counter() - started) / iterations * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    
+    median = statistics.median(per_call)
+    return {
+        "name": name,
+        "group": group,
+        "unit": "us",
+        "rounds": rounds,
+        "iterations": iterations,
+        "min": round(min(per_call), 4),
+        "median": round(median, 4),
+        "p95": round(_percentile(per_call, 95), 4),
+        "ops_per_sec": round(1e6 / median, 1) if median > 0 else None
+    }
+
+def fy2025_benchmarks(profiles: List[Dict[str, Any]], **options) -> List[Dict[str, Any]]:
+    inputs = [_calculation_input(profile) for profile in profiles]
+    rules = rule_registry.get()
+    count = len(inputs)
+    return [
+        time_call("fy2025.new_regime", "fy2025",
+                  lambda i: calculate_new_regime_tax_fy2025(inputs[i % count], rules), **options),
+        time_call("fy2025.old_regime", "fy2025",
+                  lambda i: calculate_old_regime_tax_fy2025(inputs[i % count], rules), **options),
+        time_call("fy2025.compact", "fy2025",
+                  lambda i: calculate_tax_fy2025(inputs[i % count], rules, include_breakdown=False), **options),
+        time_call("fy2025.exact", "fy2025",
+                  lambda i: calculate_tax_exact(inputs[i % count], rules), **options),
+        time_call("fy2025.statutory", "fy2025",
+                  lambda i: calculate_tax_exact(inputs[i % count], rules, statutory=True), **options)
+    ]
+
+def legacy_benchmarks(profiles: List[Dict[str, Any]], **options) -> List[Dict[str, Any]]:
+    incomes = [float(profile["income"]) for profile in profiles]
+    count = len(incomes)
+    return [
+        time_call("legacy.new_regime_tax", "legacy",
+                  lambda i: calculator.calculate_new_regime_tax(incomes[i % count]), **options),
+        time_call("legacy.old_regime_tax", "legacy",
+                  lambda i: calculator.calculate_old_regime_tax(incomes[i % count]), **options),
+        time_call("legacy.tax_breakdown", "legacy",
+                  lambda i: calculator.get_tax_breakdown(incomes[i % count], "new" if i % 2 else "old"), **options)
+    ]
+
+def prompt_benchmarks(profiles: List[Dict[str, Any]], **options) -> List[Dict[str, Any]]:
+    from app.services.ai_service import ai_service
+    from app.services.insight_cache import insight_cache
+    
+    results = [
+        calculate_tax_fy2025(_calculation_input(profile), include_breakdown=False) for profile in profiles
+    ]
+    count = len(profiles)
+    return [
+        time_call("prompt.tax_insights", "prompt",
+                  lambda i: ai_service.build_tax_insights_prompt(profiles[i % count], results[i % count]),
+                  **options),
+        time_call("prompt.cache_key", "prompt",
+                  lambda i: insight_cache.key_for(profiles[i % count]), **options)
+    ]
+
+class StubBedrockClient:
+    """Instant invoke_model returning a canned Claude response"""
+    
+    def invoke_model(self, modelId, body, contentType):
+        payload = {
+            "content": [{"type": "text", "text": "Benchmark insights"}],
+            "usage": {"input_tokens": 300, "output_tokens": 200}
+        }
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+async def _http_run(path: str, profiles: List[Dict[str, Any]], requests: int,
+                    concurrency: int) -> Dict[str, Any]:
+    import httpx
+    from app.main import app
+    
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    next_request = iter(range(requests))
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for profile in profiles[:concurrency]:  # Warm up imports, rules and pools
+            await client.post(path, json=profile)
+        
+        async def worker():
+            for index in next_request:
+                started = time.perf_counter()
+                response = await client.post(path, json=profiles[index % len(profiles)])
+                latencies.append((time.perf_counter() - started) * 1e3)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    
+    return {"latencies": latencies, "statuses": statuses, "elapsed": elapsed}
+
+def http_benchmarks(profiles: List[Dict[str, Any]], requests: int = 2000,
+                    concurrency: int = 8) -> List[Dict[str, Any]]:
+    """End-to-end /tax/calculate with every request reaching the stubbed Bedrock client"""
+    from app.services.ai_service import ai_service
+    
+    previous_client = ai_service._client, ai_service._client_ready
+    ai_service.client = StubBedrockClient()
+    try:
+        benchmarks = []
+        for name, path in (("http.calculate", "/api/v1/tax/calculate?bypass_cache=true"),
+                           ("http.calculate_compact", "/api/v1/tax/calculate?bypass_cache=true&compact=true")):
+            run = asyncio.run(_http_run(path, profiles, requests, concurrency))
+            latencies = run["latencies"]
+            benchmarks.append({
+                "name": name,
+                "group": "http",
+                "unit": "ms",
+                "requests": requests,
+                "concurrency": concurrency,
+                "statuses": {str(code): count for code, count in sorted(run["statuses"].items())},
+                "min": round(min(latencies), 4),
+                "median": round(_percentile(latencies, 50), 4),
+                "p95": round(_percentile(latencies, 95), 4),
+                "p99": round(_percentile(latencies, 99), 4),
+                "ops_per_sec": round(requests / run["elapsed"], 1)
+            })
+        return benchmarks
+    finally:
+        ai_service._client, ai_service._client_ready = previous_client
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5, check=True).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run_suite(groups=GROUPS, seed: int = 2025, profiles: int = 1000, rounds: int = 7,
+              min_round_seconds: float = 0.05, requests: int = 2000, concurrency: int = 8) -> Dict[str, Any]:
+    """Run the selected groups; the result is the JSON document the CLI saves"""
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown benchmark groups: {', '.join(sorted(unknown))}")
+    sample = sample_profiles(profiles, seed)
+    options = {"rounds": rounds, "min_round_seconds": min_round_seconds}
+    
+    benchmarks = []
+    for group in GROUPS:
+        if group not in groups:
+            continue
+        logger.info(f"Running {group} benchmarks")
+        if group == "fy2025":
+            benchmarks.extend(fy2025_benchmarks(sample, **options))
+        elif group == "legacy":
+            benchmarks.extend(legacy_benchmarks(sample, **options))
+        elif group == "prompt":
+            benchmarks.extend(prompt_benchmarks(sample, **options))
+        else:
+            benchmarks.extend(http_benchmarks(sample, requests, concurrency))
+    
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "numpy": np.__version__,
+            "git_commit": _git_commit(),
+            "financial_year": rule_registry.get().financial_year
+        },
+        "parameters": {"seed": seed, "profiles": profiles, "rounds": rounds,
+                       "min_round_seconds": min_round_seconds, "requests": requests, "concurrency": concurrency},
+        "benchmarks": benchmarks
+    }
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = 0.15) -> List[Dict[str, Any]]:
+    """
+    Median change of every benchmark present in both runs
+    change is the relative slowdown (0.2 = 20% slower); regression is change > threshold
+    """
+    previous = {benchmark["name"]: benchmark for benchmark in baseline.get("benchmarks", [])}
+    comparison = []
+    for benchmark in current["benchmarks"]:
+        before = previous.get(benchmark["name"])
+        if before is None or before.get("unit") != benchmark["unit"] or not before["median"]:
+            continue
+        change = benchmark["median"] / before["median"] - 1
+        comparison.append({
+            "name": benchmark["name"],
+            "unit": benchmark["unit"],
+            "baseline": before["median"],
+            "current": benchmark["median"],
+            "change": round(change, 4),
+            "regression": change > threshold
+        })
+    return comparison
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Time the calculators, prompt building and the HTTP API; compare against a baseline"
+    )
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"Comma-separated subset of {', '.join(GROUPS)}")
+    parser.add_argument("--output", help="Write the JSON results here")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed median slowdown (0.15 = 15%%)")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--profiles", type=int, default=1000, help="Distinct seeded inputs cycled through")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-round-seconds", type=float, default=0.05)
+    parser.add_argument("--requests", type=int, default=2000, help="HTTP requests per endpoint variant")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", stream=sys.stderr)
+    # Per-request INFO logging would dominate the http timings
+    for name in ("app", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    try:
+        result = run_suite(
+            groups=[group.strip() for group in args.groups.split(",") if group.strip()],
+            seed=args.seed,
+            profiles=max(1, args.profiles),
+            rounds=max(1, args.rounds),
+            min_round_seconds=args.min_round_seconds,
+            requests=max(1, args.requests),
+            concurrency=max(1, args.concurrency)
+        )
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+    
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            result["comparison"] = compare_results(result, json.load(handle), args.threshold)
+        result["threshold"] = args.threshold
+        regressions = [entry for entry in result["comparison"] if entry["regression"]]
+    
+    for benchmark in result["benchmarks"]:
+        logger.info(f"{benchmark['name']:<26} median {benchmark['median']:>10.3f} {benchmark['unit']}"
+                    f"  p95 {benchmark['p95']:>10.3f} {benchmark['unit']}  {benchmark['ops_per_sec']:>12,.0f}/s")
+    for entry in regressions:
+        logger.error(f"Regression: {entry['name']} {entry['baseline']} -> {entry['current']} "
+                     f"{entry['unit']} ({entry['change']:+.1%})")
+    
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output)
+    else:
+        print(output)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
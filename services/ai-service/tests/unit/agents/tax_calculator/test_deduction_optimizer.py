@@ -0,0 +1,84 @@
+"""Deduction optimizer against a brute-force search over the scalar calculators"""
+import random
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.deduction_optimizer import (
+    optimize_deductions_fy2025,
+    DeductionOptimizationInput
+)
+
+
+def grid_minimum(opt_input, cap_total):
+    base = dict(gross_income=opt_input.gross_income, age=opt_input.age,
+                is_salaried=opt_input.is_salaried, financial_year=opt_input.financial_year)
+    best = calculate_new_regime_tax_fy2025(TaxCalculationInput(regime="new", **base))["final_tax"]
+    for deductions in [*range(0, int(cap_total) + 1, 500), cap_total]:
+        old_input = TaxCalculationInput(regime="old", deductions_80c=deductions, **base)
+        best = min(best, calculate_old_regime_tax_fy2025(old_input)["final_tax"])
+    return best
+
+
+def test_optimum_matches_grid_search():
+    rng = random.Random(13)
+    for _ in range(300):
+        opt_input = DeductionOptimizationInput(
+            gross_income=rng.uniform(200000, 3000000),
+            age=rng.choice([30, 65, 85]),
+            is_salaried=rng.random() < 0.5,
+            max_80c=rng.choice([150000, rng.randrange(0, 150000)]),
+            max_health_insurance_premium=rng.choice([25000, rng.randrange(0, 25000)]),
+            financial_year=rng.choice([None, "2024-25"])
+        )
+        result = optimize_deductions_fy2025(opt_input)
+        cap_total = sum(result["caps"].values())
+
+        assert abs(result["minimum_tax"] - grid_minimum(opt_input, cap_total)) < 1e-6
+        assert result["allocation"]["total"] <= cap_total
+
+
+def test_old_regime_fills_80c_first_and_reports_marginal_saving():
+    result = optimize_deductions_fy2025(DeductionOptimizationInput(
+        gross_income=725000, age=85, is_salaried=False,
+        max_80c=100000, financial_year="2024-25"
+    ))
+
+    assert result["recommended_regime"] == "old"
+    assert result["allocation"] == {"deductions_80c": 100000, "health_insurance_premium": 25000, "total": 125000}
+    # Still in the 5% slab: one more rupee saves 5% plus cess
+    assert abs(result["marginal_saving_per_rupee"] - 0.052) < 1e-6
+
+
+def test_no_marginal_saving_without_statutory_headroom():
+    for gross_income in (725000, 900000, 1200000):
+        at_limits = optimize_deductions_fy2025(DeductionOptimizationInput(
+            gross_income=gross_income, age=85, is_salaried=False, financial_year="2024-25"
+        ))
+        assert at_limits["allocation"]["total"] == 175000
+        assert at_limits["marginal_saving_per_rupee"] == 0
+
+    # 80C is full, but 80D is capped below its statutory limit by the taxpayer
+    health_room = optimize_deductions_fy2025(DeductionOptimizationInput(
+        gross_income=725000, age=85, is_salaried=False,
+        max_health_insurance_premium=10000, financial_year="2024-25"
+    ))
+    assert health_room["allocation"] == {"deductions_80c": 150000, "health_insurance_premium": 10000, "total": 160000}
+    assert abs(health_room["marginal_saving_per_rupee"] - 0.052) < 1e-6
+
+
+def test_caps_bounded_by_statutory_limits():
+    result = optimize_deductions_fy2025(DeductionOptimizationInput(
+        gross_income=5000000, age=30, max_80c=500000, max_health_insurance_premium=100000
+    ))
+
+    assert result["caps"] == {"deductions_80c": 150000, "health_insurance_premium": 25000}
+    assert result["recommended_regime"] == "new"
+    assert result["allocation"]["total"] == 0
@@ -0,0 +1,133 @@
+"""Fixed-point (integer paise) engine against the float calculators and the Act"""
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import calculate_tax_fy2025, TaxCalculationInput
+from app.agents.tax_calculator.fixed_point import calculate_tax_arrays_exact, calculate_tax_exact
+from app.agents.tax_calculator.rules import BUILTIN_RULES, compile_rule_set, merge_rule_data
+from app.agents.tax_calculator.slab_table import div_half_up, to_paise
+
+from .test_vectorized import random_profiles
+
+AMOUNT_FIELDS = ["taxable_income", "tax_before_cess", "cess", "tax_after_cess", "rebate_87a", "final_tax"]
+# Half a paisa, plus the float calculators' own error at exact half-paisa ties
+HALF_PAISA = 0.005 + 1e-6
+
+# Either side of the 87A cliff, and fractional old regime deductions
+EDGE_PROFILES = [
+    TaxCalculationInput(gross_income=1275000.005, age=30, regime="new"),
+    TaxCalculationInput(gross_income=1275000.0049, age=30, regime="new"),
+    TaxCalculationInput(gross_income=1275000.01, age=30, regime="new"),
+    TaxCalculationInput(gross_income=1200000.004, age=30, regime="new", is_salaried=False),
+    TaxCalculationInput(gross_income=1200000, age=30, regime="new", is_salaried=False),
+    TaxCalculationInput(gross_income=500000.005, age=30, regime="old", is_salaried=False),
+    TaxCalculationInput(gross_income=3765432.19, age=45, regime="old",
+                        deductions_80c=123456.785, health_insurance_premium=12345.675),
+    TaxCalculationInput(gross_income=3300000.37, age=65, regime="old",
+                        deductions_80c=0.005, health_insurance_premium=0.005),
+    TaxCalculationInput(gross_income=637500.5, age=30, regime="old",
+                        deductions_80c=100000.25, health_insurance_premium=37500.25)
+]
+
+
+@pytest.mark.parametrize("profiles", [EDGE_PROFILES, random_profiles(2000)], ids=["edges", "random"])
+def test_exact_engine_keeps_the_float_contract_to_half_a_paisa(profiles):
+    for profile in profiles:
+        expected = calculate_tax_fy2025(profile)
+        result = calculate_tax_exact(profile)
+
+        assert result.keys() == expected.keys()
+        for field in AMOUNT_FIELDS:
+            # cess is tax_after_cess - tax_before_cess, two half-paisa roundings
+            tolerance = 2 * HALF_PAISA if field == "cess" else HALF_PAISA
+            assert result[field] == pytest.approx(expected[field], abs=tolerance), (profile, field)
+        # Components always add up exactly in paise
+        assert to_paise(result["tax_before_cess"]) + to_paise(result["cess"]) == to_paise(result["tax_after_cess"])
+        # Slabs the float calculator reaches by less than half a paisa round away
+        assert [slab["slab"] for slab in result["breakdown"]] == [
+            slab["slab"] for slab in expected["breakdown"] if to_paise(slab["taxable_amount"]) > 0
+        ]
+
+
+@pytest.mark.parametrize("statutory", [False, True])
+def test_arrays_match_scalar_exact_engine_bit_for_bit(statutory):
+    profiles = random_profiles(2000)
+    result = calculate_tax_arrays_exact(
+        gross_income=[p.gross_income for p in profiles],
+        age=[p.age for p in profiles],
+        regime=[p.regime for p in profiles],
+        is_salaried=[p.is_salaried for p in profiles],
+        deductions_80c=[p.deductions_80c for p in profiles],
+        health_insurance_premium=[p.health_insurance_premium for p in profiles],
+        statutory=statutory
+    )
+
+    for index, profile in enumerate(profiles):
+        expected = calculate_tax_exact(profile, statutory=statutory)
+        for field in AMOUNT_FIELDS + ["effective_rate", "basic_exemption"]:
+            assert result[field][index] == expected[field], (index, field)
+
+
+def test_statutory_rebate_is_applied_before_cess():
+    # Taxable ₹8L under the new regime: ₹60,000 tax, fully rebated, so no cess either
+    calc_input = TaxCalculationInput(gross_income=1275000, age=30, regime="new")
+
+    assert calculate_tax_exact(calc_input)["final_tax"] == 2400.0  # Current rule order
+    result = calculate_tax_exact(calc_input, statutory=True)
+    assert result["rebate_87a"] == 60000.0
+    assert result["cess"] == 0.0
+    assert result["final_tax"] == 0.0
+
+
+def test_statutory_rounding_to_ten_rupees():
+    # Total income ₹13,37,345 rounds to ₹13,37,350 (s.288A); tax payable to the nearest ₹10 (s.288B)
+    result = calculate_tax_exact(
+        TaxCalculationInput(gross_income=1412345, age=30, regime="new"), statutory=True
+    )
+
+    assert result["taxable_income"] == 937350.0
+    assert result["tax_before_cess"] == 80602.5
+    assert result["cess"] == 3224.1
+    assert result["final_tax"] == 83830.0
+
+
+def test_statutory_marginal_relief_above_the_rebate_limit():
+    # Total income ₹12L-₹12.75L (salaried, after the ₹75,000 standard deduction):
+    # tax before cess is capped at the income over ₹12L
+    gross_incomes = list(range(1275010, 1350001, 10))
+    arrays = calculate_tax_arrays_exact(gross_income=gross_incomes, statutory=True)
+    for index, gross_income in enumerate(gross_incomes):
+        over_limit = gross_income - 1275000
+        tax = 60000 + over_limit * 0.15
+        expected = div_half_up(round(min(tax, over_limit) * 104), 1000) * 10
+
+        result = calculate_tax_exact(TaxCalculationInput(gross_income=gross_income, age=30, regime="new"),
+                                     statutory=True)
+        assert result["final_tax"] == expected, gross_income
+        assert arrays["final_tax"][index] == expected, gross_income
+
+    result = calculate_tax_exact(TaxCalculationInput(gross_income=1276000, age=30, regime="new"), statutory=True)
+    assert result["tax_before_cess"] - result["rebate_87a"] == 1000.0
+    assert result["final_tax"] == 1040.0
+    # The old regime has no marginal relief
+    old = calculate_tax_exact(TaxCalculationInput(gross_income=510000, age=30, regime="old", is_salaried=False),
+                              statutory=True)
+    assert old["rebate_87a"] == 0.0
+
+
+def test_half_paisa_rounds_up():
+    assert to_paise(0.005) == 1
+    assert div_half_up(5, 10) == 1
+    assert div_half_up(4, 10) == 0
+
+
+def test_rates_finer_than_a_basis_point_are_rejected():
+    data = merge_rule_data(BUILTIN_RULES, {"cess_percent": 4.125})
+
+    with pytest.raises(ValueError, match="basis point"):
+        compile_rule_set(data)
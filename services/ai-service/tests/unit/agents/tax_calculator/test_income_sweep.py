@@ -0,0 +1,43 @@
+"""Income sweep columns against the scalar FY 2025-26 calculators"""
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.income_sweep import income_sweep_fy2025, sweep_points
+
+CALCULATORS = {"new": calculate_new_regime_tax_fy2025, "old": calculate_old_regime_tax_fy2025}
+
+
+def test_sweep_matches_scalar_calculators():
+    sweep = income_sweep_fy2025(0, 3000000, 2500, age=65, deductions_80c=150000)
+    assert sweep["points"] == len(sweep["gross_income"]) == 1201
+
+    for index in range(0, sweep["points"], 7):
+        gross = sweep["gross_income"][index]
+        for regime, calculate in CALCULATORS.items():
+            result = calculate(TaxCalculationInput(gross, 65, regime, True, 150000))
+            assert sweep["regimes"][regime]["final_tax"][index] == round(result["final_tax"], 2)
+
+            # Marginal rate is the slope of final tax to the right of the point
+            step = calculate(TaxCalculationInput(gross + 0.01, 65, regime, True, 150000))
+            slope = (step["final_tax"] - result["final_tax"]) / 0.01 * 100
+            if slope < 100:  # the 87A rebate cliff is a jump, not a rate
+                assert abs(sweep["regimes"][regime]["marginal_rate"][index] - slope) < 0.01
+
+
+def test_single_regime_and_grid_bounds():
+    sweep = income_sweep_fy2025(100000, 100500, 100, regimes=("new",))
+
+    assert list(sweep["regimes"]) == ["new"]
+    assert sweep["gross_income"] == [100000, 100100, 100200, 100300, 100400, 100500]
+    with pytest.raises(ValueError):
+        sweep_points(10, 5, 1)
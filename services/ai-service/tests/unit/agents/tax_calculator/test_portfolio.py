@@ -0,0 +1,71 @@
+"""Portfolio aggregates against the scalar FY 2025-26 calculators"""
+import random
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.portfolio import MIN_RATE_BIN_WIDTH, analyze_portfolio
+
+
+def client_book(count, seed=17):
+    rng = random.Random(seed)
+    return [{
+        "income": rng.randint(200000, 4000000),
+        "age": rng.choice([30, 45, 65, 82]),
+        "regime": rng.choice(["new", "old"]),
+        "is_salaried": rng.random() < 0.7,
+        "deductions_80c": rng.randint(0, 150000),
+        "health_insurance_premium": rng.randint(0, 25000)
+    } for _ in range(count)]
+
+
+def test_aggregates_match_scalar_calculators():
+    book = client_book(400)
+    analytics = analyze_portfolio(book)
+
+    current_total, switchers, rebate_zone = 0, {"new": 0, "old": 0}, {"new": 0, "old": 0}
+    for record in book:
+        calc_input = TaxCalculationInput(record["income"], record["age"], record["regime"],
+                                         record["is_salaried"], record["deductions_80c"],
+                                         record["health_insurance_premium"])
+        new = calculate_new_regime_tax_fy2025(calc_input)
+        old = calculate_old_regime_tax_fy2025(calc_input)
+        current, alternative = (new, old) if record["regime"] == "new" else (old, new)
+        current_total += current["final_tax"]
+        switchers[record["regime"]] += alternative["final_tax"] < current["final_tax"]
+        rebate_zone[record["regime"]] += current["rebate_87a"] > 0
+
+    assert analytics["clients"] == 400
+    assert abs(analytics["total_liability"] - current_total) < 0.01
+    assert analytics["switching"]["clients_who_save"] == [switchers["new"], switchers["old"]]
+    assert analytics["regimes"]["clients_in_rebate_zone"] == [rebate_zone["new"], rebate_zone["old"]]
+    assert sum(analytics["effective_rate_histogram"]["clients"]) == 400
+    assert sum(analytics["slabs"]["new"]["clients"]) == analytics["regimes"]["clients"][0]
+
+
+def test_invalid_records_are_reported_and_per_client_columns():
+    book = client_book(5) + [{"income": -1, "age": 30, "regime": "new"},
+                             {"income": 900000, "age": 30, "regime": "new", "financial_year": "2024-25"}]
+    analytics = analyze_portfolio(book, include_clients=True)
+
+    assert analytics["clients"] == 5
+    assert [error["index"] for error in analytics["errors"]] == [5, 6]
+    assert analytics["client_results"]["index"] == [0, 1, 2, 3, 4]
+
+
+def test_rate_bin_width_is_bounded():
+    analytics = analyze_portfolio(client_book(50), rate_bin_width=MIN_RATE_BIN_WIDTH)
+    assert len(analytics["effective_rate_histogram"]["clients"]) <= 1000
+
+    for width in (1e-9, 0, float("nan")):
+        with pytest.raises(ValueError):
+            analyze_portfolio(client_book(5), rate_bin_width=width)
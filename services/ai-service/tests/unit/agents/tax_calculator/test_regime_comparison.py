@@ -0,0 +1,62 @@
+"""Regime comparison and its analytic breakeven deduction"""
+import random
+import sys
+import os
+from dataclasses import replace
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.regime_comparison import compare_regimes_fy2025
+
+
+def old_tax_with(calc_input, deductions):
+    probe = replace(calc_input, deductions_80c=deductions, health_insurance_premium=0)
+    return calculate_old_regime_tax_fy2025(probe)["final_tax"]
+
+
+def test_comparison_matches_both_calculators():
+    calc_input = TaxCalculationInput(gross_income=1800000, age=35, regime="old",
+                                     deductions_80c=150000, health_insurance_premium=25000)
+    comparison = compare_regimes_fy2025(calc_input)
+
+    new_tax = calculate_new_regime_tax_fy2025(calc_input)["final_tax"]
+    old_tax = calculate_old_regime_tax_fy2025(calc_input)["final_tax"]
+    assert comparison["new_regime"]["final_tax"] == new_tax
+    assert comparison["old_regime"]["final_tax"] == old_tax
+    assert comparison["recommended_regime"] == ("old" if old_tax < new_tax else "new")
+    assert comparison["savings"] == abs(new_tax - old_tax)
+
+
+def test_breakeven_is_the_smallest_whole_rupee_deduction():
+    rng = random.Random(12)
+    for _ in range(2000):
+        calc_input = TaxCalculationInput(
+            gross_income=round(rng.uniform(0, 4000000), rng.choice([0, 2])),
+            age=rng.choice([30, 65, 85]),
+            regime="new",
+            is_salaried=rng.random() < 0.5,
+            financial_year=rng.choice([None, "2024-25"])
+        )
+        comparison = compare_regimes_fy2025(calc_input)
+        new_tax = comparison["new_regime"]["final_tax"]
+        breakeven = comparison["breakeven"]["breakeven_total_deductions"]
+
+        assert old_tax_with(calc_input, breakeven) <= new_tax
+        if breakeven > 0:
+            assert old_tax_with(calc_input, breakeven - 1) > new_tax
+
+
+def test_breakeven_reports_remaining_deduction_and_limits():
+    calc_input = TaxCalculationInput(gross_income=1500000, age=30, regime="new",
+                                     deductions_80c=100000)
+    breakeven = compare_regimes_fy2025(calc_input)["breakeven"]
+
+    assert breakeven["additional_deductions_needed"] == breakeven["breakeven_total_deductions"] - 100000
+    assert breakeven["max_eligible_deductions"] == 175000
+    assert breakeven["achievable_within_limits"] is False
@@ -0,0 +1,72 @@
+"""Reverse calculator round trips through the scalar FY 2025-26 calculators"""
+import random
+import sys
+import os
+from dataclasses import replace
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.reverse_calculator import reverse_calculate_fy2025
+
+CALCULATORS = {"new": calculate_new_regime_tax_fy2025, "old": calculate_old_regime_tax_fy2025}
+
+
+def final_tax(calc_input, regime, gross_income):
+    return CALCULATORS[regime](replace(calc_input, gross_income=gross_income))["final_tax"]
+
+
+def test_net_and_tax_round_trip():
+    rng = random.Random(14)
+    for _ in range(500):
+        calc_input = TaxCalculationInput(
+            gross_income=0,
+            age=rng.choice([30, 65, 85]),
+            regime="new",
+            is_salaried=rng.random() < 0.5,
+            deductions_80c=rng.uniform(0, 150000),
+            health_insurance_premium=rng.uniform(0, 25000),
+            financial_year=rng.choice([None, "2024-25"])
+        )
+        gross = rng.uniform(0, 4000000)
+        for regime in ("new", "old"):
+            tax = final_tax(calc_input, regime, gross)
+
+            by_net = reverse_calculate_fy2025(calc_input, "net", gross - tax, (regime,))["results"][regime]
+            assert by_net["exact"]
+            assert by_net["gross_income"] <= gross + 1e-6
+
+            by_tax = reverse_calculate_fy2025(calc_input, "tax", tax, (regime,))["results"][regime]
+            assert by_tax["exact"]
+            assert by_tax["gross_income"] >= gross - 1e-6
+            assert final_tax(calc_input, regime, by_tax["gross_income"] + 1) > tax
+
+
+def test_rebate_cliff_at_12_lakh():
+    calc_input = TaxCalculationInput(gross_income=0, age=30, regime="new")
+    result = reverse_calculate_fy2025(calc_input, "net", 1300000, ("new",))["results"]["new"]
+    cliff = result["rebate_cliff"]
+
+    # ₹12L after the ₹75K standard deduction; take-home only recovers well above it
+    assert cliff["gross_income_limit"] == 1275000
+    assert cliff["take_home_recovered_at"] > cliff["gross_income_limit"]
+    recovered = cliff["take_home_recovered_at"]
+    assert abs(recovered - final_tax(calc_input, "new", recovered) - cliff["take_home_at_limit"]) < 0.01
+
+    # Take-home just under the limit is reached below it, not in the cliff band
+    below = reverse_calculate_fy2025(calc_input, "net", cliff["take_home_at_limit"], ("new",))["results"]["new"]
+    assert below["gross_income"] <= cliff["gross_income_limit"]
+
+
+def test_target_tax_inside_the_rebate_gap_is_not_exact():
+    calc_input = TaxCalculationInput(gross_income=0, age=30, regime="new")
+    result = reverse_calculate_fy2025(calc_input, "tax", 30000, ("new",))["results"]["new"]
+
+    assert result["exact"] is False
+    assert result["gross_income"] == 1275000
+    assert result["final_tax"] < 30000
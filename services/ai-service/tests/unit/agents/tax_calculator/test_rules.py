@@ -0,0 +1,79 @@
+"""Unit tests for the financial-year rule registry"""
+import copy
+import json
+import sys
+import os
+import time
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.rules import BUILTIN_RULES, RuleRegistry, merge_rule_data, rule_registry
+
+
+def write_rules(directory, data):
+    path = directory / f"fy{data['financial_year']}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_repository_rule_files_are_loaded():
+    assert {"2024-25", "2025-26"} <= set(rule_registry.financial_years())
+
+
+def test_calculation_uses_requested_financial_year():
+    fy2025 = calculate_new_regime_tax_fy2025(TaxCalculationInput(gross_income=1000000, age=30, regime="new"))
+    fy2024 = calculate_new_regime_tax_fy2025(TaxCalculationInput(
+        gross_income=1000000, age=30, regime="new", financial_year="2024-25"
+    ))
+
+    assert fy2025["final_tax"] == 0
+    assert fy2024["financial_year"] == "2024-25"
+    assert fy2024["final_tax"] == pytest.approx(44200)
+
+
+def test_hot_reload_swaps_in_changed_rules(tmp_path):
+    rules = copy.deepcopy(BUILTIN_RULES)
+    path = write_rules(tmp_path, rules)
+    registry = RuleRegistry(rules_dir=tmp_path, default_year="2025-26", reload_interval=0.001)
+    before = registry.get()
+
+    rules["regimes"]["new"]["rebate_87a"]["max_rebate"] = 70000
+    path.write_text(json.dumps(rules), encoding="utf-8")
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    time.sleep(0.01)
+
+    after = registry.get()
+    assert before.new.rebate_max == 60000  # in-flight holders keep their rule set
+    assert after.new.rebate_max == 70000
+    assert after is not before
+
+
+def test_broken_rule_file_keeps_previous_rules(tmp_path):
+    path = write_rules(tmp_path, BUILTIN_RULES)
+    registry = RuleRegistry(rules_dir=tmp_path, default_year="2025-26", reload_interval=0)
+
+    path.write_text('{"financial_year": "2025-26", "regimes": {}}', encoding="utf-8")
+    registry.load()
+
+    assert registry.get().new.rebate_max == 60000
+    assert "missing required key" in registry.last_error
+
+
+def test_unknown_financial_year_is_rejected():
+    with pytest.raises(ValueError, match="No tax rules for financial year 1999-00"):
+        rule_registry.get("1999-00")
+
+
+def test_merge_rule_data_merges_objects_and_replaces_lists():
+    base = {"cess_percent": 4, "regimes": {"new": {"standard_deduction": 75000, "slabs": [1, 2]}}}
+    merged = merge_rule_data(base, {"regimes": {"new": {"slabs": [3]}}})
+
+    assert merged == {"cess_percent": 4, "regimes": {"new": {"standard_deduction": 75000, "slabs": [3]}}}
+    assert base["regimes"]["new"]["slabs"] == [1, 2]
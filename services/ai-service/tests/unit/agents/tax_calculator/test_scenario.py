@@ -0,0 +1,77 @@
+"""Policy scenarios: chunked vectorized totals against the scalar calculators"""
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_new_regime_tax_fy2025,
+    calculate_old_regime_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.scenario import SyntheticPopulation, build_scenario_rules, run_scenario
+
+PROPOSAL = {"regimes": {"new": {"rebate_87a": {"income_limit": 1500000, "max_rebate": 90000}}}}
+
+
+def scalar_revenue(population, rules, chunk_size):
+    revenue = 0.0
+    for columns in population.chunks(chunk_size, rules):
+        for person in range(columns["income"].size):
+            calc_input = TaxCalculationInput(
+                gross_income=float(columns["income"][person]),
+                age=int(columns["age"][person]),
+                regime="new",
+                is_salaried=bool(columns["is_salaried"][person]),
+                deductions_80c=min(float(columns["deductions_80c"][person]), rules.deduction_limits["80C"]),
+                health_insurance_premium=min(float(columns["health_insurance_premium"][person]),
+                                             rules.deduction_limits["80D"])
+            )
+            new_tax = calculate_new_regime_tax_fy2025(calc_input, rules)["final_tax"]
+            old_tax = calculate_old_regime_tax_fy2025(calc_input, rules)["final_tax"]
+            revenue += min(new_tax, old_tax)
+    return revenue
+
+
+def test_revenue_matches_scalar_calculators():
+    baseline, alternative = build_scenario_rules(alternative_overrides=PROPOSAL)
+    population = SyntheticPopulation(size=500, seed=3)
+    result = run_scenario(baseline, alternative, population, chunk_size=128)
+
+    assert result["population"]["people"] == 500
+    assert result["population"]["chunks"] == 4
+    assert abs(result["revenue"]["baseline"] - scalar_revenue(population, baseline, 128)) < 0.01
+    assert abs(result["revenue"]["alternative"] - scalar_revenue(population, alternative, 128)) < 0.01
+    # A more generous rebate has no losers
+    assert sum(result["bands"]["losers"]) == 0
+    assert sum(result["bands"]["winners"]) > 0
+
+
+def test_unchanged_rules_and_determinism():
+    baseline, alternative = build_scenario_rules()
+    first = run_scenario(baseline, alternative, SyntheticPopulation(size=2000, seed=9), chunk_size=500)
+    second = run_scenario(baseline, alternative, SyntheticPopulation(size=2000, seed=9), chunk_size=500)
+
+    assert first["revenue"]["delta"] == 0
+    assert sum(first["bands"]["unchanged"]) == 2000
+    assert first["bands"] == second["bands"]
+
+
+def test_deduction_limit_overrides_change_revenue():
+    baseline, alternative = build_scenario_rules(
+        alternative_overrides={"deduction_limits": {"80C": 200000, "80D": 50000}}
+    )
+    population = SyntheticPopulation(size=2000, seed=5)
+    result = run_scenario(baseline, alternative, population, chunk_size=500, regime_choice="recorded")
+
+    assert result["revenue"]["delta"] < 0
+    assert sum(result["bands"]["losers"]) == 0
+    assert abs(result["revenue"]["alternative"] - sum(result["bands"]["alternative_tax"])) < 1
+
+
+def test_invalid_proposal_is_rejected():
+    with pytest.raises(ValueError):
+        build_scenario_rules(alternative_overrides={"regimes": {"new": {"slabs": []}}})
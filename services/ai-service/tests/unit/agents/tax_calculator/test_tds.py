@@ -0,0 +1,89 @@
+"""Monthly TDS ledger: incremental recalculation and year-end reconciliation"""
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import calculate_tax_fy2025, TaxCalculationInput
+from app.agents.tax_calculator.tds import TdsLedger
+
+ROSTER = [
+    {"employee_id": "E1", "monthly_salary": 150000, "age": 35, "regime": "new"},
+    {"employee_id": "E2", "monthly_salary": 90000, "age": 62, "regime": "old", "deductions_80c": 150000},
+    {"employee_id": "E3", "monthly_salary": 250000, "age": 45, "regime": "new"}
+]
+
+
+def annual_tax(ledger, employee_id, regime, age, deductions_80c=0):
+    row = ledger.employee_ids.index(employee_id)
+    return calculate_tax_fy2025(TaxCalculationInput(
+        gross_income=float(ledger.columns["income_to_date"][row]),
+        age=age,
+        regime=regime,
+        deductions_80c=deductions_80c
+    ))["final_tax"]
+
+
+def test_year_of_events_deducts_the_annual_tax():
+    ledger = TdsLedger.from_records(ROSTER)
+    events = {
+        3: [{"type": "salary", "employee_id": "E1", "amount": 180000}],
+        6: [{"type": "bonus", "employee_id": "E3", "amount": 400000},
+            {"type": "declaration", "employee_id": "E2", "deductions_80c": 100000}],
+        9: [{"type": "join", "employee": {"employee_id": "E4", "monthly_salary": 200000, "income_to_date": 1200000,
+                                          "tds_to_date": 90000}}]
+    }
+
+    recalculated = []
+    for month in range(1, 13):
+        result = ledger.close_month(events.get(month, ()))
+        recalculated.append(result["recalculated"])
+
+    # Everyone on the first run, afterwards only employees with events
+    assert recalculated == [3, 0, 1, 0, 0, 2, 0, 0, 1, 0, 0, 0]
+    tds_to_date = dict(zip(ledger.employee_ids, ledger.columns["tds_to_date"]))
+    assert tds_to_date["E1"] == pytest.approx(annual_tax(ledger, "E1", "new", 35), abs=1)
+    assert tds_to_date["E2"] == pytest.approx(annual_tax(ledger, "E2", "old", 62, 100000), abs=1)
+    assert tds_to_date["E3"] == pytest.approx(annual_tax(ledger, "E3", "new", 45), abs=1)
+    assert tds_to_date["E4"] == pytest.approx(annual_tax(ledger, "E4", "new", 30), abs=1)
+
+    with pytest.raises(ValueError, match="already closed"):
+        ledger.close_month()
+
+
+def test_exit_deducts_the_balance_in_the_last_month():
+    ledger = TdsLedger.from_records(ROSTER[2:])
+    for _ in range(7):
+        ledger.close_month()
+
+    # Full and final settlement: the tax on it cannot be spread over later months
+    result = ledger.close_month([{"type": "exit", "employee_id": "E3"},
+                                 {"type": "bonus", "employee_id": "E3", "amount": 1500000}])
+
+    assert result["register"]["tds"][0] > result["register"]["tds_to_date"][0] / 2
+    assert ledger.columns["tds_to_date"][0] == pytest.approx(annual_tax(ledger, "E3", "new", 45), abs=1)
+    assert ledger.close_month()["register"]["tds"] == [0.0]
+
+
+def test_projection_matches_the_months_closed_later():
+    ledger = TdsLedger.from_records(ROSTER)
+    ledger.close_month()
+    ledger.apply_event({"type": "bonus", "employee_id": "E3", "amount": 300000})
+
+    projection = ledger.project("E3")
+    restored = TdsLedger.from_state(ledger.to_state())
+    restored.apply_event({"type": "bonus", "employee_id": "E3", "amount": 300000})
+    closed = [restored.close_month()["register"]["tds"][2] for _ in range(11)]
+
+    assert projection["schedule"]["month"][0] == "May"
+    assert projection["schedule"]["tds"] == closed
+
+
+def test_unknown_employee_is_rejected():
+    ledger = TdsLedger.from_records(ROSTER)
+
+    with pytest.raises(ValueError, match="Unknown employee"):
+        ledger.apply_event({"type": "bonus", "employee_id": "E9", "amount": 1000})
@@ -0,0 +1,63 @@
+"""Vectorized engine must match the scalar FY 2025-26 calculators exactly"""
+import random
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../'))
+
+from app.agents.tax_calculator.calculator_fy2025 import (
+    calculate_tax_fy2025,
+    TaxCalculationInput
+)
+from app.agents.tax_calculator.vectorized import calculate_tax_arrays, breakdown_for
+
+NUMERIC_FIELDS = [
+    "taxable_income", "tax_before_cess", "cess", "tax_after_cess",
+    "rebate_87a", "final_tax", "effective_rate", "basic_exemption",
+]
+
+
+def random_profiles(count: int, seed: int = 2025):
+    rng = random.Random(seed)
+    incomes = [1, 400000, 475000, 1200000, 1275000, 1275001, 2400000, 2475000, 500000, 750000]
+    profiles = []
+    for index in range(count):
+        income = incomes[index] if index < len(incomes) else round(rng.lognormvariate(13.7, 0.8), rng.choice([0, 2]))
+        profiles.append(TaxCalculationInput(
+            gross_income=income,
+            age=rng.choice([25, 45, 60, 72, 80, 90]),
+            regime=rng.choice(["new", "old"]),
+            is_salaried=rng.random() < 0.8,
+            deductions_80c=rng.choice([0, 50000, 150000]),
+            health_insurance_premium=rng.choice([0, 25000, 12345.67])
+        ))
+    return profiles
+
+
+def test_vectorized_matches_scalar_bit_for_bit():
+    profiles = random_profiles(3000)
+
+    result = calculate_tax_arrays(
+        gross_income=[p.gross_income for p in profiles],
+        age=[p.age for p in profiles],
+        regime=[p.regime for p in profiles],
+        is_salaried=[p.is_salaried for p in profiles],
+        deductions_80c=[p.deductions_80c for p in profiles],
+        health_insurance_premium=[p.health_insurance_premium for p in profiles],
+        include_breakdown=True
+    )
+
+    for index, profile in enumerate(profiles):
+        expected = calculate_tax_fy2025(profile)
+        for field in NUMERIC_FIELDS:
+            assert result[field][index] == expected[field], (profile, field)
+        assert breakdown_for(result, index) == expected["breakdown"], profile
+
+
+def test_scalars_broadcast_against_income_array():
+    result = calculate_tax_arrays([1200000, 1800000], age=35, regime="new")
+
+    assert list(result["final_tax"]) == [0.0, calculate_tax_fy2025(
+        TaxCalculationInput(gross_income=1800000, age=35, regime="new")
+    )["final_tax"]]
@@ -0,0 +1,320 @@
+"""API tests for the tax calculation routes with Bedrock stubbed out"""
+import asyncio
+import pstats
+import subprocess
+import sys
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
+
+from app.core.config import settings
+from app.core.profiling import ProfilingMiddleware
+from app.main import app, create_application
+from app.services.ai_service import ai_service
+
+PAYLOAD = {"income": 1800000, "age": 35, "regime": "new", "is_salaried": True}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fake_insights(tax_data, calculation_result, use_cache=True):
+        await asyncio.sleep(0.05)
+        return f"insights for ₹{calculation_result['final_tax']:,.0f}"
+
+    async def fake_stream(tax_data, calculation_result, use_cache=True):
+        for chunk in ["Invest ", "in ", "NPS"]:
+            yield chunk
+
+    monkeypatch.setattr(ai_service, "generate_tax_insights", fake_insights)
+    monkeypatch.setattr(ai_service, "stream_tax_insights", fake_stream)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_calculate_returns_inline_insights(client):
+    response = client.post("/api/v1/tax/calculate", json=PAYLOAD)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ai_insights_status"] == "completed"
+    assert body["ai_insights"].startswith("insights for")
+    assert body["insight_id"] is None
+
+
+def test_compact_and_field_selection(client):
+    full = client.post("/api/v1/tax/calculate", json=PAYLOAD).json()
+    compact = client.post("/api/v1/tax/calculate?compact=true", json=PAYLOAD).json()
+
+    assert "breakdown" in full and "budget_compliance" in full
+    assert "breakdown" not in compact and "message" not in compact
+    assert compact["final_tax"] == full["final_tax"]
+    assert compact["ai_insights_status"] == "completed"
+
+    selected = client.post("/api/v1/tax/calculate?fields=final_tax,breakdown", json=PAYLOAD).json()
+    assert selected == {"final_tax": full["final_tax"], "breakdown": full["breakdown"]}
+
+    response = client.post("/api/v1/tax/calculate?fields=final_tax,bogus", json=PAYLOAD)
+    assert response.status_code == 422
+
+
+def test_metrics_reports_stage_latencies(client):
+    client.post("/api/v1/tax/calculate", json=PAYLOAD)
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    for stage in ("validation", "calculation", "serialization"):
+        assert f'tax_stage_duration_seconds_count{{stage="{stage}"}}' in response.text
+    assert 'tax_stage_duration_seconds_bucket{stage="calculation",le="+Inf"}' in response.text
+    assert "# TYPE bedrock_in_flight gauge" in response.text
+
+
+def test_profiling_dumps_requests_that_ask_for_it(client, monkeypatch, tmp_path):
+    assert not any(middleware.cls is ProfilingMiddleware for middleware in app.user_middleware)
+
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    monkeypatch.setattr(settings, "profiling_token", "secret")
+    monkeypatch.setattr(settings, "profile_dir", str(tmp_path))
+    with TestClient(create_application()) as profiled:
+        plain = profiled.post("/api/v1/tax/calculate", json=PAYLOAD)
+        wrong_token = profiled.post("/api/v1/tax/calculate", json=PAYLOAD, headers={"X-Profile": "1"})
+        response = profiled.post("/api/v1/tax/calculate", json=PAYLOAD,
+                                 headers={"X-Profile": "secret", "X-Request-ID": "req-42"})
+
+    assert "x-profile-path" not in plain.headers and "x-profile-path" not in wrong_token.headers
+    path = response.headers["x-profile-path"]
+    assert path.startswith(str(tmp_path)) and path.endswith("-req-42.prof")
+    functions = {name for _, _, name in pstats.Stats(path).stats}
+    assert "calculate_tax_with_ai_insights" in functions
+
+
+def test_async_insights_returns_immediately_and_is_fetchable(client):
+    response = client.post("/api/v1/tax/calculate?async_insights=true", json=PAYLOAD)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ai_insights_status"] == "pending"
+    assert body["ai_insights"] is None
+    assert body["final_tax"] > 0
+
+    insight = client.get(f"/api/v1/tax/insights/{body['insight_id']}").json()
+    for _ in range(50):
+        if insight["status"] != "pending":
+            break
+        client.portal.call(asyncio.sleep, 0.01)
+        insight = client.get(f"/api/v1/tax/insights/{body['insight_id']}").json()
+
+    assert insight["status"] == "completed"
+    assert insight["ai_insights"].startswith("insights for")
+
+
+def test_latency_budget_returns_calculation_and_parks_insights(client):
+    response = client.post(
+        "/api/v1/tax/calculate",
+        json=PAYLOAD,
+        headers={"X-Latency-Budget-Ms": "5"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ai_insights_status"] == "timed_out"
+    assert body["ai_insights_pending"] is True
+    assert body["final_tax"] > 0
+
+    client.portal.call(asyncio.sleep, 0.1)
+    insight = client.get(f"/api/v1/tax/insights/{body['insight_id']}").json()
+    assert insight["status"] == "completed"
+
+
+def test_unknown_insight_id_is_404(client):
+    response = client.get("/api/v1/tax/insights/does-not-exist")
+
+    assert response.status_code == 404
+
+
+def test_stream_sends_calculation_first_then_insight_chunks(client):
+    with client.stream("POST", "/api/v1/tax/calculate/stream", json=PAYLOAD) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    events = [block.split("\n")[0] for block in body.strip().split("\n\n")]
+    assert events == [
+        "event: calculation",
+        "event: insight",
+        "event: insight",
+        "event: insight",
+        "event: done",
+    ]
+    assert '"final_tax"' in body.split("\n\n")[0]
+
+
+def test_batch_returns_compact_rows_and_per_row_errors(client):
+    records = [
+        PAYLOAD,
+        {"income": -5, "age": 30, "regime": "new"},
+        {"income": 900000, "age": 65, "regime": "old", "deductions_80c": 150000},
+        "not-a-record",
+    ]
+
+    response = client.post("/api/v1/tax/calculate/batch", json={"records": records})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 4
+    assert body["succeeded"] == 2
+    assert [row[0] for row in body["rows"]] == [0, 2]
+    assert [error["index"] for error in body["errors"]] == [1, 3]
+    assert body["errors"][0]["errors"][0]["field"] == "income"
+
+    single = client.post("/api/v1/tax/calculate", json=PAYLOAD).json()
+    final_tax = body["rows"][0][body["columns"].index("final_tax")]
+    assert final_tax == single["final_tax"]
+
+
+def test_batch_rejects_non_list_payload(client):
+    response = client.post("/api/v1/tax/calculate/batch", json={"rows": []})
+
+    assert response.status_code == 422
+
+
+def test_batch_rejects_oversized_body_before_reading_it(client, monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_rows", 4)
+    monkeypatch.setattr(settings, "batch_max_record_bytes", 100)
+    records = [PAYLOAD] * 10
+
+    response = client.post("/api/v1/tax/calculate/batch", json=records)
+    assert response.status_code == 413
+    assert "400 bytes" in response.json()["detail"]
+
+    def chunked():
+        for record in records:
+            yield (str(record) + "\n").encode()
+
+    response = client.post("/api/v1/tax/portfolio", content=chunked())
+    assert response.status_code == 413
+
+    response = client.post("/api/v1/tax/calculate/batch", json=records[:2])
+    assert response.status_code == 200
+
+
+def test_compare_makes_one_insight_call(client, monkeypatch):
+    calls = []
+
+    async def fake_comparison_insights(tax_data, comparison, use_cache=True):
+        calls.append(comparison["recommended_regime"])
+        return "choose wisely"
+
+    monkeypatch.setattr(ai_service, "generate_comparison_insights", fake_comparison_insights)
+    response = client.post("/api/v1/tax/compare?include_insights=true", json=PAYLOAD)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["new_regime"]["regime"] == "new"
+    assert body["old_regime"]["regime"] == "old"
+    assert body["breakeven"]["breakeven_total_deductions"] > 0
+    assert body["ai_insights"] == "choose wisely"
+    assert calls == [body["recommended_regime"]]
+
+
+def test_reverse_solves_gross_for_target_net(client):
+    response = client.post("/api/v1/tax/reverse", json={
+        "target_type": "net", "target_amount": 1500000, "age": 35, "regime": "new"
+    })
+
+    assert response.status_code == 200
+    result = response.json()["results"]["new"]
+    assert result["exact"] is True
+    assert abs(result["take_home"] - 1500000) < 0.01
+
+
+def test_sweep_returns_columns_and_limits_points(client):
+    response = client.post("/api/v1/tax/sweep", json={"start": 0, "stop": 2000000, "step": 1000})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["points"] == 2001
+    assert len(body["regimes"]["new"]["final_tax"]) == 2001
+    assert len(body["regimes"]["old"]["marginal_rate"]) == 2001
+
+    too_many = client.post("/api/v1/tax/sweep", json={"start": 0, "stop": 100000000, "step": 1})
+    assert too_many.status_code == 413
+
+
+def test_portfolio_accepts_csv_client_book(client):
+    csv_body = "income,age,regime,deductions_80c\n1800000,35,new,0\n900000,40,old,150000\n-5,30,new,0\n"
+    response = client.post(
+        "/api/v1/tax/portfolio",
+        content=csv_body,
+        headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["clients"] == 2
+    assert body["rejected"] == 1
+    assert body["regimes"]["clients"] == [1, 1]
+
+    response = client.post("/api/v1/tax/portfolio?rate_bin_width=1e-9", json=[PAYLOAD])
+    assert response.status_code == 422
+
+
+def test_scenario_reports_revenue_delta_by_band(client):
+    response = client.post("/api/v1/tax/scenario", json={
+        "alternative": {"cess_percent": 5},
+        "population": {"size": 5000, "seed": 1},
+        "income_bands": [0, 1000000, 2000000]
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["revenue"]["delta"] > 0
+    assert body["bands"]["band_end"] == [1000000, 2000000, None]
+    assert sum(body["bands"]["people"]) == 5000
+
+
+def test_tds_projection_spreads_tax_over_remaining_months(client):
+    response = client.post("/api/v1/tax/tds/projection", json={
+        "employee": {"employee_id": "E1", "monthly_salary": 150000, "income_to_date": 450000, "tds_to_date": 12000},
+        "months_closed": 3,
+        "events": [{"type": "bonus", "employee_id": "E1", "amount": 100000}]
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["projected_annual_income"] == 1900000
+    assert body["schedule"]["month"][0] == "Jul"
+    assert body["schedule"]["gross_pay"][0] == 250000
+    assert sum(body["schedule"]["tds"]) == pytest.approx(body["projected_annual_tax"] - 12000, abs=1)
+
+    response = client.post("/api/v1/tax/tds/projection", json={
+        "employee": {"employee_id": "E1", "monthly_salary": 150000},
+        "events": [{"type": "bonus", "employee_id": "E2", "amount": 100000}]
+    })
+    assert response.status_code == 422
+
+
+def test_calculation_only_worker_never_imports_the_aws_sdk():
+    probe = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "with TestClient(app) as client:\n"
+        "    body = client.post('/api/v1/tax/calculate', json={'income': 1800000, 'age': 35, 'regime': 'new'}).json()\n"
+        "    health = client.get('/health').json()\n"
+        "assert body['ai_insights_status'] == 'disabled', body\n"
+        "assert health['ai_status'] == 'disabled' and health['startup']['startup_ms'] is not None, health\n"
+        "assert not {'boto3', 'botocore', 'langchain_core'} & set(sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=os.path.join(os.path.dirname(__file__), '../../../'),
+        env={**os.environ, "SERVICE_MODE": "calculation"},
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
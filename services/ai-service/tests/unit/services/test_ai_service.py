@@ -0,0 +1,315 @@
+"""Unit tests for the Bedrock AI service"""
+import asyncio
+import io
+import json
+import sys
+import threading
+import os
+import time
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
+
+from botocore.exceptions import ClientError
+
+from app.agents.tax_calculator.calculator_fy2025 import TaxCalculationInput
+from app.agents.tax_calculator.regime_comparison import compare_regimes_fy2025
+from app.core.config import settings
+from app.core.metrics import bedrock_calls, bedrock_errors, bedrock_tokens, stage_duration
+from app.services.ai_service import BedrockAIService
+from app.services.insight_cache import insight_cache
+
+
+class FakeBedrockClient:
+    """Blocking stand-in for the boto3 bedrock-runtime client"""
+
+    def __init__(self, delay: float = 0.0, text: str = "insight"):
+        self.delay = delay
+        self.text = text
+        self.calls = 0
+
+    def invoke_model(self, modelId, body, contentType):
+        self.calls += 1
+        time.sleep(self.delay)
+        payload = {"content": [{"type": "text", "text": self.text}],
+                   "usage": {"input_tokens": 120, "output_tokens": 30}}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+class FlakyBedrockClient(FakeBedrockClient):
+    """Raises the given ClientError codes before succeeding"""
+
+    def __init__(self, error_codes):
+        super().__init__()
+        self.error_codes = list(error_codes)
+
+    def invoke_model(self, modelId, body, contentType):
+        if self.error_codes:
+            self.calls += 1
+            code = self.error_codes.pop(0)
+            raise ClientError({"Error": {"Code": code, "Message": code}}, "InvokeModel")
+        return super().invoke_model(modelId, body, contentType)
+
+
+class FakeStreamingBedrockClient:
+    """Stand-in for invoke_model_with_response_stream yielding canned chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def invoke_model_with_response_stream(self, modelId, body, contentType):
+        def events():
+            yield {"chunk": {"bytes": json.dumps({"type": "message_start"}).encode()}}
+            for text in self.chunks:
+                delta = {"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}}
+                yield {"chunk": {"bytes": json.dumps(delta).encode()}}
+            yield {"chunk": {"bytes": json.dumps({"type": "message_stop"}).encode()}}
+
+        return {"body": events()}
+
+
+def make_service(client) -> BedrockAIService:
+    service = BedrockAIService()
+    service.client = client
+    return service
+
+
+def test_bedrock_call_does_not_block_event_loop():
+    """A slow Bedrock round trip must leave the loop free for other requests"""
+    service = make_service(FakeBedrockClient(delay=0.3))
+
+    async def scenario():
+        insight_task = asyncio.create_task(service.invoke_model_with_retry("prompt"))
+        await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        loop_latency = time.perf_counter() - started
+
+        return loop_latency, await insight_task
+
+    loop_latency, insight = asyncio.run(scenario())
+
+    assert insight == "insight"
+    assert loop_latency < 0.1
+    assert service.get_stats()["completed"] == 1
+
+
+def test_queue_depth_limit_sheds_excess_calls():
+    """Calls beyond max_queue_depth get the busy fallback instead of queueing"""
+    service = make_service(FakeBedrockClient(delay=0.1))
+    service.max_queue_depth = 0
+
+    result = asyncio.run(service.invoke_model_with_retry("prompt"))
+
+    assert result == "AI insights temporarily unavailable - service busy"
+    assert service.get_stats()["rejected"] == 1
+    assert service.client.calls == 0
+    assert service.breaker.get_state()["errors_by_code"] == {}
+
+
+def test_timed_out_call_still_running_is_not_retried(monkeypatch):
+    monkeypatch.setattr(settings, "bedrock_deadline_seconds", 0.05)
+    monkeypatch.setattr(settings, "bedrock_retry_base_seconds", 0.001)
+    service = make_service(FakeBedrockClient(delay=0.2))
+
+    result = asyncio.run(service.invoke_model_with_retry("prompt"))
+
+    assert result == "AI insights temporarily unavailable - AI service timed out"
+    assert service.client.calls == 1
+
+
+def test_stream_model_yields_text_deltas_in_order():
+    service = make_service(FakeStreamingBedrockClient(["Save ", "₹46,800 ", "with 80C"]))
+
+    async def collect():
+        return [chunk async for chunk in service.stream_model("prompt")]
+
+    assert asyncio.run(collect()) == ["Save ", "₹46,800 ", "with 80C"]
+    assert service.get_stats()["in_flight"] == 0
+
+
+def test_generate_tax_insights_serves_repeat_profiles_from_cache():
+    insight_cache.memory.clear()
+    service = make_service(FakeBedrockClient())
+    tax_data = {"income": 1500000, "age": 30, "regime": "new", "is_salaried": True}
+    calculation_result = {"final_tax": 97500}
+
+    async def scenario():
+        first = await service.generate_tax_insights(tax_data, calculation_result)
+        second = await service.generate_tax_insights({**tax_data, "income": 1550000}, calculation_result)
+        bypassed = await service.generate_tax_insights(tax_data, calculation_result, use_cache=False)
+        return first, second, bypassed
+
+    assert asyncio.run(scenario()) == ("insight", "insight", "insight")
+    assert service.client.calls == 2
+
+
+def test_cached_insight_prompt_holds_only_band_values():
+    service = BedrockAIService()
+    base = {"income": 1810000, "age": 35, "regime": "new", "is_salaried": True}
+    neighbour = {**base, "income": 1873456, "age": 41}
+
+    prompt = service.build_tax_insights_prompt(base, {"final_tax": 158600, "rebate_87a": 0})
+
+    assert prompt == service.build_tax_insights_prompt(neighbour, {"final_tax": 175800, "rebate_87a": 0})
+    assert "1,810,000" not in prompt and "158,600" not in prompt
+    assert "₹1,800,000 to ₹1,900,000" in prompt
+
+
+def test_insight_prompt_follows_the_selected_rule_set():
+    service = BedrockAIService()
+    tax_data = {"income": 650000, "age": 35, "regime": "new", "is_salaried": True}
+
+    current = service.build_tax_insights_prompt(tax_data, {"financial_year": "2025-26", "rebate_87a": 0})
+    previous = service.build_tax_insights_prompt(tax_data, {"financial_year": "2024-25", "rebate_87a": 0})
+
+    assert "FY 2025-26" in current and "up to ₹60,000 (taxable income up to ₹1,200,000)" in current
+    assert "FY 2024-25" in previous and "up to ₹25,000 (taxable income up to ₹700,000)" in previous
+    assert "2025-26" not in previous and "60,000" not in previous
+
+
+def test_comparison_insights_are_keyed_by_deduction_band():
+    insight_cache.memory.clear()
+    service = make_service(FakeBedrockClient())
+    base = {"income": 1437000, "age": 35, "regime": "new", "is_salaried": True,
+            "deductions_80c": 150000, "health_insurance_premium": 25000}
+    same_band = {**base, "deductions_80c": 200000, "health_insurance_premium": 20000}
+    lower_band = {**base, "deductions_80c": 0, "health_insurance_premium": 0}
+
+    def comparison(tax_data):
+        return compare_regimes_fy2025(TaxCalculationInput(
+            gross_income=tax_data["income"], age=tax_data["age"], regime="new", is_salaried=True,
+            deductions_80c=tax_data["deductions_80c"],
+            health_insurance_premium=tax_data["health_insurance_premium"]
+        ))
+
+    result = comparison(base)
+    prompt = service.build_comparison_insights_prompt(base, result)
+    assert prompt == service.build_comparison_insights_prompt(same_band, comparison(same_band))
+    assert "1,437,000" not in prompt and f"{result['old_regime']['final_tax']:,.0f}" not in prompt
+    assert "₹175,000 to ₹200,000" in prompt
+
+    async def scenario():
+        for tax_data in (base, same_band, lower_band):
+            await service.generate_comparison_insights(tax_data, comparison(tax_data))
+
+    asyncio.run(scenario())
+    assert service.client.calls == 2
+
+
+def test_rebate_cliff_splits_the_income_band():
+    at_limit = {"income": 1200000, "age": 35, "regime": "new", "is_salaried": False}
+    above_limit = {**at_limit, "income": 1240000}
+
+    assert insight_cache.key_for(at_limit, rebate_eligible=True) != insight_cache.key_for(above_limit)
+
+
+def test_failed_generation_is_not_cached():
+    insight_cache.memory.clear()
+    service = make_service(None)
+    tax_data = {"income": 900000, "age": 30, "regime": "new", "is_salaried": True}
+
+    result = asyncio.run(service.generate_tax_insights(tax_data, {}))
+
+    assert result == "AI insights unavailable - AWS Bedrock not configured"
+    assert insight_cache.memory.get(insight_cache.key_for(tax_data)) is None
+
+
+def test_concurrent_identical_prompts_share_one_bedrock_call():
+    service = make_service(FakeBedrockClient(delay=0.1))
+    tax_data = {"income": 2400000, "age": 40, "regime": "new", "is_salaried": True}
+    calculation_result = {"final_tax": 300000}
+
+    async def scenario():
+        return await asyncio.gather(*[
+            service.generate_tax_insights(tax_data, calculation_result, use_cache=False)
+            for _ in range(5)
+        ])
+
+    assert asyncio.run(scenario()) == ["insight"] * 5
+    assert service.client.calls == 1
+    single_flight = service.get_stats()["single_flight"]
+    assert single_flight["coalesced"] == 4
+    assert single_flight["in_flight_prompts"] == 0
+
+
+def test_transient_errors_are_retried_with_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "bedrock_retry_base_seconds", 0.001)
+    service = make_service(FlakyBedrockClient(["ThrottlingException", "ServiceUnavailableException"]))
+
+    assert asyncio.run(service.invoke_model_with_retry("prompt")) == "insight"
+    assert service.client.calls == 3
+
+
+def test_bedrock_calls_update_usage_metrics(monkeypatch):
+    monkeypatch.setattr(settings, "bedrock_retry_base_seconds", 0.001)
+    service = make_service(FlakyBedrockClient(["ThrottlingException"]))
+    before = (bedrock_calls.value(api="invoke"), bedrock_errors.value(code="ThrottlingException"),
+              bedrock_tokens.value(direction="input"), bedrock_tokens.value(direction="output"),
+              stage_duration.count(stage="bedrock_call"))
+
+    assert asyncio.run(service.invoke_model_with_retry("prompt")) == "insight"
+
+    after = (bedrock_calls.value(api="invoke"), bedrock_errors.value(code="ThrottlingException"),
+             bedrock_tokens.value(direction="input"), bedrock_tokens.value(direction="output"),
+             stage_duration.count(stage="bedrock_call"))
+    # Both round trips are timed; only the successful one reports usage
+    assert [b - a for a, b in zip(before, after)] == [2, 1, 120, 30, 2]
+
+
+def test_open_circuit_serves_fast_fallback_insights(monkeypatch):
+    monkeypatch.setattr(settings, "bedrock_max_attempts", 1)
+    insight_cache.memory.clear()
+    service = make_service(FlakyBedrockClient(["AccessDeniedException"] * 10))
+    service.breaker.min_calls = 2
+    tax_data = {"income": 1500000, "age": 30, "regime": "old", "deductions_80c": 50000}
+    calculation_result = {"final_tax": 200000, "effective_rate": 13.33}
+
+    async def scenario():
+        return [
+            await service.generate_tax_insights(tax_data, calculation_result, use_cache=False)
+            for _ in range(3)
+        ]
+
+    first, second, third = asyncio.run(scenario())
+
+    assert first == "AI insights unavailable - insufficient AWS permissions"
+    assert service.breaker.state == "open"
+    assert third.startswith("Personalized AI insights are temporarily unavailable")
+    assert "₹100,000 under Section 80C" in third
+    assert service.client.calls == 2
+
+
+def test_client_is_built_on_first_use_only(monkeypatch):
+    service = BedrockAIService()
+    assert service.status() == "not_initialized"
+
+    monkeypatch.setattr(settings, "service_mode", "calculation")
+    disabled = BedrockAIService()
+    assert disabled.status() == "disabled"
+    assert disabled.is_available() is False
+    assert disabled.client_init_ms is None
+
+
+def test_async_paths_build_the_client_off_the_event_loop(monkeypatch):
+    service = BedrockAIService()
+    init_threads = []
+
+    def fake_initialize():
+        init_threads.append(threading.get_ident())
+        service.client = FakeBedrockClient()
+
+    monkeypatch.setattr(service, "_initialize_client", fake_initialize)
+    assert service.is_available() is False
+    assert init_threads == []
+
+    async def scenario():
+        text = await service.invoke_model_with_retry("prompt")
+        return text, threading.get_ident()
+
+    text, loop_thread = asyncio.run(scenario())
+
+    assert text == "insight"
+    assert len(init_threads) == 1 and init_threads[0] != loop_thread
+    assert service.is_available() is True
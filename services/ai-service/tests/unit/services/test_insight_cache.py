@@ -0,0 +1,71 @@
+"""Unit tests for the profile-keyed insight cache"""
+import asyncio
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
+
+from app.agents.tax_calculator.rules import rule_registry
+from app.services.insight_cache import InsightCache, MemoryInsightCache
+
+
+def make_cache(**overrides) -> InsightCache:
+    options = dict(enabled=True, max_entries=100, ttl_seconds=60, income_band=100000)
+    options.update(overrides)
+    return InsightCache(**options)
+
+
+def test_key_canonicalizes_profile_into_bands():
+    cache = make_cache()
+    base = {"income": 1810000, "age": 35, "regime": "NEW", "is_salaried": True}
+
+    assert cache.key_for(base) == cache.key_for({**base, "income": 1899999, "age": 59, "regime": "new"})
+    assert cache.key_for(base) != cache.key_for({**base, "income": 1900000})
+    assert cache.key_for(base) != cache.key_for({**base, "age": 60})
+    assert cache.key_for(base) != cache.key_for({**base, "is_salaried": False})
+
+
+def test_key_holds_the_resolved_financial_year():
+    cache = make_cache()
+    base = {"income": 1810000, "age": 35, "regime": "new", "is_salaried": True}
+
+    assert cache.key_for(base) == cache.key_for(base, rule_registry.default_year)
+    assert cache.key_for(base, "2024-25") != cache.key_for(base, "2025-26")
+    assert cache.key_for({**base, "financial_year": "2024-25"}) == cache.key_for(base, "2024-25")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    memory = MemoryInsightCache(max_entries=2, ttl_seconds=60)
+    memory.set("a", "1")
+    memory.set("b", "2")
+    memory.get("a")
+    memory.set("c", "3")
+
+    assert memory.get("a") == "1"
+    assert memory.get("b") is None
+    assert memory.get("c") == "3"
+
+
+def test_memory_tier_expires_entries():
+    memory = MemoryInsightCache(max_entries=2, ttl_seconds=0)
+    memory.set("a", "1")
+
+    assert memory.get("a") is None
+    assert len(memory) == 0
+
+
+def test_hit_and_miss_counters():
+    cache = make_cache()
+
+    async def scenario():
+        assert await cache.get("k") is None
+        await cache.set("k", "insight")
+        assert await cache.get("k") == "insight"
+
+    asyncio.run(scenario())
+
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,48 @@
+"""Unit tests for the Bedrock circuit breaker"""
+import sys
+import os
+import time
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
+
+from app.services.resilience import CircuitBreaker
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    options = dict(window_size=10, min_calls=4, failure_rate=0.5, open_seconds=60)
+    options.update(overrides)
+    return CircuitBreaker(**options)
+
+
+def test_opens_once_failure_rate_reached():
+    breaker = make_breaker()
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure("ThrottlingException")
+    assert breaker.state == "closed"
+
+    breaker.record_failure("ThrottlingException")
+
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+    state = breaker.get_state()
+    assert state["errors_by_code"] == {"ThrottlingException": 2}
+    assert state["short_circuited_calls"] == 1
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker = make_breaker(min_calls=1, open_seconds=0.01)
+    breaker.record_failure("ServiceUnavailableException")
+    time.sleep(0.02)
+
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False  # only one probe at a time
+    breaker.record_failure("ServiceUnavailableException")
+    assert breaker.state == "open"
+
+    time.sleep(0.02)
+    assert breaker.allow_request() is True
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -0,0 +1,50 @@
+"""Benchmark suite: result shape and baseline comparison"""
+import json
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+
+from benchmarks import suite
+from app.services.ai_service import ai_service
+
+
+def test_suite_runs_every_group_with_stubbed_bedrock():
+    client_before = ai_service._client, ai_service._client_ready
+    result = suite.run_suite(profiles=20, rounds=2, min_round_seconds=0.001, requests=20, concurrency=4)
+
+    names = [benchmark["name"] for benchmark in result["benchmarks"]]
+    assert {name.split(".")[0] for name in names} == set(suite.GROUPS)
+    http = [benchmark for benchmark in result["benchmarks"] if benchmark["group"] == "http"]
+    assert all(benchmark["statuses"] == {"200": 20} for benchmark in http)
+    assert all(benchmark["min"] <= benchmark["median"] <= benchmark["p95"] for benchmark in result["benchmarks"])
+    assert (ai_service._client, ai_service._client_ready) == client_before
+    json.dumps(result)
+
+
+def test_sample_profiles_are_reproducible():
+    assert suite.sample_profiles(50, seed=7) == suite.sample_profiles(50, seed=7)
+    assert suite.sample_profiles(50, seed=7) != suite.sample_profiles(50, seed=8)
+
+
+def test_compare_flags_slowdowns_beyond_threshold(tmp_path):
+    def run(medians):
+        return {"benchmarks": [{"name": name, "unit": "us", "median": median} for name, median in medians.items()]}
+
+    baseline = run({"fy2025.new_regime": 4.0, "legacy.new_regime_tax": 1.0, "removed": 2.0})
+    current = run({"fy2025.new_regime": 5.0, "legacy.new_regime_tax": 1.1, "added": 3.0})
+
+    comparison = suite.compare_results(current, baseline, threshold=0.15)
+
+    assert [(entry["name"], entry["change"], entry["regression"]) for entry in comparison] == [
+        ("fy2025.new_regime", 0.25, True),
+        ("legacy.new_regime_tax", 0.1, False)
+    ]
+
+    baseline_path, output_path = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline_path.write_text(json.dumps(run({"legacy.new_regime_tax": 1e-6})))
+    status = suite.main(["--groups", "legacy", "--rounds", "1", "--min-round-seconds", "0.001",
+                         "--baseline", str(baseline_path), "--output", str(output_path)])
+    assert status == 1
+    assert json.loads(output_path.read_text())["comparison"][0]["regression"] is True
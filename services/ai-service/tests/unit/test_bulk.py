@@ -0,0 +1,69 @@
+"""Bulk CLI: streaming CSV/JSONL calculation with resumable checkpoints"""
+import json
+import sys
+import os
+
+import pytest
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+
+from app import bulk
+from app.agents.tax_calculator.calculator_fy2025 import calculate_tax_fy2025, TaxCalculationInput
+
+
+def write_csv(path, count):
+    with open(path, "w") as handle:
+        handle.write("income,age,regime,is_salaried,deductions_80c,financial_year\n")
+        for index in range(count):
+            income = 0 if index == 7 else 300000 + index * 25000
+            financial_year = "2024-25" if index % 2 else ""
+            handle.write(f"{income},35,{'new' if index % 3 else 'old'},true,50000,{financial_year}\n")
+
+
+def test_csv_results_match_calculator(tmp_path):
+    source, target = tmp_path / "payroll.csv", tmp_path / "results.jsonl"
+    write_csv(source, 25)
+
+    summary = bulk.run_bulk(str(source), str(target), chunk_size=4)
+
+    assert summary["records_done"] == 25
+    assert summary["failed"] == 1
+    rows = [json.loads(line) for line in target.read_text().splitlines()]
+    assert [row["index"] for row in rows] == [index for index in range(25) if index != 7]
+    expected = calculate_tax_fy2025(TaxCalculationInput(
+        gross_income=300000 + 3 * 25000, age=35, regime="old",
+        deductions_80c=50000, financial_year="2024-25"
+    ))
+    assert rows[3]["final_tax"] == expected["final_tax"]
+
+    errors = [json.loads(line) for line in open(f"{target}.errors.jsonl")]
+    assert errors[0]["index"] == 7
+
+
+def test_resume_continues_from_checkpoint(tmp_path, monkeypatch):
+    source = tmp_path / "payroll.csv"
+    write_csv(source, 40)
+    bulk.run_bulk(str(source), str(tmp_path / "full.csv"), chunk_size=5)
+
+    process_chunk = bulk.process_chunk
+
+    def crash_at_20(start, records, engine):
+        if start == 20:
+            raise RuntimeError("worker died")
+        return process_chunk(start, records, engine)
+
+    target = tmp_path / "resumed.csv"
+    monkeypatch.setattr(bulk, "process_chunk", crash_at_20)
+    with pytest.raises(RuntimeError):
+        bulk.run_bulk(str(source), str(target), chunk_size=5)
+    monkeypatch.setattr(bulk, "process_chunk", process_chunk)
+
+    # Output written after the last checkpoint is discarded on resume
+    with open(target, "ab") as handle:
+        handle.write(b"torn,row")
+    summary = bulk.run_bulk(str(source), str(target), chunk_size=5, resume=True)
+
+    assert summary["resumed_from"] == 20
+    assert summary["completed"] is True
+    assert target.read_bytes() == (tmp_path / "full.csv").read_bytes()